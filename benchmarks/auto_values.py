@@ -0,0 +1,34 @@
+"""Measures how long it takes to generate values for large enumerations.
+
+Run with `python -m benchmarks.auto_values`.
+"""
+
+from time import perf_counter
+
+from enum_extensions import Enum, auto
+
+MEMBERS = 20_000
+
+NAME = "MEMBER_{}"
+
+NAMES = tuple(map(NAME.format, range(MEMBERS)))
+
+RESULT = "{:<10} {:>8.2f} ms per {} members"
+
+
+def main() -> None:
+    start = perf_counter()
+
+    Enum.create("ByNames", NAMES, module=__name__)
+
+    print(RESULT.format("names", (perf_counter() - start) * 1000, MEMBERS))
+
+    start = perf_counter()
+
+    Enum.create("ByAuto", {name: auto() for name in NAMES}, module=__name__)
+
+    print(RESULT.format("auto", (perf_counter() - start) * 1000, MEMBERS))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Compares building large enumerations via `create` and via streaming `build`.
+
+Run with `python -m benchmarks.bulk_build`.
+"""
+
+from time import perf_counter
+from typing import Iterator, Tuple
+
+from enum_extensions import Enum
+
+MEMBERS = 100_000
+
+NAME = "PRODUCT_{}"
+
+RESULT = "{:<10} {:>8.2f} ms per {} members"
+
+
+def iter_pairs() -> Iterator[Tuple[str, int]]:
+    for value in range(MEMBERS):
+        yield (NAME.format(value), value)
+
+
+def main() -> None:
+    start = perf_counter()
+
+    Enum.create("Created", iter_pairs(), module=__name__)
+
+    print(RESULT.format("create", (perf_counter() - start) * 1000, MEMBERS))
+
+    start = perf_counter()
+
+    Enum.build("Built", iter_pairs(), module=__name__)
+
+    print(RESULT.format("build", (perf_counter() - start) * 1000, MEMBERS))
+
+
+if __name__ == "__main__":
+    main()
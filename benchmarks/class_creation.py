@@ -0,0 +1,38 @@
+"""Measures how long it takes to define enumerations.
+
+Run with `python -m benchmarks.class_creation`.
+"""
+
+from timeit import repeat
+from typing import Type
+
+from enum_extensions import Enum, Flag, IntEnum
+
+ENUMS = 400
+MEMBERS = 10
+
+REPEAT = 5
+
+NAME = "MEMBER_{}"
+ENUM_NAME = "Generated{}"
+
+NAMES = tuple(map(NAME.format, range(MEMBERS)))
+
+
+def define_enums(base: Type[Enum]) -> None:
+    for index in range(ENUMS):
+        base.create(ENUM_NAME.format(index), NAMES, module=__name__)
+
+
+RESULT = "{:<10} {:>8.2f} ms per {} enums ({} members each)"
+
+
+def main() -> None:
+    for base in (Enum, IntEnum, Flag):
+        best = min(repeat(lambda: define_enums(base), number=1, repeat=REPEAT))
+
+        print(RESULT.format(base.__name__, best * 1000, ENUMS, MEMBERS))
+
+
+if __name__ == "__main__":
+    main()
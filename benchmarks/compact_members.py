@@ -0,0 +1,72 @@
+"""Compares memory used by members of regular and compact enumerations.
+
+Run with `python -m benchmarks.compact_members`.
+"""
+
+from gc import collect
+from tracemalloc import get_traced_memory, start, stop
+
+from enum_extensions import Enum, Flag
+
+MEMBERS = 100_000
+FLAGS = 16
+
+NAME = "CODE_{}"
+
+PAIRS = tuple((NAME.format(value), value) for value in range(MEMBERS))
+FLAG_NAMES = tuple(NAME.format(value) for value in range(FLAGS))
+
+RESULT = "{:<10} {:<8} {:>8.2f} MiB per {} members"
+
+MEBIBYTE = 1 << 20
+
+
+def measure_enum(compact: bool) -> int:
+    collect()
+
+    start()
+
+    enum = Enum.build("Codes", PAIRS, module=__name__, compact=compact)
+
+    current, _ = get_traced_memory()
+
+    stop()
+
+    del enum
+
+    return current
+
+
+def measure_flag(compact: bool) -> int:
+    collect()
+
+    flag = Flag.build("Bits", FLAG_NAMES, module=__name__, compact=compact)
+
+    start()
+
+    for value in range(MEMBERS):  # composite (pseudo) members are cached
+        flag(value & ((1 << FLAGS) - 1))
+
+    current, _ = get_traced_memory()
+
+    stop()
+
+    del flag
+
+    return current
+
+
+def main() -> None:
+    for compact in (False, True):
+        layout = "compact" if compact else "regular"
+
+        print(RESULT.format("enum", layout, measure_enum(compact) / MEBIBYTE, MEMBERS))
+
+    for compact in (False, True):
+        layout = "compact" if compact else "regular"
+
+        print(RESULT.format("flag", layout, measure_flag(compact) / MEBIBYTE, 1 << FLAGS))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Compares lists of members against `EnumArray` in size and pickling time.
+
+Run with `python -m benchmarks.enum_arrays`.
+"""
+
+from pickle import HIGHEST_PROTOCOL, dumps
+from sys import getsizeof
+from timeit import repeat
+
+from enum_extensions import Enum, EnumArray
+
+MEMBERS = 1000
+ITEMS = 1_000_000
+
+REPEAT = 3
+
+NAME = "CODE_{}"
+
+Code = Enum.build(
+    "Code",
+    (NAME.format(value) for value in range(MEMBERS)),
+    module=__name__,
+    qualified_name="Code",
+)
+
+CODES = list(Code)
+
+RESULT = "{:<10} {:>8.2f} MiB in memory, {:>8.2f} MiB pickled in {:>8.2f} ms"
+
+MEBIBYTE = 1 << 20
+
+
+def measure(name: str, items: object, size: int) -> None:
+    best = min(repeat(lambda: dumps(items, HIGHEST_PROTOCOL), number=1, repeat=REPEAT))
+
+    pickled = len(dumps(items, HIGHEST_PROTOCOL))
+
+    print(RESULT.format(name, size / MEBIBYTE, pickled / MEBIBYTE, best * 1000))
+
+
+def main() -> None:
+    items = [CODES[index % MEMBERS] for index in range(ITEMS)]
+
+    measure("list", items, getsizeof(items))
+
+    array = EnumArray(Code, items)
+
+    measure("EnumArray", array, getsizeof(array.ordinals))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Compares looking up members in `dict` and `set` against `EnumMap` and `EnumSet`.
+
+Run with `python -m benchmarks.enum_containers`.
+"""
+
+from timeit import repeat
+
+from enum_extensions import Enum, EnumMap, EnumSet
+
+MEMBERS = 64
+LOOKUPS = 100_000
+
+REPEAT = 5
+
+NAME = "STATE_{}"
+
+State = Enum.build("State", (NAME.format(value) for value in range(MEMBERS)), module=__name__)
+
+STATES = list(State)
+
+KEYS = [STATES[index % MEMBERS] for index in range(LOOKUPS)]
+
+RESULT = "{:<10} {:>8.2f} ms per {} lookups"
+
+
+def lookup(container: object) -> None:
+    for key in KEYS:
+        key in container  # type: ignore
+
+
+def get(mapping: object) -> None:
+    for key in KEYS:
+        mapping[key]  # type: ignore
+
+
+def measure(name: str, function: object, container: object) -> None:
+    best = min(repeat(lambda: function(container), number=1, repeat=REPEAT))  # type: ignore
+
+    print(RESULT.format(name, best * 1000, LOOKUPS))
+
+
+def main() -> None:
+    even = STATES[::2]
+
+    measure("set", lookup, set(even))
+    measure("EnumSet", lookup, EnumSet(State, even))
+
+    items = [(state, index) for index, state in enumerate(STATES)]
+
+    measure("dict", get, dict(items))
+    measure("EnumMap", get, EnumMap(State, items))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Compares counting members with `Counter` against `EnumCounter`.
+
+Run with `python -m benchmarks.enum_counters`.
+"""
+
+from collections import Counter
+from timeit import repeat
+
+from enum_extensions import Enum, EnumCounter
+
+MEMBERS = 64
+EVENTS = 1_000_000
+
+REPEAT = 5
+
+NAME = "EVENT_{}"
+
+Event = Enum.build("Event", (NAME.format(value) for value in range(MEMBERS)), module=__name__)
+
+MEMBERS_LIST = list(Event)
+
+EVENTS_LIST = [MEMBERS_LIST[index * 7 % MEMBERS] for index in range(EVENTS)]
+
+RESULT = "{:<28} {:>8.2f} ms per {} events"
+
+
+def add_counter() -> None:
+    counter: Counter[Event] = Counter()
+
+    for event in EVENTS_LIST:
+        counter[event] += 1
+
+
+def add_enum_counter() -> None:
+    counter = EnumCounter(Event)
+
+    add = counter.add
+
+    for event in EVENTS_LIST:
+        add(event)
+
+
+def update_counter() -> None:
+    Counter(EVENTS_LIST)
+
+
+def update_enum_counter() -> None:
+    EnumCounter(Event).add_many(EVENTS_LIST)
+
+
+def measure(name: str, function: object) -> None:
+    best = min(repeat(function, number=1, repeat=REPEAT))  # type: ignore
+
+    print(RESULT.format(name, best * 1000, EVENTS))
+
+
+def main() -> None:
+    measure("Counter[member] += 1", add_counter)
+    measure("EnumCounter.add", add_enum_counter)
+    measure("Counter(members)", update_counter)
+    measure("EnumCounter.add_many", update_enum_counter)
+
+
+if __name__ == "__main__":
+    main()
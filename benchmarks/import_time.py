@@ -0,0 +1,53 @@
+"""Measures how long it takes to import the package, using `-X importtime`.
+
+Run with `python -m benchmarks.import_time`.
+"""
+
+from subprocess import run
+from sys import executable
+
+STATEMENTS = (
+    "import enum_extensions",
+    "from enum_extensions import Enum",
+    "from enum_extensions.flags import Flag",  # `-X importtime` does not see `import_module`
+)
+
+PACKAGE = "enum_extensions"
+
+SEPARATOR = "|"
+
+TOP_LEVEL = " " + PACKAGE
+
+RESULT = "{:<40} {:>8.2f} ms, {} modules"
+
+
+def measure(statement: str) -> None:
+    result = run(
+        [executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    total = 0
+    count = 0
+
+    for line in result.stderr.splitlines()[1:]:  # skip the header
+        _, cumulative_time, name = line.split(SEPARATOR)
+
+        if name.strip().startswith(PACKAGE):
+            count += 1
+
+            if name.startswith(TOP_LEVEL):  # cumulative time of top-level imports covers the rest
+                total += int(cumulative_time)
+
+    print(RESULT.format(statement, total / 1000, count))
+
+
+def main() -> None:
+    for statement in STATEMENTS:
+        measure(statement)
+
+
+if __name__ == "__main__":
+    main()
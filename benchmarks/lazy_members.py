@@ -0,0 +1,37 @@
+"""Compares creating large enumerations eagerly and lazily, touching only a few members.
+
+Run with `python -m benchmarks.lazy_members`.
+"""
+
+from time import perf_counter
+
+from enum_extensions import Enum
+
+MEMBERS = 50_000
+ACCESSED = 300
+
+NAME = "CODE_{}"
+
+PAIRS = tuple((NAME.format(value), value) for value in range(MEMBERS))
+
+RESULT = "{:<10} {:>8.2f} ms per {} members, {} accessed"
+
+
+def main() -> None:
+    for lazy in (False, True):
+        start = perf_counter()
+
+        enum = Enum.build("Codes", PAIRS, module=__name__, lazy=lazy)
+
+        for value in range(0, MEMBERS, MEMBERS // ACCESSED):
+            enum(value)
+
+        result = RESULT.format(
+            "lazy" if lazy else "eager", (perf_counter() - start) * 1000, MEMBERS, ACCESSED
+        )
+
+        print(result)
+
+
+if __name__ == "__main__":
+    main()
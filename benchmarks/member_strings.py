@@ -0,0 +1,80 @@
+"""Measures the throughput of rendering members, both directly and via `logging`.
+
+Run with `python -m benchmarks.member_strings`.
+"""
+
+from io import StringIO
+from logging import INFO, Formatter, StreamHandler, getLogger
+from timeit import repeat
+
+from enum_extensions import Enum
+
+MEMBERS = 64
+CALLS = 100_000
+
+REPEAT = 5
+
+NAME = "EVENT_{}"
+
+LOGGER_NAME = "benchmarks.member_strings"
+MESSAGE = "event=%s"
+FORMAT = "%(message)s"
+
+Event = Enum.build("Event", (NAME.format(value) for value in range(MEMBERS)), module=__name__)
+
+EVENTS = [list(Event)[index % MEMBERS] for index in range(CALLS)]
+
+RESULT = "{:<10} {:>8.2f} ms per {} calls ({:.0f} per second)"
+
+
+def render_string() -> None:
+    for event in EVENTS:
+        str(event)
+
+
+def render_representation() -> None:
+    for event in EVENTS:
+        repr(event)
+
+
+def render_format() -> None:
+    for event in EVENTS:
+        f"{event}"
+
+
+def create_logger() -> object:
+    logger = getLogger(LOGGER_NAME)
+
+    logger.propagate = False
+    logger.setLevel(INFO)
+
+    handler = StreamHandler(StringIO())
+    handler.setFormatter(Formatter(FORMAT))
+
+    logger.handlers = [handler]
+
+    return logger
+
+
+def log() -> None:
+    info = create_logger().info  # type: ignore
+
+    for event in EVENTS:
+        info(MESSAGE, event)
+
+
+def measure(name: str, function: object) -> None:
+    best = min(repeat(function, number=1, repeat=REPEAT))  # type: ignore
+
+    print(RESULT.format(name, best * 1000, CALLS, CALLS / best))
+
+
+def main() -> None:
+    measure("str", render_string)
+    measure("repr", render_representation)
+    measure("format", render_format)
+    measure("logging", log)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Compares creating large enumerations from their sources and restoring them from snapshots.
+
+Each measurement is taken in a fresh interpreter, so that the results reflect cold starts.
+
+Run with `python -m benchmarks.snapshots`.
+"""
+
+from pathlib import Path
+from subprocess import run
+from sys import executable
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+MEMBERS = 100_000
+
+ROW = "PRODUCT_{0}\t{0}\n"
+
+SOURCE = "products.tsv"
+SNAPSHOT = "products.snapshot"
+
+SCRIPT = """
+from enum_extensions import IntEnum, cached_enum, fingerprint
+from enum_extensions.constants import TAB
+
+Product = cached_enum(
+    {snapshot!r},
+    fingerprint({source!r}),
+    lambda: IntEnum.load("Product", {source!r}, delimiter=TAB, convert=int),
+)
+
+assert len(Product) == {members}
+"""
+
+RESULT = "{:<10} {:>8.2f} ms per {} members"
+
+
+def measure(script: str) -> float:
+    start = perf_counter()
+
+    run([executable, "-c", script], check=True)
+
+    return (perf_counter() - start) * 1000
+
+
+def main() -> None:
+    with TemporaryDirectory() as directory_name:
+        directory = Path(directory_name)
+
+        source = directory / SOURCE
+        snapshot = directory / SNAPSHOT
+
+        source.write_text("".join(map(ROW.format, range(MEMBERS))))
+
+        script = SCRIPT.format(snapshot=str(snapshot), source=str(source), members=MEMBERS)
+
+        print(RESULT.format("source", measure(script), MEMBERS))  # creates the snapshot
+        print(RESULT.format("snapshot", measure(script), MEMBERS))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Measures how long it takes to define many small enumerations derived from trait-heavy bases.
+
+Run with `python -m benchmarks.trait_bases`.
+"""
+
+from timeit import repeat
+
+from enum_extensions import Format, IntEnum, Order, Title
+from enum_extensions.enums import DYNAMIC_ATTRIBUTES
+
+ENUMS = 1000
+MEMBERS = 3
+
+REPEAT = 5
+
+NAME = "MEMBER_{}"
+ENUM_NAME = "Generated{}"
+
+NAMES = tuple(map(NAME.format, range(MEMBERS)))
+
+
+class Base(Format, Order, Title, IntEnum):
+    def describe(self) -> str:
+        return self.title_name
+
+
+class Derived(Base):
+    pass
+
+
+def define_enums(clear: bool) -> None:
+    for index in range(ENUMS):
+        if clear:  # simulate discovering dynamic attributes from scratch
+            DYNAMIC_ATTRIBUTES.clear()
+
+        Derived.create(ENUM_NAME.format(index), NAMES, module=__name__)
+
+
+RESULT = "{:<10} {:>8.2f} ms per {} enums ({} members each)"
+
+
+def main() -> None:
+    for clear in (True, False):
+        best = min(repeat(lambda: define_enums(clear), number=1, repeat=REPEAT))
+
+        print(RESULT.format("uncached" if clear else "cached", best * 1000, ENUMS, MEMBERS))
+
+
+if __name__ == "__main__":
+    main()
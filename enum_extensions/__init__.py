@@ -41,37 +41,60 @@ __author__ = "nekitdev"
 __license__ = "MIT"
 __version__ = "0.1.1"
 
+from builtins import getattr as get_attribute
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
 from enum_extensions.auto import Auto, auto, is_auto
 from enum_extensions.enums import (
+    EPHEMERAL,
+    REGISTER,
     Enum,
     EnumType,
     IntEnum,
     StrEnum,
     StringEnum,
+    UnknownPolicy,
+    clear_enum_cache,
+    copy_values,
     enum_generate_next_value,
     is_enum,
     is_enum_member,
-)
-from enum_extensions.flags import (
-    CONFORM,
-    KEEP,
-    STRICT,
-    Flag,
-    FlagBoundary,
-    FlagType,
-    IntFlag,
-    is_flag,
-    is_flag_member,
+    memory_reports,
 )
 from enum_extensions.members import Member, NonMember, is_member, is_non_member, member, non_member
-from enum_extensions.traits import Format, Order, Title, Trait
+from enum_extensions.memory import MemoryReport
+from enum_extensions.string import tick
 from enum_extensions.unique import unique
 
+if TYPE_CHECKING:
+    from enum_extensions.aggregators import FlagAggregator
+    from enum_extensions.arrays import EnumArray
+    from enum_extensions.counters import EnumCounter
+    from enum_extensions.flags import (
+        CONFORM,
+        KEEP,
+        STRICT,
+        Flag,
+        FlagBoundary,
+        FlagType,
+        FlagValidation,
+        IntFlag,
+        is_flag,
+        is_flag_member,
+    )
+    from enum_extensions.maps import EnumMap
+    from enum_extensions.sets import EnumSet
+    from enum_extensions.snapshots import EnumSnapshot, cached_enum, fingerprint
+    from enum_extensions.traits import Format, Order, Title, Trait
+
 __all__ = (
     "Auto",
     "auto",
     "is_auto",
     "enum_generate_next_value",
+    "copy_values",
+    "clear_enum_cache",
     "EnumType",
     "Enum",
     "IntEnum",
@@ -79,15 +102,29 @@ __all__ = (
     "StrEnum",
     "is_enum",
     "is_enum_member",
+    "REGISTER",
+    "EPHEMERAL",
+    "UnknownPolicy",
     "STRICT",
     "CONFORM",
     "KEEP",
     "FlagBoundary",
     "FlagType",
+    "FlagValidation",
     "Flag",
     "IntFlag",
     "is_flag",
     "is_flag_member",
+    "FlagAggregator",
+    "EnumSet",
+    "EnumMap",
+    "EnumArray",
+    "EnumCounter",
+    "EnumSnapshot",
+    "cached_enum",
+    "fingerprint",
+    "MemoryReport",
+    "memory_reports",
     "Member",
     "NonMember",
     "member",
@@ -100,3 +137,50 @@ __all__ = (
     "Trait",
     "unique",
 )
+
+# these are only imported on first use, see `__getattr__` below
+MODULES = {
+    "STRICT": "flags",
+    "CONFORM": "flags",
+    "KEEP": "flags",
+    "FlagBoundary": "flags",
+    "FlagType": "flags",
+    "FlagValidation": "flags",
+    "Flag": "flags",
+    "IntFlag": "flags",
+    "is_flag": "flags",
+    "is_flag_member": "flags",
+    "FlagAggregator": "aggregators",
+    "EnumSet": "sets",
+    "EnumMap": "maps",
+    "EnumArray": "arrays",
+    "EnumCounter": "counters",
+    "EnumSnapshot": "snapshots",
+    "cached_enum": "snapshots",
+    "fingerprint": "snapshots",
+    "Format": "traits",
+    "Order": "traits",
+    "Title": "traits",
+    "Trait": "traits",
+}
+
+MODULE_NAME = "{}.{}"
+
+NO_ATTRIBUTE = "module {} has no attribute {}"
+
+
+def __getattr__(name: str) -> Any:
+    module_name = MODULES.get(name)
+
+    if module_name is None:
+        raise AttributeError(NO_ATTRIBUTE.format(tick(__name__), tick(name)))
+
+    value = get_attribute(import_module(MODULE_NAME.format(__name__, module_name)), name)
+
+    globals()[name] = value  # cache the attribute so that this function is not called again
+
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
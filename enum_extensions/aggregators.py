@@ -0,0 +1,280 @@
+from builtins import isinstance as is_instance
+from heapq import nlargest
+from typing import Any, Dict, Generic, Iterable, List, Optional, Tuple, Type, TypeVar, Union
+
+from enum_extensions.bits import iter_bits
+from enum_extensions.flags import Flag
+from enum_extensions.string import tick
+from enum_extensions.typing import get_name
+
+__all__ = ("FlagAggregator",)
+
+F = TypeVar("F", bound=Flag)
+
+A = TypeVar("A", bound="FlagAggregator[Any]")
+
+FlagData = Union[int, F]
+
+CAN_NOT_MERGE = "can not merge {} aggregator with {} aggregator"
+
+
+class FlagAggregator(Generic[F]):
+    """Aggregates streams of [`Flag`][enum_extensions.flags.Flag] values.
+
+    Every update is constant time: values are counted as raw integers,
+    and per-member bit counts are derived from these counts only when requested.
+
+    Example:
+        ```python
+        aggregator = FlagAggregator(Permission)
+
+        aggregator.add_many([Permission.R | Permission.W, Permission.R, 1])
+
+        bit_counts = aggregator.bit_counts()  # {<Permission.X: 1>: 1, ..., <Permission.R: 4>: 2}
+        union = aggregator.union()  # <Permission.X|W|R: 7>
+        ```
+
+    Aggregators of the same flag type can be merged, which allows to aggregate shards in parallel.
+    """
+
+    def __init__(self, flag_type: Type[F], values: Iterable[FlagData[F]] = ()) -> None:
+        self._flag_type = flag_type
+
+        self._counts: Dict[int, int] = {}
+
+        self._total = 0
+
+        self._or_mask = 0
+        self._and_mask = ~0
+
+        self.add_many(values)
+
+    @property
+    def flag_type(self) -> Type[F]:
+        """The [`Flag`][enum_extensions.flags.Flag] type values of which are aggregated."""
+        return self._flag_type
+
+    @property
+    def total(self) -> int:
+        """The total amount of values aggregated."""
+        return self._total
+
+    @property
+    def or_mask(self) -> int:
+        """The running *OR* of all values aggregated (`0` if none were)."""
+        return self._or_mask
+
+    @property
+    def and_mask(self) -> int:
+        """The running *AND* of all values aggregated (`0` if none were)."""
+        return self._and_mask if self._total else 0
+
+    def union(self) -> F:
+        """Returns the [`Flag`][enum_extensions.flags.Flag] member of the running *OR* mask.
+
+        Returns:
+            The *OR* of all values aggregated.
+        """
+        return self._flag_type(self.or_mask)
+
+    def intersection(self) -> F:
+        """Returns the [`Flag`][enum_extensions.flags.Flag] member of the running *AND* mask.
+
+        Returns:
+            The *AND* of all values aggregated.
+        """
+        return self._flag_type(self.and_mask)
+
+    def value_of(self, data: FlagData[F]) -> int:
+        """Returns the raw value of the `data`, checking that it belongs to the flag type.
+
+        Raw values are handled according to the
+        [`FlagBoundary`][enum_extensions.flags.FlagBoundary] of the flag type.
+
+        Arguments:
+            data: The member or the raw value.
+
+        Raises:
+            TypeError: `data` is the member of another type.
+            ValueError: `data` is invalid according to the boundary of the flag type.
+
+        Returns:
+            The raw value.
+        """
+        return self._flag_type._value_of(data)
+
+    def add(self, data: FlagData[F], count: int = 1) -> None:
+        """Adds the member or the raw value to the aggregation.
+
+        Arguments:
+            data: The member or the value to add.
+            count: How many times to add the value.
+
+        Raises:
+            TypeError: `data` is the member of another type.
+            ValueError: `data` is invalid according to the boundary of the flag type.
+        """
+        value = self.value_of(data)
+
+        counts = self._counts
+
+        counts[value] = counts.get(value, 0) + count
+
+        self._total += count
+
+        self._or_mask |= value
+        self._and_mask &= value
+
+    def add_many(self, iterable: Iterable[FlagData[F]]) -> None:
+        """Adds members or raw values from the `iterable` to the aggregation.
+
+        Arguments:
+            iterable: The members or the values to add.
+
+        Raises:
+            TypeError: Some item is the member of another type.
+            ValueError: Some item is invalid according to the boundary of the flag type.
+        """
+        value_of = self.value_of
+
+        counts = self._counts
+        get_count = counts.get
+
+        total = self._total
+
+        or_mask = self._or_mask
+        and_mask = self._and_mask
+
+        try:
+            for data in iterable:
+                value = value_of(data)
+
+                counts[value] = get_count(value, 0) + 1
+
+                total += 1
+
+                or_mask |= value
+                and_mask &= value
+
+        finally:
+            self._total = total
+
+            self._or_mask = or_mask
+            self._and_mask = and_mask
+
+    def value_counts(self) -> Dict[int, int]:
+        """Returns the `value -> count` mapping of all values aggregated.
+
+        Returns:
+            The copy of raw value counts.
+        """
+        return self._counts.copy()
+
+    def raw_bit_counts(self) -> Dict[int, int]:
+        """Returns the `bit -> count` mapping of single-bit values,
+        including bits not covered by the flag members.
+
+        Returns:
+            The raw bit counts.
+        """
+        bit_counts: Dict[int, int] = {}
+
+        get_count = bit_counts.get
+
+        for value, count in self._counts.items():
+            for bit in iter_bits(value):
+                bit_counts[bit] = get_count(bit, 0) + count
+
+        return bit_counts
+
+    def bit_counts(self) -> Dict[F, int]:
+        """Returns the `member -> count` mapping of single-bit
+        [`Flag`][enum_extensions.flags.Flag] members, in the iteration order of the flag.
+
+        Returns:
+            The counts of single-bit members.
+        """
+        raw_bit_counts = self.raw_bit_counts()
+
+        return {member: raw_bit_counts.get(member.__enum_value__, 0) for member in self._flag_type}
+
+    def most_common(self, count: Optional[int] = None) -> List[Tuple[F, int]]:
+        """Returns the most common combinations and their counts, from the most common to the least.
+
+        Only the returned values are resolved into members.
+
+        Arguments:
+            count: The amount of combinations to return. [`None`][None] means all of them.
+
+        Returns:
+            The list of `(member, count)` pairs.
+        """
+        flag_type = self._flag_type
+
+        if count is None:
+            items = sorted(self._counts.items(), key=count_of, reverse=True)
+
+        else:
+            items = nlargest(count, self._counts.items(), key=count_of)
+
+        return [(flag_type(value), value_count) for value, value_count in items]
+
+    def merge(self: A, other: "FlagAggregator[Any]") -> A:
+        """Merges the `other` aggregator into this one in-place.
+
+        Arguments:
+            other: The aggregator to merge.
+
+        Raises:
+            ValueError: The aggregators are bound to different flag types.
+
+        Returns:
+            This aggregator.
+        """
+        if other._flag_type is not self._flag_type:
+            raise ValueError(
+                CAN_NOT_MERGE.format(
+                    tick(get_name(self._flag_type)), tick(get_name(other._flag_type))
+                )
+            )
+
+        counts = self._counts
+        get_count = counts.get
+
+        for value, count in other._counts.items():
+            counts[value] = get_count(value, 0) + count
+
+        self._total += other._total
+
+        self._or_mask |= other._or_mask
+        self._and_mask &= other._and_mask
+
+        return self
+
+    def copy(self: A) -> A:
+        """Returns the copy of this aggregator.
+
+        Returns:
+            The copied aggregator.
+        """
+        copied = type(self)(self._flag_type)
+
+        return copied.merge(self)
+
+    def __add__(self: A, other: Any) -> A:
+        if is_instance(other, FlagAggregator):
+            return self.copy().merge(other)
+
+        return NotImplemented
+
+    def __iadd__(self: A, other: Any) -> A:
+        if is_instance(other, FlagAggregator):
+            return self.merge(other)
+
+        return NotImplemented
+
+
+def count_of(item: Tuple[int, int]) -> int:
+    _, count = item
+
+    return count
@@ -0,0 +1,357 @@
+from array import array
+from builtins import isinstance as is_instance
+from sys import maxsize
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    MutableSequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from enum_extensions.enums import Enum, EnumContainer, find_ordinal, is_enum_member
+from enum_extensions.string import concat_comma_space, tick
+from enum_extensions.typing import get_name
+
+__all__ = ("EnumArray",)
+
+E = TypeVar("E", bound=Enum)
+
+A = TypeVar("A", bound="EnumArray[Any]")
+
+BITS_PER_BYTE = 8
+
+TYPECODES = ("B", "H", "I", "L", "Q")
+
+# typecodes along with the amounts of ordinals they can store, from the smallest to the largest
+LIMITS: List[Tuple[str, int]] = [
+    (typecode, 1 << array(typecode).itemsize * BITS_PER_BYTE) for typecode in TYPECODES
+]
+
+LIMIT_OF = dict(LIMITS)
+
+TOO_MANY_MEMBERS = "can not store {} members"
+INVALID_ORDINALS = "invalid ordinals for {}"
+NOT_IN_ARRAY = "{} is not in array"
+
+ENUM_ARRAY = "{}({}, [{}])"
+
+
+def find_typecode(count: int) -> str:
+    for typecode, limit in LIMITS:
+        if count <= limit:
+            return typecode
+
+    raise OverflowError(TOO_MANY_MEMBERS.format(count))
+
+
+class EnumArray(EnumContainer[E], MutableSequence[E]):
+    """Represents sequences of [`Enum`][enum_extensions.enums.Enum] members.
+
+    Members are stored as their positions in definition order in [`array`][array.array],
+    using the smallest type that fits all members (one byte per item for up to 256 members).
+
+    Example:
+        ```python
+        colors = EnumArray(Color, [Color.RED, Color.GREEN])
+
+        colors.append(Color.BLUE)
+        colors.extend([1, 2])  # values are looked up
+
+        assert colors.count(Color.RED) == 2
+
+        data = memoryview(colors.ordinals)  # zero-copy export
+        ```
+    """
+
+    def __init__(self, enum_type: Type[E], items: Iterable[Any] = ()) -> None:
+        self._enum_type = enum_type
+
+        self._ordinals = array(find_typecode(len(enum_type._member_names)))
+
+        self.extend(items)
+
+    @classmethod
+    def from_ordinals(cls, enum_type: Type[E], ordinals: Iterable[int]) -> "EnumArray[E]":
+        """Creates the array of `enum_type` members from their `ordinals`.
+
+        Arguments:
+            enum_type: The enumeration to create the array of.
+            ordinals: The ordinals of the members (anything supported by [`array`][array.array]).
+
+        Raises:
+            ValueError: Some ordinal does not correspond to any member.
+
+        Returns:
+            The array created.
+        """
+        enum_array = cls(enum_type)
+
+        enum_array._ordinals.extend(ordinals)
+
+        enum_array.check_ordinals()
+
+        return enum_array
+
+    @property
+    def ordinals(self) -> "array[int]":
+        """The underlying [`array`][array.array] of ordinals, supporting the buffer protocol.
+
+        This is the way to export the array without copying, for instance via
+        [`memoryview`][memoryview]; the array itself does not implement the buffer protocol.
+        """
+        return self._ordinals
+
+    @property
+    def typecode(self) -> str:
+        """The typecode of the underlying [`array`][array.array]."""
+        return self._ordinals.typecode
+
+    def check_ordinals(self) -> None:
+        ordinals = self._ordinals
+
+        if ordinals and max(ordinals) >= len(self._enum_type._member_names):
+            raise ValueError(INVALID_ORDINALS.format(tick(get_name(self._enum_type))))
+
+    def ordinal_of(self, item: Any) -> int:
+        if not is_enum_member(item):
+            item = self._enum_type(item)  # look up the member by value
+
+        ordinal = super().ordinal_of(item)
+
+        if ordinal >= LIMIT_OF[self._ordinals.typecode]:  # members were added, so grow the type
+            self._ordinals = array(find_typecode(ordinal + 1), self._ordinals)
+
+        return ordinal
+
+    def with_ordinals(self: A, ordinals: "array[int]") -> A:
+        enum_array = type(self)(self._enum_type)
+
+        enum_array._ordinals = ordinals
+
+        return enum_array
+
+    @overload
+    def __getitem__(self, index: int) -> E:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "EnumArray[E]":
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[E, "EnumArray[E]"]:
+        if is_instance(index, slice):
+            return self.with_ordinals(self._ordinals[index])
+
+        return self.member_of(self._ordinals[index])
+
+    @overload
+    def __setitem__(self, index: int, item: Any) -> None:
+        ...
+
+    @overload
+    def __setitem__(self, index: slice, item: Iterable[Any]) -> None:
+        ...
+
+    def __setitem__(self, index: Union[int, slice], item: Any) -> None:
+        if is_instance(index, slice):
+            ordinals = self.ordinals_of(item)  # might grow the type, so compute first
+
+            self._ordinals[index] = array(self._ordinals.typecode, ordinals)
+
+        else:
+            ordinal = self.ordinal_of(item)
+
+            self._ordinals[index] = ordinal
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        del self._ordinals[index]
+
+    def __len__(self) -> int:
+        return len(self._ordinals)
+
+    def __iter__(self) -> Iterator[E]:
+        member_of = self.member_of
+
+        for ordinal in self._ordinals:
+            yield member_of(ordinal)
+
+    def __contains__(self, item: Any) -> bool:
+        try:
+            ordinal = find_ordinal(self._enum_type, item)
+
+        except (TypeError, ValueError):
+            return False
+
+        return ordinal in self._ordinals
+
+    def __repr__(self) -> str:
+        name = get_name(type(self))
+        enum_name = get_name(self._enum_type)
+
+        return ENUM_ARRAY.format(name, enum_name, concat_comma_space(map(repr, self)))
+
+    def __eq__(self, other: Any) -> bool:
+        if is_instance(other, EnumArray):
+            return self._enum_type is other._enum_type and self._ordinals == other._ordinals
+
+        return NotImplemented
+
+    __hash__ = None  # type: ignore
+
+    def __add__(self: A, other: Any) -> A:
+        if is_instance(other, EnumArray):
+            self.check_combine(other)
+
+            enum_array = self.copy()
+
+            enum_array.extend(other)
+
+            return enum_array
+
+        return NotImplemented
+
+    def __iadd__(self: A, other: Any) -> A:
+        self.extend(other)
+
+        return self
+
+    def ordinals_of(self, items: Iterable[Any]) -> List[int]:
+        if is_instance(items, EnumArray) and items._enum_type is self._enum_type:
+            typecode = items._ordinals.typecode
+
+            if LIMIT_OF[typecode] > LIMIT_OF[self._ordinals.typecode]:
+                self._ordinals = array(typecode, self._ordinals)
+
+            return items._ordinals.tolist()
+
+        ordinal_of = self.ordinal_of
+
+        return [ordinal_of(item) for item in items]
+
+    def insert(self, index: int, item: Any) -> None:
+        """Inserts the member (or the member with the value) before the `index`.
+
+        Arguments:
+            index: The index to insert the member before.
+            item: The member or the value to insert.
+
+        Raises:
+            TypeError: The member is of another type.
+            ValueError: The member is not named or is not canonical, or the value is not found.
+        """
+        ordinal = self.ordinal_of(item)
+
+        self._ordinals.insert(index, ordinal)
+
+    def append(self, item: Any) -> None:
+        """Appends the member (or the member with the value) to the array.
+
+        Arguments:
+            item: The member or the value to append.
+
+        Raises:
+            TypeError: The member is of another type.
+            ValueError: The member is not named or is not canonical, or the value is not found.
+        """
+        ordinal = self.ordinal_of(item)
+
+        self._ordinals.append(ordinal)
+
+    def extend(self, items: Iterable[Any]) -> None:
+        """Extends the array with members (or members with the values) from the `items`.
+
+        Arguments:
+            items: The members or the values to extend the array with.
+
+        Raises:
+            TypeError: Some member is of another type.
+            ValueError: Some member is not named or is not canonical, or some value is not found.
+        """
+        ordinals = self.ordinals_of(items)  # might grow the type, so compute first
+
+        self._ordinals.extend(ordinals)
+
+    def count(self, item: Any) -> int:
+        """Counts the occurrences of the member in the array.
+
+        Arguments:
+            item: The member to count.
+
+        Returns:
+            The amount of occurrences.
+        """
+        try:
+            ordinal = find_ordinal(self._enum_type, item)
+
+        except (TypeError, ValueError):
+            return 0
+
+        return self._ordinals.count(ordinal)
+
+    def counts(self) -> Dict[E, int]:
+        """Counts the occurrences of all members in the array, in definition order.
+
+        Returns:
+            The `member -> count` mapping of members present.
+        """
+        ordinal_counts = [0] * len(self._enum_type._member_names)
+
+        for ordinal in self._ordinals:
+            ordinal_counts[ordinal] += 1
+
+        member_of = self.member_of
+
+        return {member_of(ordinal): count for ordinal, count in enumerate(ordinal_counts) if count}
+
+    def index(self, item: Any, start: int = 0, stop: int = maxsize) -> int:
+        """Finds the first index of the member in the array.
+
+        Arguments:
+            item: The member to find.
+            start: The index to start searching from.
+            stop: The index to stop searching at.
+
+        Raises:
+            ValueError: The member is not present.
+
+        Returns:
+            The index found.
+        """
+        try:
+            ordinal = find_ordinal(self._enum_type, item)
+
+        except TypeError:
+            raise ValueError(NOT_IN_ARRAY.format(repr(item))) from None
+
+        ordinals = self._ordinals
+
+        start, stop, _ = slice(start, stop).indices(len(ordinals))
+
+        try:
+            return ordinals[start:stop].index(ordinal) + start
+
+        except ValueError:
+            raise ValueError(NOT_IN_ARRAY.format(repr(item))) from None
+
+    def reverse(self) -> None:
+        """Reverses the array in-place."""
+        self._ordinals.reverse()
+
+    def clear(self) -> None:
+        """Removes all members from the array."""
+        del self._ordinals[:]
+
+    def copy(self: A) -> A:
+        """Returns the copy of the array.
+
+        Returns:
+            The copied array.
+        """
+        return self.with_ordinals(array(self._ordinals.typecode, self._ordinals))
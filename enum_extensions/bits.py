@@ -1,6 +1,15 @@
-from typing import Iterator
+from typing import Iterable, Iterator, List, Optional
 
-__all__ = ("bin", "bit_at", "bit_count", "bit_mask", "is_single_bit", "iter_bits")
+__all__ = (
+    "bin",
+    "bit_at",
+    "bit_count",
+    "bit_mask",
+    "is_single_bit",
+    "iter_bits",
+    "iter_submasks",
+    "minimal_cover",
+)
 
 
 def is_single_bit(value: int) -> bool:
@@ -38,6 +47,70 @@ def iter_bits(value: int) -> Iterator[int]:
         value ^= bit
 
 
+def iter_submasks(mask: int, base: int = 0) -> Iterator[int]:
+    submask = 0
+
+    while True:
+        yield base | submask
+
+        if submask == mask:
+            break
+
+        submask = (submask - mask) & mask
+
+
+COVER_SEARCH_LIMIT = 10000
+
+
+def minimal_cover(
+    value: int, masks: Iterable[int], limit: int = COVER_SEARCH_LIMIT
+) -> Optional[List[int]]:
+    candidates = sorted(
+        {mask for mask in masks if mask and not mask & ~value}, key=bit_count, reverse=True
+    )
+
+    best: Optional[List[int]] = None
+
+    chosen: List[int] = []
+
+    steps = 0
+
+    def search(remaining: int) -> bool:
+        nonlocal best, steps
+
+        steps += 1
+
+        if steps > limit:
+            return False  # the search is too expensive, give up
+
+        if not remaining:
+            best = chosen.copy()  # strictly smaller than the previous best, see below
+
+            return True
+
+        if best is not None and len(chosen) + 1 >= len(best):
+            return True  # can not do better than that
+
+        lowest = remaining & -remaining  # any cover has to include the lowest remaining bit
+
+        for mask in candidates:
+            if mask & lowest:
+                chosen.append(mask)
+
+                complete = search(remaining & ~mask)
+
+                chosen.pop()
+
+                if not complete:
+                    return False
+
+        return True
+
+    search(value)  # if the search is given up on, the best cover found so far is used
+
+    return best
+
+
 DIGITS = "{value:0>{length}b}"
 BINARY = "0b{sign} {digits:{sign}>{bits}}"
 
@@ -0,0 +1,420 @@
+"""Compiles enumerations into static Python modules.
+
+Static modules are imported without running the functional API, and their enumerations
+can always be pickled, since the module they are defined in is known.
+
+Enumerations are given either as JSON specifications or as `module:qualified_name` paths:
+
+```console
+$ python -m enum_extensions.compile colors.json --tables --output colors.py
+```
+
+Specifications are objects (or arrays of objects) with the following keys:
+
+- `name`: the name of the enumeration;
+- `type`: the name of the base type exported by the library, or the `module:qualified_name`
+  path to it (defaults to `Enum`);
+- `members`: the `name -> value` object, or the array of names and `[name, value]` pairs.
+
+```json
+{"name": "Color", "type": "IntEnum", "members": ["RED", "GREEN", ["BLUE", 4]]}
+```
+"""
+
+from argparse import ArgumentParser
+from ast import literal_eval
+from builtins import getattr as get_attribute
+from builtins import isinstance as is_instance
+from builtins import issubclass as is_subclass
+from importlib import import_module
+from json import load as load_json
+from keyword import iskeyword as is_keyword
+from pathlib import Path
+from sys import stdout
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Type
+
+from enum_extensions.constants import ENUM_DOCUMENTATION, UTF_8
+from enum_extensions.enums import Enum, UnknownPolicy, find_body_names
+from enum_extensions.flags import FlagType, is_flag
+from enum_extensions.string import concat_comma_space, create_constant_name, tick
+from enum_extensions.typing import AnyType, StringDict, get_name, is_mapping, is_string
+
+__all__ = ("compile_enum", "compile_module", "load_spec", "find_enum", "main")
+
+PACKAGE = "enum_extensions"
+BUILTINS = "builtins"
+
+COLON = ":"
+DOT = "."
+
+NAME = "name"
+TYPE = "type"
+MEMBERS = "members"
+
+DEFAULT_TYPE = "Enum"
+
+HEADER = '"""Generated by `python -m enum_extensions.compile`; do not edit."""'
+
+IMPORT = "from {} import {}"
+ALL = "__all__ = ("
+ALL_ITEM = '    "{}",'
+ALL_END = ")"
+
+CLASS = "class {}({}):"
+CLASS_KEYWORD = "{}={}"
+DOCUMENTATION = "    {}"
+MEMBER = "    {} = {}"
+PASS = "    pass"
+
+VALUES_NAME = "{}_VALUES"
+MASK_NAME = "{}_MASK"
+
+CONSTANT = "{} = {}"
+TABLE = "{} = {{"
+TABLE_ITEM = '    "{}": {},'
+TABLE_END = "}"
+
+UNKNOWN = "unknown"
+COMPACT = "compact"
+BOUNDARY = "boundary"
+ALIASES = "aliases"
+
+NEW_LINE = "\n"
+
+CAN_NOT_COMPILE_VALUE = "can not compile value {} of {}"
+CAN_NOT_COMPILE_NAME = "can not compile name {} of {}"
+CAN_NOT_COMPILE_BODY = "can not compile {}; names defined in its body: {}"
+CAN_NOT_IMPORT_NESTED = "can not import nested {}"
+EXPECTED_ENUM = "expected enum at {}, got {}"
+INVALID_PATH = "invalid path {}, expected `module:qualified_name`"
+
+
+def find_object(path: str) -> Any:
+    module_name, colon, qualified_name = path.partition(COLON)
+
+    if not colon:
+        raise ValueError(INVALID_PATH.format(tick(path)))
+
+    item = import_module(module_name)
+
+    for name in qualified_name.split(DOT):
+        item = get_attribute(item, name)
+
+    return item
+
+
+def find_enum(path: str) -> Type[Enum]:
+    """Finds the enumeration by its `module:qualified_name` path.
+
+    Arguments:
+        path: The path to the enumeration.
+
+    Raises:
+        ValueError: The path is invalid.
+        TypeError: The object found is not an enumeration.
+
+    Returns:
+        The enumeration found.
+    """
+    enum_type = find_object(path)
+
+    if not is_instance(enum_type, type) or not is_subclass(enum_type, Enum):
+        raise TypeError(EXPECTED_ENUM.format(tick(path), repr(enum_type)))
+
+    return enum_type
+
+
+def find_type(name: str) -> AnyType:
+    if COLON in name:
+        return find_object(name)
+
+    return get_attribute(import_module(PACKAGE), name)
+
+
+def load_spec(path: Path) -> List[Type[Enum]]:
+    """Loads enumerations from the JSON specification at `path`.
+
+    Arguments:
+        path: The path to the specification.
+
+    Returns:
+        The enumerations loaded.
+    """
+    with path.open(encoding=UTF_8) as file:
+        spec = load_json(file)
+
+    if is_mapping(spec):
+        spec = [spec]
+
+    return [create_enum(item) for item in spec]
+
+
+def create_enum(item: StringDict[Any]) -> Type[Enum]:
+    enum_base = find_type(item.get(TYPE, DEFAULT_TYPE))
+
+    members = item.get(MEMBERS, ())
+
+    if is_mapping(members):
+        pairs: Iterable[Any] = members.items()
+
+    else:
+        pairs = (member if is_string(member) else tuple(member) for member in members)
+
+    return enum_base.build(item[NAME], pairs, module=__name__)
+
+
+def compile_value(enum_type: Type[Enum], value: Any) -> str:
+    string = repr(value)
+
+    try:
+        compiled = literal_eval(string)
+
+    except (SyntaxError, ValueError):
+        compiled = None  # it does not matter, as long as it is not the value itself
+
+    if type(compiled) is not type(value) or compiled != value:
+        raise ValueError(CAN_NOT_COMPILE_VALUE.format(string, tick(get_name(enum_type))))
+
+    return string
+
+
+def compile_name(enum_type: Type[Enum], name: str) -> str:
+    if not name.isidentifier() or is_keyword(name):
+        raise ValueError(CAN_NOT_COMPILE_NAME.format(repr(name), tick(get_name(enum_type))))
+
+    return name
+
+
+def iter_named_values(enum_type: Type[Enum]) -> Iterator[Tuple[str, Any]]:
+    for name, member in enum_type.members.items():
+        yield (name, member.__enum_value__)
+
+
+def find_keywords(enum_type: Type[Enum]) -> Dict[str, str]:
+    (*_, enum_base) = enum_type._bases
+
+    keywords = {}
+
+    unknown = enum_type._unknown
+
+    if unknown != enum_base._unknown:
+        keywords[UNKNOWN] = unknown.name if is_instance(unknown, UnknownPolicy) else repr(unknown)
+
+    if enum_type._compact != enum_base._compact:
+        keywords[COMPACT] = repr(enum_type._compact)
+
+    if is_instance(enum_type, FlagType):
+        if enum_type._boundary is not enum_base._boundary:
+            keywords[BOUNDARY] = enum_type._boundary.name
+
+        if enum_type._aliases != enum_base._aliases:
+            keywords[ALIASES] = repr(enum_type._aliases)
+
+    return keywords
+
+
+def compile_enum(enum_type: Type[Enum], tables: bool = False) -> str:
+    """Compiles the class definition of the `enum_type`.
+
+    Only members (along with the bases and the documentation) are compiled,
+    therefore enumerations that define anything else in their bodies can not be compiled.
+
+    Arguments:
+        enum_type: The enumeration to compile.
+        tables: Whether to add the `name -> value` table, along with the mask for flags.
+
+    Raises:
+        ValueError: Some value can not be compiled, or the body defines names other than members.
+
+    Returns:
+        The source code of the enumeration.
+    """
+    name = get_name(enum_type)
+
+    body_names = find_body_names(enum_type)
+
+    if body_names:
+        names = concat_comma_space(map(tick, sorted(body_names)))
+
+        raise ValueError(CAN_NOT_COMPILE_BODY.format(tick(name), names))
+
+    arguments = [get_name(base) for base in enum_type._bases]
+
+    arguments.extend(
+        CLASS_KEYWORD.format(keyword, value) for keyword, value in find_keywords(enum_type).items()
+    )
+
+    lines = [CLASS.format(name, concat_comma_space(arguments))]
+
+    documentation = enum_type.__doc__
+
+    if documentation is not None and documentation != ENUM_DOCUMENTATION:
+        lines.append(DOCUMENTATION.format(compile_value(enum_type, documentation)))
+
+    named_values = [
+        (compile_name(enum_type, member_name), compile_value(enum_type, value))
+        for member_name, value in iter_named_values(enum_type)
+    ]
+
+    lines.extend(MEMBER.format(member_name, value) for member_name, value in named_values)
+
+    if len(lines) == 1:
+        lines.append(PASS)
+
+    if tables:
+        constant_name = create_constant_name(name)
+
+        lines.extend((str(), str()))
+
+        lines.append(TABLE.format(VALUES_NAME.format(constant_name)))
+        lines.extend(TABLE_ITEM.format(member_name, value) for member_name, value in named_values)
+        lines.append(TABLE_END)
+
+        if is_flag(enum_type):
+            mask_name = MASK_NAME.format(constant_name)
+
+            lines.extend((str(), CONSTANT.format(mask_name, hex(enum_type._flag_mask))))
+
+    return NEW_LINE.join(lines)
+
+
+def find_exports(enum_type: Type[Enum], tables: bool) -> List[str]:
+    name = get_name(enum_type)
+
+    exports = [name]
+
+    if tables:
+        constant_name = create_constant_name(name)
+
+        exports.append(VALUES_NAME.format(constant_name))
+
+        if is_instance(enum_type, FlagType):
+            exports.append(MASK_NAME.format(constant_name))
+
+    return exports
+
+
+def find_imports(enum_types: Iterable[Type[Enum]]) -> Dict[str, Set[str]]:
+    imports: Dict[str, Set[str]] = {}
+
+    package = import_module(PACKAGE)
+
+    for enum_type in enum_types:
+        for base in enum_type._bases:
+            module_name = base.__module__
+
+            if module_name == BUILTINS:
+                continue
+
+            name = get_name(base)
+
+            if base.__qualname__ != name:
+                raise ValueError(CAN_NOT_IMPORT_NESTED.format(tick(base.__qualname__)))
+
+            if module_name.startswith(PACKAGE) and get_attribute(package, name, None) is base:
+                module_name = PACKAGE  # prefer public imports
+
+            imports.setdefault(module_name, set()).add(name)
+
+        keywords = find_keywords(enum_type)
+
+        if is_instance(enum_type._unknown, UnknownPolicy) and UNKNOWN in keywords:
+            imports.setdefault(PACKAGE, set()).add(enum_type._unknown.name)
+
+        if is_instance(enum_type, FlagType) and BOUNDARY in keywords:
+            imports.setdefault(PACKAGE, set()).add(enum_type._boundary.name)
+
+    return imports
+
+
+def compile_module(enum_types: Sequence[Type[Enum]], tables: bool = False) -> str:
+    """Compiles the module defining `enum_types`.
+
+    Arguments:
+        enum_types: The enumerations to compile.
+        tables: Whether to add `name -> value` tables, along with masks for flags.
+
+    Raises:
+        ValueError: Some enumeration can not be compiled, or some base can not be imported.
+
+    Returns:
+        The source code of the module.
+    """
+    lines = [HEADER, str()]
+
+    for module_name, names in sorted(find_imports(enum_types).items()):
+        lines.append(IMPORT.format(module_name, concat_comma_space(sorted(names))))
+
+    lines.extend((str(), ALL))
+
+    lines.extend(
+        ALL_ITEM.format(export)
+        for enum_type in enum_types
+        for export in find_exports(enum_type, tables)
+    )
+
+    lines.append(ALL_END)
+
+    for enum_type in enum_types:
+        lines.extend((str(), str(), compile_enum(enum_type, tables)))
+
+    lines.append(str())
+
+    return NEW_LINE.join(lines)
+
+
+DESCRIPTION = "Compiles enumerations into static Python modules."
+
+SOURCES = "sources"
+SOURCES_HELP = "paths to JSON specifications or `module:qualified_name` paths to enumerations"
+
+OUTPUT = "--output"
+OUTPUT_SHORT = "-o"
+OUTPUT_HELP = "the path to write the module to (defaults to standard output)"
+
+TABLES = "--tables"
+TABLES_HELP = "add `name -> value` tables, along with masks for flags"
+
+STORE_TRUE = "store_true"
+
+ANY = "+"
+
+
+def main(arguments: Optional[Sequence[str]] = None) -> None:
+    """Runs the compiler.
+
+    Arguments:
+        arguments: The command line arguments (defaults to [`sys.argv`][sys.argv]).
+    """
+    parser = ArgumentParser(description=DESCRIPTION)
+
+    parser.add_argument(SOURCES, nargs=ANY, help=SOURCES_HELP)
+    parser.add_argument(OUTPUT_SHORT, OUTPUT, help=OUTPUT_HELP)
+    parser.add_argument(TABLES, action=STORE_TRUE, help=TABLES_HELP)
+
+    namespace = parser.parse_args(arguments)
+
+    output: Optional[str] = namespace.output
+
+    enum_types: List[Type[Enum]] = []
+
+    for source in namespace.sources:
+        path = Path(source)
+
+        if path.is_file():
+            enum_types.extend(load_spec(path))
+
+        else:
+            enum_types.append(find_enum(source))
+
+    result = compile_module(enum_types, namespace.tables)
+
+    if output is None:
+        stdout.write(result)
+
+    else:
+        Path(output).write_text(result, encoding=UTF_8)
+
+
+if __name__ == "__main__":
+    main()
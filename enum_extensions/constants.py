@@ -5,6 +5,7 @@ __all__ = (
     "TWO",
     "COMMA",
     "SPACE",
+    "TAB",
     "COMMA_SPACE",
     "PIPE",
     "TICK",
@@ -14,6 +15,7 @@ __all__ = (
     "DIRECT_CALLER",
     "NESTED_CALLER",
     "ANNOTATIONS",
+    "ARRAY",
     "GET",
     "SET",
     "DELETE",
@@ -24,6 +26,9 @@ __all__ = (
     "NEW",
     "NEW_MEMBER",
     "REDUCE",
+    "SLOTS",
+    "WEAK_REFERENCE",
+    "ENUM_COPY_VALUES",
     "ENUM_GENERATE_NEXT_VALUE",
     "ENUM_IGNORE",
     "ENUM_START",
@@ -32,9 +37,21 @@ __all__ = (
     "ENUM_VALUE",
     "ENUM_DOCUMENTATION",
     "ENUM_PRESERVE",
+    "MEMBER_SLOTS",
     "MEMBER_MAPPING_PRIVATE",
+    "GENERATION_PRIVATE",
+    "CANONICAL_GENERATION_PRIVATE",
+    "LAZY_NAMES_PRIVATE",
     "UNKNOWN_PRIVATE",
+    "START_PRIVATE",
+    "COMPACT_PRIVATE",
+    "SORT_ORDER_PRIVATE",
     "BOUNDARY_PRIVATE",
+    "ALIASES_PRIVATE",
+    "FLAG_MASK_PRIVATE",
+    "FULL_MASK_PRIVATE",
+    "BIT_LENGTH_PRIVATE",
+    "BY_DEFINITION",
     "INVALID_NAMES",
     "NONE_NEW",
     "OBJECT_NEW",
@@ -51,6 +68,7 @@ TWO = 2
 
 COMMA = ","
 SPACE = " "
+TAB = "\t"
 
 COMMA_SPACE = COMMA + SPACE
 
@@ -68,6 +86,8 @@ NESTED_CALLER = 2
 
 ANNOTATIONS = "__annotations__"
 
+ARRAY = "__array__"
+
 GET = "__get__"
 SET = "__set__"
 DELETE = "__delete__"
@@ -81,8 +101,12 @@ NEW_MEMBER = "__new_member__"
 
 REDUCE = "__reduce_ex__"
 
+SLOTS = "__slots__"
+WEAK_REFERENCE = "__weakref__"
+
 PICKLE_METHODS = frozenset(("__getnewargs_ex__", "__getnewargs__", "__reduce_ex__", "__reduce__"))
 
+ENUM_COPY_VALUES = "__enum_copy_values__"
 ENUM_GENERATE_NEXT_VALUE = "enum_generate_next_value"
 ENUM_IGNORE = "enum_ignore"
 ENUM_START = "enum_start"
@@ -95,8 +119,21 @@ ENUM_DOCUMENTATION = "An enumeration."
 ENUM_PRESERVE = ("__format__", "__repr__", "__str__", "__reduce_ex__")
 
 MEMBER_MAPPING_PRIVATE = "_member_mapping"
+GENERATION_PRIVATE = "_generation"
+CANONICAL_GENERATION_PRIVATE = "_canonical_generation"
+LAZY_NAMES_PRIVATE = "_lazy_names"
 UNKNOWN_PRIVATE = "_unknown"
+START_PRIVATE = "_start"
+COMPACT_PRIVATE = "_compact"
+SORT_ORDER_PRIVATE = "_sort_order"
 BOUNDARY_PRIVATE = "_boundary"
+ALIASES_PRIVATE = "_aliases"
+FLAG_MASK_PRIVATE = "_flag_mask"
+FULL_MASK_PRIVATE = "_full_mask"
+BIT_LENGTH_PRIVATE = "_bit_length"
+BY_DEFINITION = "by_definition"
+
+MEMBER_SLOTS = (ENUM_NAME, ENUM_TYPE, ENUM_VALUE, SORT_ORDER_PRIVATE, WEAK_REFERENCE)
 
 MRO = "mro"
 
@@ -0,0 +1,307 @@
+from builtins import isinstance as is_instance
+from heapq import nlargest
+from operator import itemgetter as get_item
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Type, TypeVar
+
+from enum_extensions.enums import (
+    ENUM_CONTAINER_ITEM,
+    Enum,
+    EnumContainer,
+    find_ordinal,
+    represent_container,
+)
+
+__all__ = ("EnumCounter",)
+
+E = TypeVar("E", bound=Enum)
+
+C = TypeVar("C", bound="EnumCounter[Any]")
+
+get_count = get_item(1)
+
+
+class EnumCounter(EnumContainer[E], Mapping[E, int]):
+    """Represents counters of [`Enum`][enum_extensions.enums.Enum] members.
+
+    Counts are stored in the list indexed by member positions in definition order,
+    therefore counting members does not involve hashing.
+
+    Example:
+        ```python
+        counter = EnumCounter(Event)
+
+        counter.add(Event.CLICK)
+        counter.add_many(events)
+        counter.update_from_codes([1, 2, 2])  # values are looked up
+
+        top = counter.most_common(3)
+        ```
+    """
+
+    def __init__(self, enum_type: Type[E], items: Iterable[E] = ()) -> None:
+        self._enum_type = enum_type
+
+        # class attribute access is comparatively slow, so keep canonical members at hand
+        self._canonical_members = enum_type._get_canonical_members()
+
+        self._counts = [0] * len(enum_type._member_names)
+
+        self.add_many(items)
+
+    def grow(self) -> None:
+        enum_type = self._enum_type
+
+        self._canonical_members = enum_type._get_canonical_members()
+
+        extension = len(enum_type._member_names) - len(self._counts)
+
+        if extension > 0:
+            self._counts.extend([0] * extension)
+
+    def ordinal_of(self, member: E) -> int:
+        ordinal = super().ordinal_of(member)
+
+        if ordinal >= len(self._counts):
+            self.grow()
+
+        return ordinal
+
+    def add(self, member: E, count: int = 1) -> None:
+        """Adds the `count` to the count of the `member`.
+
+        Arguments:
+            member: The member to count.
+            count: The amount to add.
+
+        Raises:
+            TypeError: The member is of another type.
+            ValueError: The member is not named or is not canonical.
+        """
+        try:
+            ordinal = member._sort_order
+
+            # aliases are the same objects as canonical members
+            if self._canonical_members[ordinal] is member:
+                self._counts[ordinal] += count
+
+                return
+
+        except (AttributeError, IndexError):  # not a member, or not counted yet
+            pass
+
+        self._counts[self.ordinal_of(member)] += count
+
+    def add_many(self, members: Iterable[E]) -> None:
+        """Counts each member of the `members`.
+
+        Arguments:
+            members: The members to count.
+
+        Raises:
+            TypeError: Some member is of another type.
+            ValueError: Some member is not named or is not canonical.
+        """
+        canonical_members = self._canonical_members
+
+        counts = self._counts  # extended in-place when members are added
+
+        for member in members:
+            try:
+                ordinal = member._sort_order
+
+                if canonical_members[ordinal] is member:
+                    counts[ordinal] += 1
+
+                    continue
+
+            except (AttributeError, IndexError):
+                pass
+
+            counts[self.ordinal_of(member)] += 1
+
+            canonical_members = self._canonical_members  # might have been extended
+
+    def update_from_codes(self, codes: Iterable[Any]) -> None:
+        """Counts members with the values in the `codes`.
+
+        Arguments:
+            codes: The values of the members to count.
+
+        Raises:
+            ValueError: Some value is not found, or the member is not named or is not canonical.
+        """
+        enum_type = self._enum_type
+
+        ordinals: Dict[Any, int] = {}  # value -> ordinal, to look up each value only once
+
+        counts = self._counts
+
+        for code in codes:
+            try:
+                ordinal = ordinals[code]
+
+            except KeyError:
+                ordinal = ordinals[code] = self.ordinal_of(enum_type(code))
+
+                counts = self._counts  # might have been extended
+
+            counts[ordinal] += 1
+
+    def __getitem__(self, member: E) -> int:
+        try:
+            ordinal = find_ordinal(self._enum_type, member)
+
+        except (TypeError, ValueError):
+            return 0
+
+        counts = self._counts
+
+        return counts[ordinal] if ordinal < len(counts) else 0
+
+    def iter_ordinals(self) -> Iterator[int]:
+        for ordinal, count in enumerate(self._counts):
+            if count:
+                yield ordinal
+
+    def __iter__(self) -> Iterator[E]:
+        member_of = self.member_of
+
+        for ordinal in self.iter_ordinals():
+            yield member_of(ordinal)
+
+    def __len__(self) -> int:
+        return len(self._counts) - self._counts.count(0)
+
+    def __contains__(self, member: Any) -> bool:
+        return self[member] != 0
+
+    def __repr__(self) -> str:
+        return represent_container(
+            self,
+            (
+                ENUM_CONTAINER_ITEM.format(repr(member), repr(count))
+                for member, count in self.items()
+            ),
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        if is_instance(other, EnumCounter):
+            return self._enum_type is other._enum_type and self.to_dict() == other.to_dict()
+
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore
+
+    def total(self) -> int:
+        """Computes the sum of all counts.
+
+        Returns:
+            The total count.
+        """
+        return sum(self._counts)
+
+    def most_common(self, count: Optional[int] = None) -> List[Tuple[E, int]]:
+        """Lists the most common members along with their counts, from the most common one.
+
+        Members with equal counts are listed in definition order.
+
+        Arguments:
+            count: The amount of members to list. [`None`][None] means all members counted.
+
+        Returns:
+            The list of `(member, count)` pairs.
+        """
+        items = [(ordinal, self._counts[ordinal]) for ordinal in self.iter_ordinals()]
+
+        if count is None:
+            items.sort(key=get_count, reverse=True)
+
+        else:
+            items = nlargest(count, items, key=get_count)
+
+        member_of = self.member_of
+
+        return [(member_of(ordinal), count) for ordinal, count in items]
+
+    def merge(self, *others: "EnumCounter[E]") -> None:
+        """Adds counts from the `others` (for instance, shards) to the counter.
+
+        Arguments:
+            *others: The counters to merge.
+
+        Raises:
+            ValueError: Some counter is of another enumeration.
+        """
+        for other in others:
+            self.check_combine(other)
+
+            if len(other._counts) > len(self._counts):
+                self.grow()
+
+            counts = self._counts
+
+            for ordinal, count in enumerate(other._counts):
+                counts[ordinal] += count
+
+    def __add__(self: C, other: Any) -> C:
+        if is_instance(other, EnumCounter):
+            counter = self.copy()
+
+            counter.merge(other)
+
+            return counter
+
+        return NotImplemented
+
+    def __iadd__(self: C, other: Any) -> C:
+        if is_instance(other, EnumCounter):
+            self.merge(other)
+
+            return self
+
+        return NotImplemented
+
+    def to_dict(self) -> Dict[E, int]:
+        """Converts the counter to the dictionary of members counted, in definition order.
+
+        Returns:
+            The `member -> count` dictionary.
+        """
+        return dict(self.items())
+
+    def snapshot(self, reset: bool = False) -> Dict[E, int]:
+        """Takes the snapshot of the counts, optionally resetting them.
+
+        Resetting swaps the counts out, so that counts added while
+        the snapshot is being taken are not lost.
+
+        Arguments:
+            reset: Whether to reset the counts.
+
+        Returns:
+            The `member -> count` dictionary.
+        """
+        counts = self._counts
+
+        if reset:
+            self._counts = [0] * len(counts)
+
+        member_of = self.member_of
+
+        return {member_of(ordinal): count for ordinal, count in enumerate(counts) if count}
+
+    def clear(self) -> None:
+        """Resets all counts to zero."""
+        self._counts = [0] * len(self._counts)
+
+    def copy(self: C) -> C:
+        """Returns the copy of the counter.
+
+        Returns:
+            The copied counter.
+        """
+        copied = type(self)(self._enum_type)
+
+        copied._counts = self._counts.copy()
+
+        return copied
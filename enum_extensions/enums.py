@@ -6,14 +6,26 @@ from builtins import isinstance as is_instance
 from builtins import issubclass as is_subclass
 from builtins import setattr as set_attribute
 from builtins import type as standard_type
+from collections import OrderedDict
+from csv import reader
+from gc import collect as collect_garbage
+from os import PathLike
+from time import perf_counter
 from types import DynamicClassAttribute as dynamic_attribute
 from types import MappingProxyType as MappingProxy
+from types import TracebackType
 from typing import (
+    IO,
     Any,
+    ContextManager,
     Dict,
+    FrozenSet,
     Generic,
+    Iterable,
     Iterator,
     List,
+    Mapping,
+    MutableMapping,
     Optional,
     Sequence,
     Set,
@@ -23,23 +35,31 @@ from typing import (
     Union,
     overload,
 )
+from weakref import WeakKeyDictionary, WeakValueDictionary
 
 from typing_extensions import Literal, TypeGuard, TypeVarTuple, Unpack
 
-from enum_extensions.auto import MaybeAuto, is_auto
+from enum_extensions.auto import MaybeAuto, auto, is_auto
 from enum_extensions.bits import is_single_bit
 from enum_extensions.constants import (
+    CANONICAL_GENERATION_PRIVATE,
     COMMA,
+    COMPACT_PRIVATE,
     DIRECT_CALLER,
     DOCUMENTATION,
+    EMPTY,
+    ENUM_COPY_VALUES,
     ENUM_DOCUMENTATION,
     ENUM_GENERATE_NEXT_VALUE,
     ENUM_IGNORE,
     ENUM_PRESERVE,
     ENUM_START,
     ENUM_VALUE,
+    GENERATION_PRIVATE,
     INVALID_NAMES,
+    LAZY_NAMES_PRIVATE,
     MEMBER_MAPPING_PRIVATE,
+    MEMBER_SLOTS,
     MODULE,
     NAME,
     NESTED_CALLER,
@@ -49,36 +69,46 @@ from enum_extensions.constants import (
     PICKLE_METHODS,
     QUALIFIED_NAME,
     REDUCE,
+    SLOTS,
     SPACE,
+    START_PRIVATE,
     STRICT,
     UNKNOWN_PRIVATE,
     USELESS_NEW,
     UTF_8,
 )
 from enum_extensions.members import is_member, is_non_member
+from enum_extensions.memory import MemoryReport, deep_size, iter_subclasses
 from enum_extensions.string import case_fold, case_fold_name, concat_comma_space, create_title, tick
-from enum_extensions.types import Nullable, is_not_null, is_null, null
+from enum_extensions.types import Nullable, Singleton, is_not_null, is_null, null
 from enum_extensions.typing import (
+    AnyPath,
     AnyType,
+    Binary,
     DynamicCallable,
     DynamicTuple,
     EmptyTuple,
     MaybeIterable,
     Names,
     Namespace,
+    Nullary,
     Quaternary,
     StringDict,
     StringMapping,
     StringPairs,
+    Unary,
     get_name,
     is_mapping,
     is_string,
     is_tuple,
 )
 from enum_extensions.utils import (
+    SequenceView,
     get_frame,
     is_descriptor,
     is_double_under_name,
+    linearize,
+    lookup_attribute,
     make_namespace_unpicklable,
     prepend,
 )
@@ -92,6 +122,12 @@ __all__ = (
     "is_enum",
     "is_enum_member",
     "enum_generate_next_value",
+    "copy_values",
+    "clear_enum_cache",
+    "memory_reports",
+    "REGISTER",
+    "EPHEMERAL",
+    "UnknownPolicy",
 )
 
 T = TypeVar("T", covariant=True)
@@ -99,11 +135,35 @@ E = TypeVar("E")
 
 ET = TypeVar("ET")
 
+K = TypeVar("K")
+V = TypeVar("V")
+
 EnumT = TypeVar("EnumT", bound="Enum")
 EnumerationT = TypeVar("EnumerationT", bound="Type[Enum]")
 
 ENUM_DEFINED = False
 
+LAZY_LOCK = "lazy"
+
+LOCKS: Dict[str, ContextManager[Any]] = {}
+
+
+def find_lock(name: str) -> ContextManager[Any]:
+    lock = LOCKS.get(name)
+
+    if lock is None:
+        # threading is only imported once some lock is actually needed
+        from threading import RLock
+
+        lock = LOCKS.setdefault(name, RLock())  # atomic, so all threads get the same lock
+
+    return lock
+
+
+Progress = Binary[int, float, None]
+
+DEFAULT_EVERY = 10000
+
 GenerateNextValue = Quaternary[str, Optional[T], int, Sequence[T], T]
 
 
@@ -116,7 +176,8 @@ def enum_generate_next_value(
         name: The name of the [`Enum`][enum_extensions.enums.Enum] member which needs a value.
         start: An initial value to use.
         count: The amount of already existing unique enumeration members.
-        values: All previously defined members.
+        values: The values of all previously defined members, as a read-only view
+            (see [`copy_values`][enum_extensions.enums.copy_values]).
 
     Returns:
         The generated value.
@@ -124,6 +185,53 @@ def enum_generate_next_value(
     raise NotImplementedError
 
 
+G = TypeVar("G", bound=GenerateNextValue[Any])
+
+
+def copy_values(function: G) -> G:
+    """Marks the `enum_generate_next_value` hook as one that needs
+    its own copy of previously defined values.
+
+    By default, hooks are given a read-only view of the values, which is not copied
+    and therefore reflects any members defined later. Copying makes generating values
+    for `n` members take quadratic time, so this should only be used by hooks
+    that store `values` for later use.
+
+    Example:
+        ```python
+        class Stored(Enum):
+            @staticmethod
+            @copy_values
+            def enum_generate_next_value(
+                name: str, start: Optional[int], count: int, values: Sequence[int]
+            ) -> int:
+                ...
+        ```
+
+    Arguments:
+        function: The hook to mark.
+
+    Returns:
+        The hook marked.
+    """
+    set_attribute(function, ENUM_COPY_VALUES, True)
+
+    return function
+
+
+def call_generate_next_value(
+    function: GenerateNextValue[T],
+    name: Optional[str],
+    start: Optional[T],
+    count: int,
+    values: List[T],
+) -> T:
+    if get_attribute(function, ENUM_COPY_VALUES, False):
+        return function(name, start, count, values.copy())
+
+    return function(name, start, count, SequenceView(values))
+
+
 ATTEMPT_TO_REUSE = "attempt to reuse name {}"
 ALREADY_DEFINED = "name {} is already defined"
 CAN_NOT_USE_AUTO = "can not use `auto` because `enum_generate_next_value` is not defined"
@@ -159,6 +267,9 @@ class EnumDict(Namespace):
     def _set_generate_next_value(
         self, generate_next_value: Optional[GenerateNextValue[Any]]
     ) -> None:
+        if is_instance(generate_next_value, staticmethod):  # defined in the enumeration body
+            generate_next_value = generate_next_value.__func__
+
         self._generate_next_value = generate_next_value
 
     def _set_start(self, start: Optional[Any]) -> None:
@@ -200,8 +311,12 @@ class EnumDict(Namespace):
                 if generate_next_value is None:
                     raise RuntimeError(CAN_NOT_USE_AUTO)
 
-                value.value = generate_next_value(
-                    name, self.start, len(self.member_names), self.member_values.copy()
+                value.value = call_generate_next_value(
+                    generate_next_value,
+                    name,
+                    self.start,
+                    len(self.member_names),
+                    self.member_values,
                 )
 
             value = value.value
@@ -371,22 +486,286 @@ def find_enum_type(bases: DynamicTuple[AnyType]) -> Optional[AnyType]:
     return enum_type
 
 
-def create_enum_member(
+DYNAMIC_ATTRIBUTES: MutableMapping[AnyType, FrozenSet[str]] = WeakKeyDictionary()
+
+
+def find_own_dynamic_attributes(type: AnyType) -> FrozenSet[str]:
+    # bases are not expected to gain dynamic attributes after creation, so we can cache them
+    try:
+        return DYNAMIC_ATTRIBUTES[type]
+
+    except KeyError:
+        pass
+
+    own_dynamic_attributes = frozenset(
+        name for name, value in vars(type).items() if is_instance(value, dynamic_attribute)
+    )
+
+    DYNAMIC_ATTRIBUTES[type] = own_dynamic_attributes
+
+    return own_dynamic_attributes
+
+
+def find_dynamic_attributes(type: AnyType) -> Set[str]:
+    return set().union(*map(find_own_dynamic_attributes, type.__mro__))
+
+
+def find_body_names(enum_type: Type[Enum]) -> Set[str]:
+    # names defined in the body of the enumeration, except for members and the documentation;
+    # the same enumeration without the body is created to find the names added implicitly
+    meta = standard_type(enum_type)
+
+    name = get_name(enum_type)
+    bases = enum_type._bases
+
+    plain_type = meta(name, bases, meta.__prepare__(name, bases), compact=enum_type._compact)
+
+    plain_type._restore_state(enum_type._snapshot_state())
+
+    body_names = set(vars(enum_type)).difference(vars(plain_type), enum_type._member_mapping)
+
+    body_names.discard(DOCUMENTATION)
+
+    # types are kept alive by reference cycles, so collect the plain one right away;
+    # otherwise it shows up among subclasses (and memory reports) until the next collection
+    del plain_type
+
+    collect_garbage()
+
+    return body_names
+
+
+EXPECTED_MEMBER = "expected {} member, got {}"
+EXPECTED_NAMED_MEMBER = "expected named {} member, got {}"
+
+
+def find_ordinal(enum_type: Type[EnumT], member: EnumT) -> int:
+    # ordinals are positions of canonical members in definition order,
+    # so unnamed (pseudo) members and flag aliases do not have them
+    if not is_instance(member, enum_type):
+        raise TypeError(
+            EXPECTED_MEMBER.format(tick(get_name(enum_type)), tick(get_name(type(member))))
+        )
+
+    ordinal = member._sort_order
+
+    member_names = enum_type._member_names
+
+    if ordinal >= len(member_names) or member_names[ordinal] != member.__enum_name__:
+        raise ValueError(EXPECTED_NAMED_MEMBER.format(tick(get_name(enum_type)), repr(member)))
+
+    return ordinal
+
+
+CAN_NOT_COMBINE = "can not combine {} of {} with {} of {}"
+
+ENUM_CONTAINER = "{}({}, {{{}}})"
+EMPTY_ENUM_CONTAINER = "{}({})"
+ENUM_CONTAINER_ITEM = "{}: {}"
+
+
+class EnumContainer(Generic[EnumT]):
+    # the base of containers indexed by ordinals; only named canonical members
+    # (the ones that are iterated over) have ordinals, so only they can be stored
+
+    _enum_type: Type[EnumT]
+
+    @property
+    def enum_type(self) -> Type[EnumT]:
+        """The [`Enum`][enum_extensions.enums.Enum] type members of which are stored."""
+        return self._enum_type
+
+    def ordinal_of(self, member: EnumT) -> int:
+        return find_ordinal(self._enum_type, member)
+
+    def member_of(self, ordinal: int) -> EnumT:
+        return self._enum_type.by_ordinal(ordinal)
+
+    def check_combine(self, other: EnumContainer[Any]) -> None:
+        enum_type = self._enum_type
+        other_enum_type = other._enum_type
+
+        if other_enum_type is not enum_type:
+            raise ValueError(
+                CAN_NOT_COMBINE.format(
+                    get_name(type(self)),
+                    tick(get_name(enum_type)),
+                    get_name(type(other)),
+                    tick(get_name(other_enum_type)),
+                )
+            )
+
+
+def represent_container(container: EnumContainer[Any], item_representations: Iterable[str]) -> str:
+    name = get_name(type(container))
+    enum_name = get_name(container._enum_type)
+
+    items = concat_comma_space(item_representations)
+
+    if not items:
+        return EMPTY_ENUM_CONTAINER.format(name, enum_name)
+
+    return ENUM_CONTAINER.format(name, enum_name, items)
+
+
+def get_caller_module(depth: int) -> Optional[str]:
+    # TODO: replace the frame hack if a blessed way to know the calling
+    # module is ever developed
+    try:
+        return get_frame(depth + 1).f_globals[NAME]  # type: ignore
+
+    except (AttributeError, ValueError, KeyError):  # pragma: no cover
+        return None
+
+
+def iter_row_items(
+    rows: Iterable[List[str]], convert: Optional[Unary[str, Any]] = None
+) -> Iterator[Union[str, Tuple[str, Any]]]:
+    for row in rows:
+        if not row:  # skip empty lines
+            continue
+
+        name, *values = row
+
+        if convert is not None:
+            values = list(map(convert, values))
+
+        if not values:
+            yield name
+
+        elif len(values) == 1:
+            (value,) = values
+
+            yield (name, value)
+
+        else:
+            yield (name, tuple(values))
+
+
+class AutoKey(Singleton):
+    pass
+
+
+auto_key = AutoKey()
+
+ENUM_CACHE_SIZE = 256
+
+ENUM_CACHE: OrderedDict[Any, AnyType] = OrderedDict()
+ENUM_CACHE_LOCK = "enum_cache"
+
+
+def freeze_names(names: Optional[Names]) -> Optional[DynamicTuple[Any]]:
+    # names are consumed once, so they can be used both in the key and to create the enumeration
+    if names is None:
+        return None
+
+    if is_string(names):
+        names = names.replace(COMMA, SPACE).strip().split()
+
+    if is_mapping(names):
+        names = names.items()
+
+    return tuple(name if is_string(name) else tuple(name) for name in names)
+
+
+def freeze_value(value: Any) -> Any:
+    if is_auto(value):
+        value = value.value
+
+        if is_null(value):
+            return auto_key
+
+    return (standard_type(value), value)  # so that values like `1` and `True` are different
+
+
+def freeze_item(item: Union[str, Tuple[str, Any]]) -> Any:
+    if is_string(item):
+        return item
+
+    name, value = item
+
+    return (name, freeze_value(value))
+
+
+def freeze_items(items: Iterable[Union[str, Tuple[str, Any]]]) -> DynamicTuple[Any]:
+    return tuple(map(freeze_item, items))
+
+
+def find_or_create_enum(key: Any, factory: Nullary[ET]) -> ET:
+    try:
+        hash(key)
+
+    except TypeError:  # unhashable specifications are not cached
+        return factory()
+
+    with find_lock(ENUM_CACHE_LOCK):
+        cached = ENUM_CACHE.get(key)
+
+        if cached is not None:
+            ENUM_CACHE.move_to_end(key)
+
+            return cached  # type: ignore
+
+    created = factory()  # creation is slow, so it happens outside of the lock
+
+    with find_lock(ENUM_CACHE_LOCK):
+        # if another thread has created the same enumeration in the meantime, prefer it
+        enum_type = ENUM_CACHE.setdefault(key, created)  # type: ignore
+
+        ENUM_CACHE.move_to_end(key)
+
+        while len(ENUM_CACHE) > ENUM_CACHE_SIZE:
+            ENUM_CACHE.popitem(last=False)
+
+    return enum_type  # type: ignore
+
+
+def create_cached_enum(
+    enum_base: ET,
+    enum_name: str,
+    names: Optional[Names],
+    module: Optional[str],
+    members: StringDict[Any],
+    keywords: StringDict[Any],
+) -> ET:
+    frozen_names = freeze_names(names)
+
+    key = (
+        enum_base,
+        enum_name,
+        freeze_items(frozen_names or ()),
+        freeze_items(members.items()),
+        module,
+        *keywords.items(),
+    )
+
+    return find_or_create_enum(
+        key,
+        lambda: enum_base.create(  # type: ignore
+            enum_name, frozen_names, module=module, **keywords, **members
+        ),
+    )
+
+
+def clear_enum_cache() -> None:
+    """Clears the cache of enumerations created with `cached=True`.
+
+    See [`EnumType.create`][enum_extensions.enums.EnumType.create] for more information.
+    """
+    with find_lock(ENUM_CACHE_LOCK):
+        ENUM_CACHE.clear()
+
+
+def new_enum_member(
     name: Optional[str],
     value: Any,
     data_type: AnyType,
     enum_type: Type[EnumT],
     new_function: DynamicCallable[Any],
     new_use_args: bool,
-    dynamic_attributes: Set[str],
-    flag: bool = False,
 ) -> EnumT:
     # handle value and initialization
 
-    if name is not None:
-        if name in enum_type._member_mapping:
-            raise ValueError(ATTEMPT_TO_REUSE.format(tick(name)))
-
     if is_tuple(value):  # do nothing if value is a tuple
         args = value
 
@@ -411,13 +790,36 @@ def create_enum_member(
         if not has_attribute(member, ENUM_VALUE):  # if the value was not defined previously
             member.__enum_value__ = value
 
-    enum_type._member_values.append(value)
-
     member.__enum_name__ = name
     member.__enum_type__ = enum_type
     member.__init__(*args)
 
-    member._sort_order = len(member._member_names)  # for sorting by definition
+    return member
+
+
+def create_enum_member(
+    name: Optional[str],
+    value: Any,
+    data_type: AnyType,
+    enum_type: Type[EnumT],
+    new_function: DynamicCallable[Any],
+    new_use_args: bool,
+    dynamic_attributes: Set[str],
+    flag: bool = False,
+) -> EnumT:
+    if name is not None:
+        if name in enum_type._member_mapping:
+            raise ValueError(ATTEMPT_TO_REUSE.format(tick(name)))
+
+    member = new_enum_member(name, value, data_type, enum_type, new_function, new_use_args)
+
+    member_names = enum_type._member_names
+
+    count = len(member_names)
+
+    enum_type._member_values.append(value)
+
+    member._sort_order = len(enum_type._member_names)  # for sorting by definition
 
     try:
         canonical_member = enum_type._value_mapping.get(value)
@@ -457,9 +859,10 @@ def create_enum_member(
                     enum_type._member_names.append(name)
 
     if name is not None:
-        # boost performance for any member that would not shadow dynamic attributes
+        # boost performance for any member that would not shadow dynamic attributes;
+        # reassignment checks are not needed, since the name is known to be unused
         if name not in dynamic_attributes:
-            set_attribute(enum_type, name, member)
+            standard_type.__setattr__(enum_type, name, member)
 
         # now add to member mapping
         enum_type._member_mapping[name] = member
@@ -472,18 +875,151 @@ def create_enum_member(
     except TypeError:
         pass
 
+    if name is not None:  # pseudo members do not change names, lookups or iteration
+        standard_type.__setattr__(enum_type, GENERATION_PRIVATE, enum_type._generation + 1)
+
+    if len(member_names) > count:  # only named canonical members are iterated over
+        standard_type.__setattr__(
+            enum_type, CANONICAL_GENERATION_PRIVATE, enum_type._canonical_generation + 1
+        )
+
     return member  # return newly created member in case someone needs to use it
 
 
+def defer_enum_member(
+    name: str,
+    value: Any,
+    data_type: AnyType,
+    enum_type: Type[EnumT],
+    new_function: DynamicCallable[Any],
+    new_use_args: bool,
+    dynamic_attributes: Set[str],
+) -> None:
+    # only record the member, leaving creation to the first access
+    lazy_names = enum_type._lazy_names
+
+    if name in lazy_names:
+        raise ValueError(ATTEMPT_TO_REUSE.format(tick(name)))
+
+    try:
+        index = enum_type._lazy_values.get(value)
+
+    except TypeError:  # not hashable, so the member can not be found lazily; create it right away
+        create_enum_member(
+            name, value, data_type, enum_type, new_function, new_use_args, dynamic_attributes
+        )
+
+    else:
+        if index is None and value not in enum_type._value_mapping:  # new canonical member
+            enum_type._lazy_values[value] = len(enum_type._member_names)
+            enum_type._member_names.append(name)
+
+            standard_type.__setattr__(
+                enum_type, CANONICAL_GENERATION_PRIVATE, enum_type._canonical_generation + 1
+            )
+
+        enum_type._member_values.append(value)
+
+        standard_type.__setattr__(enum_type, GENERATION_PRIVATE, enum_type._generation + 1)
+
+    lazy_names[name] = value  # record every name, in definition order
+
+
+class EnumTransaction:
+    # records the state of the enumeration, restoring it if adding members fails
+    def __init__(self, enum_type: Type[Enum]) -> None:
+        self.enum_type = enum_type
+
+        self.member_names_length = len(enum_type._member_names)
+        self.member_values_length = len(enum_type._member_values)
+
+        self.member_mapping = enum_type._member_mapping.copy()
+        self.value_mapping = enum_type._value_mapping.copy()
+
+        self.lazy_names = enum_type._lazy_names.copy()
+        self.lazy_values = enum_type._lazy_values.copy()
+
+        self.unnamed = [
+            member for member in self.value_mapping.values() if member.__enum_name__ is None
+        ]
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(
+        self,
+        error_type: Optional[Type[BaseException]],
+        error: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if error is not None:
+            self.rollback()
+
+    def rollback(self) -> None:
+        enum_type = self.enum_type
+
+        del enum_type._member_names[self.member_names_length :]
+        del enum_type._member_values[self.member_values_length :]
+
+        member_mapping = enum_type._member_mapping
+        namespace = vars(enum_type)
+
+        for name in member_mapping.keys() - self.member_mapping.keys():
+            if name in namespace and namespace[name] is member_mapping[name]:
+                standard_type.__delattr__(enum_type, name)
+
+        replace_items(member_mapping, self.member_mapping)
+        replace_items(enum_type._value_mapping, self.value_mapping)
+
+        replace_items(enum_type._lazy_names, self.lazy_names)
+        replace_items(enum_type._lazy_values, self.lazy_values)
+
+        for member in self.unnamed:  # pseudo-members might have been given names
+            member.__enum_name__ = None
+
+        # members might have been replaced by other ones
+        enum_type._generation += 1
+        enum_type._canonical_generation += 1
+        enum_type._clear_member_strings()
+
+        enum_type._finalize_members()  # recompute derived state from the restored members
+
+
+def replace_items(mapping: MutableMapping[K, V], items: Mapping[K, V]) -> None:
+    mapping.clear()
+    mapping.update(items)
+
+
 INVALID_MEMBER_NAMES = "invalid member names: {}"
+CAN_NOT_CACHE_STREAMED = "can not cache enumerations with streamed members"
+LAZY_FLAGS = "flags can not be lazy"
+CAN_NOT_COMPACT = "can not make enumerations of variable-size {} compact"
+COMPACT_REQUIRES_SLOTS = "compact {} requires all bases to define `__slots__`"
 CAN_NOT_DELETE_MEMBER = "can not delete enum member: {}"
 CAN_NOT_REASSIGN_MEMBER = "can not reassign enum member: {}"
+NEGATIVE_ORDINAL = "expected non-negative ordinal, got {}"
 
 ENUM_REPRESENTATION = "<enum {}>"
 QUALIFIED_NAME_STRING = "{}.{}"
 
 UNKNOWN = "UNKNOWN"
 
+CACHED = "cached"
+
+MEMBERS = "members"
+PSEUDO_MEMBERS = "pseudo_members"
+MEMBER_NAMES = "member_names"
+MEMBER_VALUES = "member_values"
+MEMBER_MAPPING = "member_mapping"
+VALUE_MAPPING = "value_mapping"
+LAZY_NAMES = "lazy_names"
+LAZY_VALUES = "lazy_values"
+MEMBER_STRINGS = "member_strings"
+MEMBER_REPRESENTATIONS = "member_representations"
+CANONICAL_MEMBERS = "canonical_members"
+CANONICAL_NAMES = "canonical_names"
+UNKNOWN_MEMBERS = "unknown_members"
+
 
 class EnumType(type):
     """Metaclass for [`Enum`][enum_extensions.enums.Enum].
@@ -493,8 +1029,10 @@ class EnumType(type):
     properly handling duplicates, providing iteration over the enumeration members, etc.
     """
 
-    _unknown: bool
+    _unknown: Union[bool, UnknownPolicy]
+    _unknown_members: WeakValueDictionary[Any, Enum]
     _flag: bool
+    _bases: DynamicTuple[AnyType]
     _start: Optional[Any]
     _member_names: List[str]
     _member_values: List[Any]
@@ -503,7 +1041,20 @@ class EnumType(type):
     _new_use_args: bool
     _member_mapping: StringDict[Enum]
     _value_mapping: Dict[Any, Enum]
+    _members_view: StringMapping[Enum]
+    _canonical_members: DynamicTuple[Enum]
+    _canonical_members_generation: int
+    _canonical_names: DynamicTuple[str]
+    _canonical_names_generation: int
+    _generation: int
+    _canonical_generation: int
+    _member_strings: StringDict[str]
+    _member_representations: StringDict[str]
     _dynamic_attributes: Set[str]
+    _compact: bool
+    _lazy: bool
+    _lazy_names: StringDict[Any]
+    _lazy_values: Dict[Any, int]
 
     @classmethod
     def __prepare__(
@@ -513,8 +1064,10 @@ class EnumType(type):
         *,
         ignore: Optional[MaybeIterable[str]] = None,
         start: Optional[Any] = None,
-        unknown: Optional[bool] = None,
+        unknown: Optional[Union[bool, UnknownPolicy]] = None,
         flag: bool = False,
+        lazy: bool = False,
+        compact: Optional[bool] = None,
         **kwargs: Any,
     ) -> EnumDict:
         namespace = EnumDict()
@@ -540,12 +1093,17 @@ class EnumType(type):
         *,
         ignore: Optional[MaybeIterable[str]] = None,
         start: Optional[Any] = None,
-        unknown: Optional[bool] = None,
+        unknown: Optional[Union[bool, UnknownPolicy]] = None,
         flag: bool = False,
+        lazy: bool = False,
+        compact: Optional[bool] = None,
         **kwargs: Any,
     ) -> ET:
         global ENUM_DEFINED
 
+        if lazy and flag:
+            raise TypeError(LAZY_FLAGS)
+
         # add `enum_ignore` to itself
         enum_ignore = namespace.ignore
         enum_ignore.add(ENUM_IGNORE)
@@ -589,19 +1147,13 @@ class EnumType(type):
                 if not pickle_methods:
                     make_namespace_unpicklable(namespace)
 
-        # create dummy enum type
+        original_bases = bases  # bases are linearized below, so keep the ones given
 
-        dummy_enum_type = super().__new__(cls, enum_name, bases, EnumDict())
+        # compute Method Resolution Order (MRO) without creating the type
 
-        # manipulate Method Resolution Order (MRO)
-
-        mro = list(dummy_enum_type.mro())
-
-        try:
-            mro.remove(dummy_enum_type)
+        mro = linearize(bases)
 
-        except ValueError:  # pragma: no cover
-            pass
+        # manipulate Method Resolution Order (MRO)
 
         try:
             if mro.index(data_type) < mro.index(enum_type):
@@ -614,62 +1166,108 @@ class EnumType(type):
 
         bases = tuple(mro)  # now back to tuple
 
-        # create new enum type
-        new_enum_type = super().__new__(cls, enum_name, bases, namespace)
-
         # on top of it, preserve names that should ideally belong to enums
         for name in ENUM_PRESERVE:
             if name in namespace:
                 continue
 
-            type_method = get_attribute(new_enum_type, name)
             data_method = get_attribute(data_type, name, None)
-            enum_method = get_attribute(enum_type, name, None)
-
-            if data_method is not None and data_method is type_method:
-                set_attribute(new_enum_type, name, enum_method)
-
-        # add information
-        new_enum_type._flag = flag
-        new_enum_type._start = namespace.start
-        new_enum_type._member_names = []
-        new_enum_type._member_values = []
-        new_enum_type._data_type = data_type
-        new_enum_type._new_function = new.function
-        new_enum_type._new_use_args = new.use_args
 
-        # add mappings
-        new_enum_type._member_mapping = {}  # name -> member
-        new_enum_type._value_mapping = {}  # value -> member (if hashable)
+            if data_method is not None and data_method is lookup_attribute(mro, name):
+                namespace[name] = get_attribute(enum_type, name, None)
 
         if unknown is None:
-            unknown = get_attribute(new_enum_type, UNKNOWN_PRIVATE, False)
+            unknown = lookup_attribute(mro, UNKNOWN_PRIVATE, False)
+
+        inherited_compact = lookup_attribute(mro, COMPACT_PRIVATE, False)
+
+        if compact is None:
+            compact = inherited_compact
+
+        if compact:
+            if data_type.__itemsize__:  # variable-size types can not have non-empty slots
+                raise TypeError(CAN_NOT_COMPACT.format(tick(get_name(data_type))))
+
+            slots = namespace.get(SLOTS, ())
+
+            if is_string(slots):
+                slots = (slots,)
+
+            # member slots are only needed once, along the inheritance chain
+            if not inherited_compact:
+                slots = tuple(slots) + MEMBER_SLOTS
+
+            dict.__setitem__(namespace, SLOTS, slots)
+
+        member_mapping: StringDict[Any] = {}
+
+        # add information, bypassing member checks since the namespace is already processed
+        dict.update(
+            namespace,
+            _flag=flag,
+            _bases=original_bases,
+            _start=namespace.start,
+            _member_names=[],
+            _member_values=[],
+            _data_type=data_type,
+            _new_function=new.function,
+            _new_use_args=new.use_args,
+            _member_mapping=member_mapping,  # name -> member
+            _value_mapping={},  # value -> member (if hashable)
+            _members_view=MappingProxy(member_mapping),  # reflects changes, so created once
+            _generation=0,  # incremented whenever named members are added
+            _canonical_generation=0,  # incremented whenever canonical members are added
+            # views of canonical members and names, along with generations they were created at
+            _canonical_members=(),
+            _canonical_members_generation=0,
+            _canonical_names=(),
+            _canonical_names_generation=0,
+            _member_strings={},  # name -> str (of named members)
+            _member_representations={},  # name -> repr (of named members)
+            _unknown=unknown,
+            _unknown_members=WeakValueDictionary(),  # value -> ephemeral unknown member
+            _compact=compact,
+            _lazy=lazy,
+            _lazy_names={},  # name -> value (all names, in definition order)
+            _lazy_values={},  # value -> index of the canonical name (if not created yet)
+        )
+
+        # create new enum type
+        new_enum_type = super().__new__(cls, enum_name, bases, namespace)
 
-        new_enum_type._unknown = unknown
+        if compact and new_enum_type.__dictoffset__:  # some base does not define slots
+            raise TypeError(COMPACT_REQUIRES_SLOTS.format(tick(enum_name)))
 
         # save dynamic attributes to know if we an take the shortcut of
         # storing members in the type dict
-        dynamic_attributes = {
-            name
-            for type in new_enum_type.mro()
-            for name, value in vars(type).items()
-            if is_instance(value, dynamic_attribute)
-        }
+        dynamic_attributes = find_dynamic_attributes(new_enum_type)
 
         new_enum_type._dynamic_attributes = dynamic_attributes
 
-        # create fellow enum members
+        # create fellow enum members (or only record them, if lazy)
         for name, value in enum_members.items():
-            create_enum_member(
-                name,
-                value,
-                data_type,
-                new_enum_type,
-                new.function,
-                new.use_args,
-                dynamic_attributes,
-                flag,
-            )
+            if lazy:
+                defer_enum_member(
+                    name,
+                    value,
+                    data_type,
+                    new_enum_type,
+                    new.function,
+                    new.use_args,
+                    dynamic_attributes,
+                )
+
+            else:
+                create_enum_member(
+                    name,
+                    value,
+                    data_type,
+                    new_enum_type,
+                    new.function,
+                    new.use_args,
+                    dynamic_attributes,
+                    flag,
+                )
 
         # save new if needed
         if ENUM_DEFINED:
@@ -697,7 +1295,10 @@ class EnumType(type):
         qualified_name: Optional[str] = ...,
         type: Optional[AnyType] = ...,
         start: Optional[Any] = ...,
-        unknown: Optional[bool] = ...,
+        unknown: Optional[Union[bool, UnknownPolicy]] = ...,
+        lazy: bool = ...,
+        compact: Optional[bool] = ...,
+        cached: bool = ...,
         **members: Any,
     ) -> ET:
         ...
@@ -711,7 +1312,10 @@ class EnumType(type):
         qualified_name: Optional[str] = None,
         type: Optional[AnyType] = None,
         start: Optional[Any] = None,
-        unknown: Optional[bool] = None,
+        unknown: Optional[Union[bool, UnknownPolicy]] = None,
+        lazy: bool = False,
+        compact: Optional[bool] = None,
+        cached: bool = False,
         **members: Any,
     ) -> Union[E, Type[E]]:
         """Looks up an existing member or creates a new enumeration.
@@ -738,9 +1342,17 @@ class EnumType(type):
             type: A data type of the new [`Enum`][enum_extensions.enums.Enum].
             start: The initial value of the new enumeration
                 (used by [`auto`][enum_extensions.auto.auto]).
-            unknown: Whether to enable unknown values of enumeration members.
+            unknown: Whether to enable unknown values of enumeration members,
+                or the [`UnknownPolicy`][enum_extensions.enums.UnknownPolicy] to use
+                ([`True`][True] means [`REGISTER`][enum_extensions.enums.UnknownPolicy.REGISTER]).
                 [`None`][None] means that it should be inherited.
                 The default value in the end is [`False`][False].
+            lazy: Whether to create members on first access only.
+            compact: Whether to store member attributes in slots instead of dictionaries.
+                [`None`][None] means it should be inherited.
+                The default value in the end is [`False`][False].
+            cached: Whether to return the previously created enumeration
+                if the specification is the same.
             **members: A `name -> value` mapping of [`Enum`][enum_extensions.enums.Enum] members.
 
         Raises:
@@ -750,7 +1362,18 @@ class EnumType(type):
         Returns:
             A newly created [`Enum`][enum_extensions.enums.Enum] type or a member found.
         """
-        if names or module or qualified_name or type or start or unknown or members:
+        if (
+            names
+            or module
+            or qualified_name
+            or type
+            or start
+            or unknown
+            or lazy
+            or compact
+            or cached
+            or members
+        ):
             return self.create(
                 value,
                 names,
@@ -759,120 +1382,528 @@ class EnumType(type):
                 type=type,
                 start=start,
                 unknown=unknown,
+                lazy=lazy,
+                compact=compact,
+                cached=cached,
                 direct_call=False,
                 **members,
             )
 
-        return self.__new__(self, value)
+        return self.__new__(self, value)
+
+    def create(
+        self: ET,
+        enum_name: str,
+        names: Optional[Names] = None,
+        *,
+        module: Optional[str] = None,
+        qualified_name: Optional[str] = None,
+        type: Optional[AnyType] = None,
+        start: Optional[Any] = None,
+        unknown: Optional[Union[bool, UnknownPolicy]] = None,
+        lazy: bool = False,
+        compact: Optional[bool] = None,
+        cached: bool = False,
+        direct_call: bool = True,
+        **members: Any,
+    ) -> ET:
+        """Creates a new enumeration.
+
+        Example:
+            ```python
+            Color = Enum("Color", ("RED", "GREEN", "BLUE"))
+            ```
+
+        When `cached` is [`True`][True], enumerations are memoized on their specification
+        (the base, the name, the names and values, along with other arguments), so that
+        creating the same enumeration again returns the previously created one.
+        Only the most recently used enumerations are kept; specifications with unhashable
+        values are never cached. Since cached enumerations are shared, they should not be mutated.
+
+        Arguments:
+            enum_name: The name of the new [`Enum`][enum_extensions.enums.Enum] to create.
+            names: The names/values of the new enumeration members.
+            module: The name of the module the [`Enum`][enum_extensions.enums.Enum] is created in.
+            qualified_name: The actual location in the module where the enumeration can be found.
+            type: A data type of the new [`Enum`][enum_extensions.enums.Enum].
+            start: The initial value of the new enumeration
+                (used by [`auto`][enum_extensions.auto.auto]).
+            unknown: Whether to enable unknown values of enumeration members,
+                or the [`UnknownPolicy`][enum_extensions.enums.UnknownPolicy] to use
+                ([`True`][True] means [`REGISTER`][enum_extensions.enums.UnknownPolicy.REGISTER]).
+                [`None`][None] means that it should be deduced from inheritance.
+                The default value in the end is [`False`][False].
+            lazy: Whether to create members on first access only.
+            compact: Whether to store member attributes in slots instead of dictionaries.
+                [`None`][None] means it should be inherited.
+                The default value in the end is [`False`][False].
+            cached: Whether to return the previously created enumeration
+                if the specification is the same.
+            direct_call: Controls if the function is called directly or not.
+                Use this argument with caution.
+            **members: A `name -> value` mapping of [`Enum`][enum_extensions.enums.Enum] members.
+
+        Raises:
+            ValueError: The name is already used by another member.
+
+        Returns:
+            A newly created (or cached) [`Enum`][enum_extensions.enums.Enum] type.
+        """
+        if cached:
+            if module is None:
+                module = get_caller_module(DIRECT_CALLER if direct_call else NESTED_CALLER)
+
+            keywords = dict(
+                qualified_name=qualified_name,
+                type=type,
+                start=start,
+                unknown=unknown,
+                lazy=lazy,
+                compact=compact,
+            )
+
+            return create_cached_enum(self, enum_name, names, module, members, keywords)
+
+        meta = standard_type(self)
+
+        bases = (self,) if type is None else (type, self)
+
+        enum_type = find_enum_type(bases)
+
+        namespace = meta.__prepare__(
+            enum_name, bases, start=start, unknown=unknown, lazy=lazy, compact=compact
+        )
+
+        if names is not None:
+            # special processing needed for strings
+            if is_string(names):
+                names = names.replace(COMMA, SPACE).strip().split()
+
+            if is_mapping(names):
+                namespace.update(names)
+
+            else:
+                iterator = iter(names)
+
+                item = next(iterator, null)
+
+                if is_not_null(item):
+                    iterator = prepend(item, iterator)
+
+                if is_string(item):
+                    original_names, names = names, []
+                    values: List[Any] = []
+
+                    generate_next_value = enum_type.enum_generate_next_value
+
+                    for count, name in enumerate(original_names):
+                        value = call_generate_next_value(
+                            generate_next_value, name, start, count, values
+                        )
+
+                        values.append(value)
+
+                        names.append((name, value))
+
+                    iterator = iter(names)
+
+                namespace.update(iterator)
+
+        namespace.update(members)
+
+        if module is None:
+            module = get_caller_module(DIRECT_CALLER if direct_call else NESTED_CALLER)
+
+        if module is None:  # pragma: no cover
+            make_namespace_unpicklable(namespace)
+
+        else:
+            namespace[MODULE] = module
+
+        if qualified_name is None:
+            if module is not None:
+                qualified_name = QUALIFIED_NAME_STRING.format(module, enum_name)
+
+        if qualified_name is not None:
+            namespace[QUALIFIED_NAME] = qualified_name
+
+        return meta.__new__(
+            meta, enum_name, bases, namespace, unknown=unknown, lazy=lazy, compact=compact
+        )
+
+    def build(
+        self: ET,
+        enum_name: str,
+        items: Iterable[Union[str, Tuple[str, Any]]],
+        *,
+        module: Optional[str] = None,
+        progress: Optional[Progress] = None,
+        every: int = DEFAULT_EVERY,
+        direct_call: bool = True,
+        **keywords: Any,
+    ) -> ET:
+        """Creates a new enumeration, streaming members from the `items`.
+
+        Unlike [`create`][enum_extensions.enums.EnumType.create], the items are not staged
+        in the class namespace; instead, members are created one by one, straight from the iterable,
+        which makes this method suitable for building enumerations with lots of members.
+
+        Example:
+            ```python
+            Color = Enum.build("Color", [("RED", 1), ("GREEN", 2), ("BLUE", 3)])
+            ```
+
+        Arguments:
+            enum_name: The name of the new [`Enum`][enum_extensions.enums.Enum] to create.
+            items: The `(name, value)` pairs of the new enumeration members.
+                Names on their own are given [`auto`][enum_extensions.auto.auto] values.
+            module: The name of the module the [`Enum`][enum_extensions.enums.Enum] is created in.
+            progress: The `(count, elapsed)` callback to report progress to,
+                called every `every` members and once all members are created
+                (if the final count has not been reported already).
+            every: How often to report progress, in members.
+            direct_call: Controls if the function is called directly or not.
+                Use this argument with caution.
+            **keywords: Keyword arguments to pass to
+                [`create`][enum_extensions.enums.EnumType.create], except for `cached`.
+
+        Raises:
+            TypeError: `cached` is given, since members are added to the created enumeration.
+            ValueError: The name is invalid or is already used by another member.
+
+        Returns:
+            A newly created [`Enum`][enum_extensions.enums.Enum] type.
+        """
+        if CACHED in keywords:
+            raise TypeError(CAN_NOT_CACHE_STREAMED)
+
+        start_time = perf_counter()
+
+        if module is None:
+            module = get_caller_module(DIRECT_CALLER if direct_call else NESTED_CALLER)
+
+        enum_type = self.create(enum_name, module=module, **keywords)
+
+        data_type = enum_type._data_type
+        new_function = enum_type._new_function
+        new_use_args = enum_type._new_use_args
+        dynamic_attributes = enum_type._dynamic_attributes
+        flag = enum_type._flag
+        lazy = enum_type._lazy
+
+        start = enum_type._start
+        member_names = enum_type._member_names
+        member_values = enum_type._member_values
+
+        generate_next_value = enum_type.enum_generate_next_value
+
+        count = 0
+
+        for item in items:
+            if is_string(item):
+                name, value = item, auto()
+
+            else:
+                name, value = item
+
+            if name in INVALID_NAMES or is_double_under_name(name):
+                raise ValueError(INVALID_MEMBER_NAMES.format(tick(name)))
+
+            if is_auto(value):
+                if is_null(value.value):
+                    value.value = call_generate_next_value(
+                        generate_next_value, name, start, len(member_names), member_values
+                    )
+
+                value = value.value
+
+            if lazy:
+                defer_enum_member(
+                    name,
+                    value,
+                    data_type,
+                    enum_type,
+                    new_function,
+                    new_use_args,
+                    dynamic_attributes,
+                )
+
+            else:
+                create_enum_member(
+                    name,
+                    value,
+                    data_type,
+                    enum_type,
+                    new_function,
+                    new_use_args,
+                    dynamic_attributes,
+                    flag,
+                )
+
+            count += 1
 
-    def create(
+            if progress is not None and not count % every:
+                progress(count, perf_counter() - start_time)
+
+        enum_type._finalize_members()
+
+        # report the final count once, unless the last periodic report was exactly that
+        if progress is not None and (count % every or not count):
+            progress(count, perf_counter() - start_time)
+
+        return enum_type
+
+    def load(
         self: ET,
         enum_name: str,
-        names: Optional[Names] = None,
+        file: Union[AnyPath, IO[str]],
         *,
+        delimiter: str = COMMA,
+        convert: Optional[Unary[str, Any]] = None,
+        header: bool = False,
         module: Optional[str] = None,
-        qualified_name: Optional[str] = None,
-        type: Optional[AnyType] = None,
-        start: Optional[Any] = None,
-        unknown: Optional[bool] = None,
         direct_call: bool = True,
-        **members: Any,
+        **keywords: Any,
     ) -> ET:
-        """Creates a new enumeration.
+        """Creates a new enumeration from the CSV (or TSV) file, streaming its rows.
+
+        Each row contains the name of the member, optionally followed by its value.
+        Members without values are given [`auto`][enum_extensions.auto.auto] values,
+        and multiple values are combined into tuples.
 
         Example:
             ```python
-            Color = Enum("Color", ("RED", "GREEN", "BLUE"))
+            Currency = Enum.load("Currency", "currencies.tsv", delimiter=TAB)
             ```
 
         Arguments:
             enum_name: The name of the new [`Enum`][enum_extensions.enums.Enum] to create.
-            names: The names/values of the new enumeration members.
+            file: The path to the file or the text file itself.
+            delimiter: The delimiter of the columns.
+            convert: The function to convert values with.
+            header: Whether to skip the first row.
             module: The name of the module the [`Enum`][enum_extensions.enums.Enum] is created in.
-            qualified_name: The actual location in the module where the enumeration can be found.
-            type: A data type of the new [`Enum`][enum_extensions.enums.Enum].
-            start: The initial value of the new enumeration
-                (used by [`auto`][enum_extensions.auto.auto]).
-            unknown: Whether to enable unknown values of enumeration members.
-                [`None`][None] means that it should be deduced from inheritance.
-                The default value in the end is [`False`][False].
             direct_call: Controls if the function is called directly or not.
                 Use this argument with caution.
-            **members: A `name -> value` mapping of [`Enum`][enum_extensions.enums.Enum] members.
+            **keywords: Keyword arguments to pass to
+                [`build`][enum_extensions.enums.EnumType.build].
 
         Raises:
-            ValueError: The name is already used by another member.
+            TypeError: `cached` is given, since members are added to the created enumeration.
+            ValueError: The name is invalid or is already used by another member.
 
         Returns:
             A newly created [`Enum`][enum_extensions.enums.Enum] type.
         """
+        if CACHED in keywords:  # fail before opening the file
+            raise TypeError(CAN_NOT_CACHE_STREAMED)
 
-        meta = standard_type(self)
+        if module is None:
+            module = get_caller_module(DIRECT_CALLER if direct_call else NESTED_CALLER)
+
+        if is_instance(file, (str, PathLike)):
+            with open(file, newline=EMPTY, encoding=UTF_8) as opened:
+                return self.load(
+                    enum_name,
+                    opened,
+                    delimiter=delimiter,
+                    convert=convert,
+                    header=header,
+                    module=module,
+                    **keywords,
+                )
 
-        bases = (self,) if type is None else (type, self)
+        rows = reader(file, delimiter=delimiter)
 
-        enum_type = find_enum_type(bases)
+        if header:
+            next(rows, None)
 
-        namespace = meta.__prepare__(enum_name, bases, start=start, unknown=unknown)
+        return self.build(enum_name, iter_row_items(rows, convert), module=module, **keywords)
 
-        if names is not None:
-            # special processing needed for strings
-            if is_string(names):
-                names = names.replace(COMMA, SPACE).strip().split()
+    def _finalize_members(self) -> None:
+        pass
 
-            if is_mapping(names):
-                namespace.update(names)
+    def _snapshot_state(self) -> StringDict[Any]:
+        return {
+            UNKNOWN_PRIVATE: self._unknown,
+            START_PRIVATE: self._start,
+            COMPACT_PRIVATE: self._compact,
+        }
 
-            else:
-                iterator = iter(names)
+    def _restore_state(self, state: StringMapping[Any]) -> None:
+        for name, value in state.items():
+            set_attribute(self, name, value)
+
+    def _memory_structures(self) -> StringDict[Any]:
+        return {
+            MEMBER_NAMES: self._member_names,
+            MEMBER_VALUES: self._member_values,
+            MEMBER_MAPPING: self._member_mapping,
+            VALUE_MAPPING: self._value_mapping,
+            LAZY_NAMES: self._lazy_names,
+            LAZY_VALUES: self._lazy_values,
+            MEMBER_STRINGS: self._member_strings,
+            MEMBER_REPRESENTATIONS: self._member_representations,
+            CANONICAL_MEMBERS: self._canonical_members,
+            CANONICAL_NAMES: self._canonical_names,
+            UNKNOWN_MEMBERS: self._unknown_members,
+        }
 
-                item = next(iterator, null)
+    def _get_member(self: Type[E], name: str) -> E:
+        try:
+            return self._member_mapping[name]
 
-                if is_not_null(item):
-                    iterator = prepend(item, iterator)
+        except KeyError:
+            if name in self._lazy_names:
+                return self._materialize_member(name)
 
-                if is_string(item):
-                    original_names, names = names, []
-                    values = []
+            raise
 
-                    for count, name in enumerate(original_names):
-                        value = enum_type.enum_generate_next_value(
-                            name, start, count, values.copy()
-                        )
+    def _new_unknown_member(self: Type[E], value: Any) -> E:
+        member = new_enum_member(
+            None, value, self._data_type, self, self._new_function, self._new_use_args
+        )
 
-                        values.append(value)
+        member._sort_order = len(self._member_names)
 
-                        names.append((name, value))
+        return member
 
-                    iterator = iter(names)
+    def _find_unknown_member(self: Type[E], value: Any) -> E:
+        unknown_members = self._unknown_members
 
-                namespace.update(iterator)
+        try:
+            member = unknown_members.get(value)
 
-        namespace.update(members)
+        except TypeError:  # not hashable, so it can not be cached
+            return self._new_unknown_member(value)
+
+        if member is None:
+            member = self._new_unknown_member(value)
 
-        # TODO: replace the frame hack if a blessed way to know the calling
-        # module is ever developed
-        if module is None:
             try:
-                module = get_frame(DIRECT_CALLER if direct_call else NESTED_CALLER).f_globals[NAME]
+                # in order to support threading
+                member = unknown_members.setdefault(value, member)
 
-            except (AttributeError, ValueError, KeyError):  # pragma: no cover
+            except TypeError:  # can not be weakly referenced (for instance, `int` subclasses)
                 pass
 
-        if module is None:  # pragma: no cover
-            make_namespace_unpicklable(namespace)
+        return member
 
-        else:
-            namespace[MODULE] = module
+    def _materialize_member(self: Type[E], name: str) -> E:
+        with find_lock(LAZY_LOCK):
+            member_mapping = self._member_mapping
 
-        if qualified_name is None:
-            if module is not None:
-                qualified_name = QUALIFIED_NAME_STRING.format(module, enum_name)
+            if name in member_mapping:  # created by another thread in the meantime
+                return member_mapping[name]
 
-        if qualified_name is not None:
-            namespace[QUALIFIED_NAME] = qualified_name
+            value = self._lazy_names[name]
+
+            member = self._value_mapping.get(value)
+
+            if member is None:
+                index = self._lazy_values[value]
+
+                canonical_name = self._member_names[index]
+
+                if canonical_name == name:
+                    member = new_enum_member(
+                        name,
+                        value,
+                        self._data_type,
+                        self,
+                        self._new_function,
+                        self._new_use_args,
+                    )
+
+                    member._sort_order = index
+
+                    self._value_mapping[value] = member
+
+                    del self._lazy_values[value]
+
+                else:  # alias, so create the canonical member first
+                    member = self._materialize_member(canonical_name)
+
+            if name not in self._dynamic_attributes:  # bypass reassignment checks
+                standard_type.__setattr__(self, name, member)
+
+            member_mapping[name] = member
+
+            return member
+
+    def _materialize_value(self: Type[E], value: Any) -> E:
+        return self._get_member(self._member_names[self._lazy_values[value]])
+
+    def _materialize_members(self) -> None:
+        with find_lock(LAZY_LOCK):
+            member_mapping = self._member_mapping
+            lazy_names = self._lazy_names
+
+            for name in lazy_names:
+                self._get_member(name)
+
+            # restore the definition order, keeping the mapping itself
+            ordered = {name: member_mapping[name] for name in lazy_names}
+
+            member_mapping.clear()
+            member_mapping.update(ordered)
+
+            # everything is created, so the enumeration is now the same as the eager one
+            lazy_names.clear()
+
+            self._lazy = False
+
+    def _get_canonical_members(self: Type[E]) -> DynamicTuple[E]:
+        if self._canonical_members_generation != self._canonical_generation:
+            get_member = self._get_member
+
+            self._canonical_members = tuple(get_member(name) for name in self._member_names)
+
+            # creating lazy members might change the generation, so read it afterwards
+            self._canonical_members_generation = self._canonical_generation
+
+        return self._canonical_members  # type: ignore
+
+    def _get_canonical_names(self) -> DynamicTuple[str]:
+        if self._canonical_names_generation != self._canonical_generation:
+            self._canonical_names = tuple(self._member_names)
+            self._canonical_names_generation = self._canonical_generation
+
+        return self._canonical_names
+
+    def _clear_member_strings(self) -> None:
+        self._member_strings.clear()
+        self._member_representations.clear()
+
+    def by_ordinal(self: Type[E], ordinal: int) -> E:
+        """Finds the canonical member by its [`ordinal`][enum_extensions.enums.Enum.ordinal].
 
-        return meta.__new__(meta, enum_name, bases, namespace, unknown=unknown)
+        Example:
+            ```python
+            class Color(Enum):
+                RED = 1
+                GREEN = 2
+                BLUE = 3
+
+            assert Color.by_ordinal(1) is Color.GREEN
+            ```
+
+        Arguments:
+            ordinal: The ordinal of the member.
+
+        Raises:
+            IndexError: There is no member with the ordinal (negative ordinals included).
+
+        Returns:
+            The [`Enum`][enum_extensions.enums.Enum] member found.
+        """
+        if ordinal < 0:  # do not count from the end
+            raise IndexError(NEGATIVE_ORDINAL.format(ordinal))
+
+        if self._lazy:  # do not create all members
+            return self._get_member(self._member_names[ordinal])
+
+        return self._get_canonical_members()[ordinal]
 
     def is_empty(self) -> bool:
         """Checks whether the enumeration does not contain any members.
@@ -888,6 +1919,48 @@ class EnumType(type):
         """
         return not self._member_values
 
+    def memory_report(self) -> MemoryReport:
+        """Reports the memory footprint of the enumeration.
+
+        Members are included first (named ones, then pseudo-members), followed by
+        the structures holding them; members of lazy enumerations are not created.
+
+        Example:
+            ```python
+            report = Color.memory_report()
+
+            print(report.total)  # in bytes
+            ```
+
+        Returns:
+            The [`MemoryReport`][enum_extensions.memory.MemoryReport] of the enumeration.
+        """
+        named_members = {id(member): member for member in self._member_mapping.values()}
+
+        pseudo_members = {
+            id(member): member
+            for member in self._value_mapping.values()
+            if id(member) not in named_members
+        }
+
+        seen: Set[int] = set()
+
+        sizes = {
+            MEMBERS: sum(deep_size(member, seen) for member in named_members.values()),
+            PSEUDO_MEMBERS: sum(deep_size(member, seen) for member in pseudo_members.values()),
+        }
+
+        for name, structure in self._memory_structures().items():
+            sizes[name] = deep_size(structure, seen)
+
+        return MemoryReport(
+            self,
+            sizes,
+            members=len(named_members),
+            aliases=len(self._member_mapping) - len(named_members),
+            pseudo_members=len(pseudo_members),
+        )
+
     def add_member(self: Type[E], name: Optional[str], value: Any) -> E:
         """Adds a new member to the enumeration.
 
@@ -913,12 +1986,29 @@ class EnumType(type):
         """
         if is_auto(value):
             if is_null(value.value):
-                value.value = self.enum_generate_next_value(
-                    name, self._start, len(self._member_names), self._member_values.copy()
+                value.value = call_generate_next_value(
+                    self.enum_generate_next_value,
+                    name,
+                    self._start,
+                    len(self._member_names),
+                    self._member_values,
                 )
 
             value = value.value
 
+        if self._lazy and name is not None:
+            defer_enum_member(
+                name,
+                value,
+                self._data_type,
+                self,
+                self._new_function,
+                self._new_use_args,
+                self._dynamic_attributes,
+            )
+
+            return self._get_member(name)
+
         return create_enum_member(
             name,
             value,
@@ -951,8 +2041,99 @@ class EnumType(type):
         Raises:
             ValueError: The name in `name_to_value` is already used by another member.
         """
-        for name, value in name_to_value.items():
-            self.add_member(name, value)
+        self.add_members(name_to_value)
+
+    def add_members(self, items: Union[StringMapping[Any], StringPairs[Any]]) -> None:
+        """Adds multiple members to the enumeration at once.
+
+        Unlike adding members one by one, derived state (like masks and iteration order of flags)
+        is recomputed only once, after all members are added. If any member can not be added,
+        none of them are, leaving the enumeration unchanged.
+
+        Example:
+            ```python
+            class Color(Enum):
+                RED = 1
+                GREEN = 2
+                BLUE = 3
+
+            Color.add_members([("BLACK", 0), ("WHITE", 4)])
+
+            colors = (Color.BLACK, Color.WHITE)  # (<Color.BLACK: 0>, <Color.WHITE: 4>)
+            ```
+
+        Arguments:
+            items: The `name -> value` mapping or the `(name, value)` pairs of the members.
+
+        Raises:
+            ValueError: The name is invalid or is already used by another member.
+        """
+        if is_mapping(items):
+            items = items.items()
+
+        items = list(items)
+
+        seen: Set[str] = set()
+
+        member_mapping = self._member_mapping
+        lazy_names = self._lazy_names
+
+        for name, _ in items:
+            if name in INVALID_NAMES or is_double_under_name(name):
+                raise ValueError(INVALID_MEMBER_NAMES.format(tick(name)))
+
+            if name in seen or name in member_mapping or name in lazy_names:
+                raise ValueError(ATTEMPT_TO_REUSE.format(tick(name)))
+
+            seen.add(name)
+
+        with EnumTransaction(self):
+            data_type = self._data_type
+            new_function = self._new_function
+            new_use_args = self._new_use_args
+            dynamic_attributes = self._dynamic_attributes
+            flag = self._flag
+            lazy = self._lazy
+
+            start = self._start
+            member_names = self._member_names
+            member_values = self._member_values
+
+            generate_next_value = self.enum_generate_next_value
+
+            for name, value in items:
+                if is_auto(value):
+                    if is_null(value.value):
+                        value.value = call_generate_next_value(
+                            generate_next_value, name, start, len(member_names), member_values
+                        )
+
+                    value = value.value
+
+                if lazy:
+                    defer_enum_member(
+                        name,
+                        value,
+                        data_type,
+                        self,
+                        new_function,
+                        new_use_args,
+                        dynamic_attributes,
+                    )
+
+                else:
+                    create_enum_member(
+                        name,
+                        value,
+                        data_type,
+                        self,
+                        new_function,
+                        new_use_args,
+                        dynamic_attributes,
+                        flag,
+                    )
+
+            self._finalize_members()  # can fail too (for instance, flags check their masks)
 
     def __bool__(self) -> Literal[True]:
         return True
@@ -987,13 +2168,13 @@ class EnumType(type):
             return True
 
         try:
-            return data in self._value_mapping
+            return data in self._value_mapping or data in self._lazy_values
 
         except TypeError:
             return data in self._member_values
 
     def __delattr__(self, name: str) -> None:
-        if name in self._member_mapping:
+        if name in self._member_mapping or name in self._lazy_names:
             raise AttributeError(CAN_NOT_DELETE_MEMBER.format(tick(name)))
 
         super().__delattr__(name)
@@ -1020,7 +2201,7 @@ class EnumType(type):
             raise AttributeError(name)
 
         try:
-            return self._member_mapping[name]
+            return self._get_member(name)
 
         except KeyError:
             raise AttributeError(name) from None
@@ -1043,7 +2224,7 @@ class EnumType(type):
         Returns:
             The member found.
         """
-        return self._member_mapping[name]
+        return self._get_member(name)
 
     def __iter__(self: Type[E]) -> Iterator[E]:
         """Returns an iterator over unique [`Enum`][enum_extensions.enums.Enum] members in
@@ -1058,6 +2239,9 @@ class EnumType(type):
         Returns:
             An iterator of unique [`Enum`][enum_extensions.enums.Enum] members.
         """
+        if self._canonical_members_generation == self._canonical_generation:  # fast path
+            return iter(self._canonical_members)  # type: ignore
+
         return self.iter_members()
 
     def __reversed__(self: Type[E]) -> Iterator[E]:
@@ -1106,13 +2290,19 @@ class EnumType(type):
         return ENUM_REPRESENTATION.format(tick(get_name(self)))
 
     def __setattr__(self, name: str, value: Any) -> None:
-        member_mapping = vars(self).get(MEMBER_MAPPING_PRIVATE, {})  # prevent recursion
+        namespace = vars(self)  # prevent recursion
+
+        member_mapping = namespace.get(MEMBER_MAPPING_PRIVATE, {})
+        lazy_names = namespace.get(LAZY_NAMES_PRIVATE, {})
 
-        if name in member_mapping:
+        if name in member_mapping or name in lazy_names:
             raise AttributeError(CAN_NOT_REASSIGN_MEMBER.format(tick(name)))
 
         super().__setattr__(name, value)
 
+        if name == NAME and MEMBER_MAPPING_PRIVATE in namespace:  # strings include the name
+            self._clear_member_strings()
+
     def iter_members(self: Type[E], reverse: bool = False) -> Iterator[E]:
         """Returns an iterator over unique enumeration members in definition order,
         optionally reversing it.
@@ -1131,14 +2321,68 @@ class EnumType(type):
         Returns:
             An iterator over unique members.
         """
-        names = self._member_names
+        if self._lazy_values:  # some members are not created yet
+            names = self._member_names
 
-        if reverse:
-            names = reversed(names)
+            if reverse:
+                names = reversed(names)
 
-        member_mapping = self._member_mapping
+            get_member = self._get_member
+
+            return (get_member(name) for name in names)
+
+        members = self._get_canonical_members()
+
+        return reversed(members) if reverse else iter(members)
+
+    @property
+    def generation(self) -> int:
+        """The counter incremented whenever named members (aliases included) are added.
+
+        Caches derived from the enumeration can store the generation they were computed at,
+        checking whether they are outdated by comparing it with the current one.
+
+        Example:
+            ```python
+            generation = Color.generation
+
+            Color.add_member("BLACK", 0)
+
+            assert Color.generation > generation
+            ```
+        """
+        return self._generation
+
+    @property
+    def canonical_members(self: Type[E]) -> DynamicTuple[E]:
+        """The tuple of unique members (excluding aliases), in definition order.
+
+        The tuple is cached until members are added.
+
+        Example:
+            ```python
+            >>> Color.canonical_members
+            (<Color.RED: 1>, <Color.GREEN: 2>, <Color.BLUE: 3>)
+            ```
+        """
+        if self._lazy:
+            self._materialize_members()
 
-        return (member_mapping[name] for name in names)
+        return self._get_canonical_members()
+
+    @property
+    def canonical_names(self) -> DynamicTuple[str]:
+        """The tuple of names of unique members (excluding aliases), in definition order.
+
+        The tuple is cached until members are added.
+
+        Example:
+            ```python
+            >>> Color.canonical_names
+            ('RED', 'GREEN', 'BLUE')
+            ```
+        """
+        return self._get_canonical_names()
 
     @property
     def members(self: Type[E]) -> StringMapping[E]:
@@ -1157,13 +2401,16 @@ class EnumType(type):
         Returns:
             An immutable mapping of all enumeration members.
         """
-        return MappingProxy(self._member_mapping)
+        if self._lazy:
+            self._materialize_members()
+
+        return self._members_view
 
     __members__ = members
 
     @property
     def case_fold_names(self: Type[E]) -> StringMapping[E]:
-        return {case_fold_name(name): member for name, member in self._member_mapping.items()}
+        return {case_fold_name(name): member for name, member in self.members.items()}
 
     def from_name(self: Type[E], name: str) -> E:
         """Finds a member by name *case insensitively*.
@@ -1256,7 +2503,12 @@ class EnumType(type):
             return self.from_data(default)
 
     def enum_missing(self: Type[E], value: Any) -> Optional[E]:
-        if self._unknown:
+        unknown = self._unknown
+
+        if unknown is EPHEMERAL:
+            return self._find_unknown_member(value)
+
+        if unknown:
             return self.add_member(None, value)
 
         return None
@@ -1331,6 +2583,8 @@ class Enum(metaclass=EnumType):
     attributes; see the documentation for details.
     """
 
+    __slots__ = ()  # allows compact enumerations, see `EnumType`
+
     __enum_name__: Optional[str]
     __enum_value__: Any
 
@@ -1363,7 +2617,8 @@ class Enum(metaclass=EnumType):
             return cls._value_mapping[value]
 
         except KeyError:  # not found, no need to do O(n) search
-            pass
+            if value in cls._lazy_values:  # not created yet
+                return cls._materialize_value(value)
 
         except TypeError:  # not hashable, then do long search, O(n) behavior
             for member in cls._member_mapping.values():
@@ -1412,10 +2667,24 @@ class Enum(metaclass=EnumType):
         Returns:
             The string used in the [`repr`][repr] function.
         """
-        return ENUM_MEMBER_REPRESENTATION.format(
+        # members are immutable, so their strings are rendered once (unless renamed)
+        try:
+            return type(self)._member_representations[self.__enum_name__]
+
+        except KeyError:
+            pass
+
+        representation = ENUM_MEMBER_REPRESENTATION.format(
             get_name(type(self)), self.__enum_checked_name__, self.__enum_value__
         )
 
+        name = self.__enum_name__
+
+        if name is not None:  # pseudo-members are not cached
+            type(self)._member_representations[name] = representation
+
+        return representation
+
     def __str__(self) -> str:
         """Returns the string used by [`str`][str] calls.
 
@@ -1430,7 +2699,20 @@ class Enum(metaclass=EnumType):
         Returns:
             The string used in the [`str`][str] function.
         """
-        return ENUM_MEMBER_STRING.format(get_name(type(self)), self.__enum_checked_name__)
+        try:
+            return type(self)._member_strings[self.__enum_name__]
+
+        except KeyError:
+            pass
+
+        string = ENUM_MEMBER_STRING.format(get_name(type(self)), self.__enum_checked_name__)
+
+        name = self.__enum_name__
+
+        if name is not None:
+            type(self)._member_strings[name] = string
+
+        return string
 
     def __format__(self, specification: str) -> str:
         """Returns the string used by [`format`][format] calls and f-strings.
@@ -1479,6 +2761,20 @@ class Enum(metaclass=EnumType):
         """The value of the [`Enum`][enum_extensions.enums.Enum] member."""
         return self.__enum_value__
 
+    @dynamic_attribute
+    def ordinal(self) -> int:
+        """The position of the [`Enum`][enum_extensions.enums.Enum] member among
+        canonical members, in definition order.
+
+        Ordinals are dense, starting from zero, and they do not change when members are added.
+        Aliases have the ordinals of the members they refer to.
+
+        Raises:
+            ValueError: The member is not named or is not canonical
+                (like pseudo-members and composite flags).
+        """
+        return find_ordinal(type(self), self)
+
     @dynamic_attribute
     def title_name(self) -> str:
         """The human-readable name of the [`Enum`][enum_extensions.enums.Enum] member."""
@@ -1490,6 +2786,25 @@ class Enum(metaclass=EnumType):
 USELESS_NEW.add(Enum.__new__)
 
 
+def memory_reports() -> List[MemoryReport]:
+    """Reports memory footprints of all enumerations in the process, from the largest one.
+
+    Example:
+        ```python
+        for report in memory_reports()[:10]:
+            print(report)
+        ```
+
+    Returns:
+        The list of [`MemoryReport`][enum_extensions.memory.MemoryReport] instances.
+    """
+    reports = [enum_type.memory_report() for enum_type in iter_subclasses(Enum)]
+
+    reports.sort(key=lambda report: report.total, reverse=True)
+
+    return reports
+
+
 def is_enum(item: AnyType) -> TypeGuard[Type[Enum]]:
     return is_subclass(item, Enum)
 
@@ -1541,3 +2856,52 @@ class StringEnum(str, Enum):
 
 
 StrEnum = StringEnum
+
+
+class UnknownPolicy(StringEnum):
+    """Controls how unknown values are handled in enumerations created with `unknown`."""
+
+    REGISTER = auto()
+    """Unknown members are added to the enumeration, and are kept forever.
+    This is what [`True`][True] means.
+
+    Example:
+        ```python
+        from enum_extensions import REGISTER, Enum
+
+        class Status(Enum, unknown=REGISTER):
+            OK = 200
+        ```
+
+        ```python
+        >>> Status(404)
+        <Status.UNKNOWN: 404>
+        >>> Status(404) is Status(404)  # the same member is always returned
+        True
+        ```
+    """
+
+    EPHEMERAL = auto()
+    """Unknown members are not added to the enumeration, and are only cached weakly,
+    therefore they are freed once no longer used.
+
+    Example:
+        ```python
+        from enum_extensions import EPHEMERAL, Enum
+
+        class Status(Enum, unknown=EPHEMERAL):
+            OK = 200
+        ```
+
+        ```python
+        >>> Status(404)
+        <Status.UNKNOWN: 404>
+        >>> status = Status(404)
+        >>> status is Status(404)  # the same member is returned while it is used
+        True
+        >>> del status  # the member is freed
+        ```
+    """
+
+
+REGISTER, EPHEMERAL = UnknownPolicy
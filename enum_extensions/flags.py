@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from builtins import getattr as get_attribute
+from builtins import hasattr as has_attribute
 from builtins import isinstance as is_instance
 from builtins import issubclass as is_subclass
 from builtins import type as standard_type
@@ -8,6 +9,8 @@ from types import DynamicClassAttribute as dynamic_attribute
 from typing import (
     Any,
     Dict,
+    Generic,
+    Iterable,
     Iterator,
     List,
     Optional,
@@ -19,21 +22,44 @@ from typing import (
     overload,
 )
 
-from typing_extensions import TypeGuard
+from typing_extensions import Literal, TypeGuard
 
 from enum_extensions.auto import auto
-from enum_extensions.bits import bin, bit_at, bit_count, bit_mask, is_single_bit, iter_bits
+from enum_extensions.bits import (
+    bin,
+    bit_at,
+    bit_count,
+    bit_mask,
+    is_single_bit,
+    iter_bits,
+    iter_submasks,
+    minimal_cover,
+)
 from enum_extensions.constants import (
+    ALIASES_PRIVATE,
+    ARRAY,
+    BIT_LENGTH_PRIVATE,
     BOUNDARY_PRIVATE,
+    BY_DEFINITION,
     COMMA,
     DIRECT_CALLER,
+    FLAG_MASK_PRIVATE,
+    FULL_MASK_PRIVATE,
     MODULE,
-    NAME,
     NESTED_CALLER,
     QUALIFIED_NAME,
     SPACE,
 )
-from enum_extensions.enums import Enum, EnumDict, EnumType, StringEnum, find_enum_type
+from enum_extensions.enums import (
+    Enum,
+    EnumDict,
+    EnumType,
+    StringEnum,
+    call_generate_next_value,
+    create_cached_enum,
+    find_enum_type,
+    get_caller_module,
+)
 from enum_extensions.string import concat_comma_space, concat_pipe, create_title, tick
 from enum_extensions.types import is_not_null, null
 from enum_extensions.typing import (
@@ -42,21 +68,32 @@ from enum_extensions.typing import (
     MaybeIterable,
     Names,
     StringDict,
+    StringMapping,
     get_name,
     is_int,
     is_mapping,
     is_same_type,
     is_string,
 )
-from enum_extensions.utils import get_frame, make_namespace_unpicklable, prepend
-
-__all__ = ("FlagBoundary", "FlagType", "Flag", "IntFlag", "is_flag", "is_flag_member")
+from enum_extensions.utils import make_namespace_unpicklable, prepend
+
+__all__ = (
+    "FlagBoundary",
+    "FlagType",
+    "FlagValidation",
+    "Flag",
+    "IntFlag",
+    "is_flag",
+    "is_flag_member",
+)
 
 F = TypeVar("F")
 FT = TypeVar("FT")
 
 FlagT = TypeVar("FlagT", bound="Flag")
 
+FlagDiff = Tuple[DynamicTuple[F], DynamicTuple[F]]
+
 
 class FlagBoundary(StringEnum):
     """Controls how *out-of-range* values are handled in
@@ -153,6 +190,7 @@ def strict_bit_next_value(
 
 
 INVALID_FLAG = "invalid flag {}; missing values: {}"
+EXPECTED_MEMBER = "expected {} member, got {}"
 INVALID_VALUE = "{} is not a valid {}"
 INVALID_BITS = """
 invalid value {} in {}:
@@ -167,6 +205,101 @@ FLAG_REPRESENTATION = "<flag {}>"
 
 QUALIFIED_NAME_STRING = "{}.{}"
 
+COVER_NAMES = "cover_names"
+
+
+VectorLike = Any  # NumPy-like integer array
+
+
+class FlagValidation(Generic[F]):
+    """Represents results of the bulk [`validate`][enum_extensions.flags.FlagType.validate] call."""
+
+    def __init__(
+        self, flag_type: Type[F], indexes: List[int], values: List[int], bits: List[int]
+    ) -> None:
+        self._flag_type = flag_type
+        self._indexes = indexes
+        self._values = values
+        self._bits = bits
+
+    @property
+    def flag_type(self) -> Type[F]:
+        """The [`Flag`][enum_extensions.flags.Flag] type the values were validated against."""
+        return self._flag_type
+
+    @property
+    def indexes(self) -> List[int]:
+        """The indexes of invalid values, in increasing order."""
+        return self._indexes
+
+    @property
+    def values(self) -> List[int]:
+        """The invalid values, matching the indexes."""
+        return self._values
+
+    @property
+    def bits(self) -> List[int]:
+        """The offending bits of each invalid value, matching the indexes.
+
+        Bits of negative values are negative as well, since in two's complement
+        they have infinitely many bits set above the flag (for instance, `-9` gives `-16`).
+        """
+        return self._bits
+
+    def is_valid(self) -> bool:
+        """Checks whether all values are valid.
+
+        Returns:
+            Whether there were no invalid values.
+        """
+        return not self._indexes
+
+    def message_of(self, value: int) -> str:
+        """Builds the error message for the invalid `value`.
+
+        Arguments:
+            value: The invalid value.
+
+        Returns:
+            The error message.
+        """
+        flag_type = self._flag_type
+
+        flag_mask = flag_type._flag_mask
+
+        bits = max(value.bit_length(), flag_type._bit_length)
+
+        return INVALID_BITS.format(
+            hex(value), tick(get_name(flag_type)), bin(value, bits), bin(flag_mask, bits)
+        )
+
+    def messages(self) -> List[str]:
+        """Builds error messages for invalid values, which matches the ones
+        [`STRICT`][enum_extensions.flags.FlagBoundary.STRICT] flags raise.
+
+        Returns:
+            The error messages, matching the indexes.
+        """
+        message_of = self.message_of
+
+        return [message_of(value) for value in self._values]
+
+    def raise_if_invalid(self) -> None:
+        """Raises an error for the first invalid value, if there is any.
+
+        Raises:
+            ValueError: Some value is invalid.
+        """
+        values = self._values
+
+        if values:
+            raise ValueError(self.message_of(values[0]))  # only the first message is needed
+
+
+VECTOR_BITS = 63  # fits into signed 64-bit integers
+VECTOR_BYTES = 8
+VECTOR_TYPE = "int64"
+
 
 class FlagType(EnumType):
     _member_values: List[int]
@@ -180,6 +313,9 @@ class FlagType(EnumType):
 
     _boundary: FlagBoundary
 
+    _aliases: bool
+    _cover_names: Dict[int, List[str]]
+
     def __new__(
         cls: Type[FT],
         flag_name: str,
@@ -189,34 +325,42 @@ class FlagType(EnumType):
         ignore: Optional[MaybeIterable[str]] = None,
         start: Optional[int] = None,
         boundary: Optional[FlagBoundary] = None,
+        aliases: Optional[bool] = None,
+        lazy: bool = False,
+        compact: Optional[bool] = None,
         **kwargs: Any,
     ) -> FT:
         new_flag_type = super().__new__(
-            cls, flag_name, bases, namespace, ignore=ignore, start=start, flag=True
+            cls,
+            flag_name,
+            bases,
+            namespace,
+            ignore=ignore,
+            start=start,
+            flag=True,
+            lazy=lazy,
+            compact=compact,
         )
 
         if boundary is None:
             boundary = get_attribute(new_flag_type, BOUNDARY_PRIVATE, STRICT)
 
-        flag_mask = 0
-
-        for value in new_flag_type._member_values:
-            flag_mask |= value
-
-        bit_length = flag_mask.bit_length()
+        new_flag_type._boundary = boundary
 
-        full_mask = bit_mask(bit_length)
+        if aliases is None:
+            aliases = get_attribute(new_flag_type, ALIASES_PRIVATE, False)
 
-        new_flag_type._flag_mask = flag_mask
-        new_flag_type._full_mask = full_mask
+        new_flag_type._aliases = aliases
+        new_flag_type._cover_names = {}
 
-        new_flag_type._bit_length = bit_length
+        new_flag_type._finalize_members()
 
-        new_flag_type._boundary = boundary
+        return new_flag_type
 
-        new_flag_type._modify_mask_and_iter()
+    def _finalize_members(self) -> None:
+        self._modify_mask_and_iter()
 
-        return new_flag_type
+        self._cover_names.clear()  # named members changed, so the covers might have too
 
     def _modify_mask_and_iter(self) -> None:
         single_bit_total = 0
@@ -237,7 +381,12 @@ class FlagType(EnumType):
             if missed:
                 raise TypeError(INVALID_FLAG.format(tick(get_name(self)), hex(missed)))
 
+        bit_length = (single_bit_total | multi_bit_total).bit_length()
+
         self._flag_mask = single_bit_total
+        self._full_mask = bit_mask(bit_length)
+
+        self._bit_length = bit_length
 
         flag_list = [flag.__enum_value__ for flag in self]
 
@@ -245,6 +394,37 @@ class FlagType(EnumType):
             # definition order is not the same as increasing value order
             self._iter_member = self._iter_member_by_defintion
 
+    def _snapshot_state(self) -> StringDict[Any]:
+        state = super()._snapshot_state()
+
+        state.update(
+            {
+                BOUNDARY_PRIVATE: self._boundary,
+                ALIASES_PRIVATE: self._aliases,
+                FLAG_MASK_PRIVATE: self._flag_mask,
+                FULL_MASK_PRIVATE: self._full_mask,
+                BIT_LENGTH_PRIVATE: self._bit_length,
+                BY_DEFINITION: self._iter_member == self._iter_member_by_defintion,
+            }
+        )
+
+        return state
+
+    def _restore_state(self, state: StringMapping[Any]) -> None:
+        state = dict(state)
+
+        if state.pop(BY_DEFINITION, False):
+            self._iter_member = self._iter_member_by_defintion
+
+        super()._restore_state(state)
+
+    def _memory_structures(self) -> StringDict[Any]:
+        structures = super()._memory_structures()
+
+        structures[COVER_NAMES] = self._cover_names
+
+        return structures
+
     @overload
     def __call__(self: Type[F], value: Any) -> F:
         ...
@@ -260,6 +440,9 @@ class FlagType(EnumType):
         type: Optional[AnyType] = ...,
         start: Optional[Any] = ...,
         boundary: Optional[FlagBoundary] = ...,
+        aliases: Optional[bool] = ...,
+        compact: Optional[bool] = ...,
+        cached: bool = ...,
         **members: Any,
     ) -> FT:
         ...
@@ -274,6 +457,9 @@ class FlagType(EnumType):
         type: Optional[AnyType] = None,
         start: Optional[Any] = None,
         boundary: Optional[FlagBoundary] = None,
+        aliases: Optional[bool] = None,
+        compact: Optional[bool] = None,
+        cached: bool = False,
         **members: Any,
     ) -> Union[F, Type[F]]:
         """Looks up an existing member or creates a new flag.
@@ -303,6 +489,14 @@ class FlagType(EnumType):
             boundary: The [`FlagBoundary`][enum_extensions.flags.FlagBoundary] to use.
                 [`None`] means it should be inherited. The default boundary in the end is
                 [`STRICT`][enum_extensions.flags.FlagBoundary.STRICT].
+            aliases: Whether to name composite members using the minimal amount of named
+                members, including multi-bit aliases. [`None`][None] means it should be inherited.
+                The default value in the end is [`False`][False].
+            compact: Whether to store member attributes in slots instead of dictionaries.
+                [`None`][None] means it should be inherited.
+                The default value in the end is [`False`][False].
+            cached: Whether to return the previously created flag
+                if the specification is the same.
             **members: A `name -> value` mapping of [`Flag`][enum_extensions.flags.Flag] members.
 
         Raises:
@@ -313,7 +507,18 @@ class FlagType(EnumType):
             A newly created [`Flag`][enum_extensions.flags.Flag] type or a member found.
         """
 
-        if names or module or qualified_name or type or start or boundary or members:
+        if (
+            names
+            or module
+            or qualified_name
+            or type
+            or start
+            or boundary
+            or aliases
+            or compact
+            or cached
+            or members
+        ):
             return self.create(
                 value,
                 names,
@@ -322,6 +527,9 @@ class FlagType(EnumType):
                 type=type,
                 start=start,
                 boundary=boundary,
+                aliases=aliases,
+                compact=compact,
+                cached=cached,
                 direct_call=False,
                 **members,
             )
@@ -338,6 +546,9 @@ class FlagType(EnumType):
         type: Optional[AnyType] = None,
         start: Optional[Any] = None,
         boundary: Optional[FlagBoundary] = None,
+        aliases: Optional[bool] = None,
+        compact: Optional[bool] = None,
+        cached: bool = False,
         direct_call: bool = True,
         **members: Any,
     ) -> FT:
@@ -359,6 +570,15 @@ class FlagType(EnumType):
             boundary: The [`FlagBoundary`][enum_extensions.flags.FlagBoundary] to use.
                 [`None`][None] means it should be inherited. The default boundary in the end is
                 [`STRICT`][enum_extensions.flags.FlagBoundary.STRICT].
+            aliases: Whether to name composite members using the minimal amount of named
+                members, including multi-bit aliases. [`None`][None] means it should be inherited.
+                The default value in the end is [`False`][False].
+            compact: Whether to store member attributes in slots instead of dictionaries.
+                [`None`][None] means it should be inherited.
+                The default value in the end is [`False`][False].
+            cached: Whether to return the previously created flag
+                if the specification is the same.
+                See [`EnumType.create`][enum_extensions.enums.EnumType.create] for more information.
             direct_call: Controls if the function is called directly or not.
                 This argument should be used with caution.
             **members: A `name -> value` mapping of [`Flag`][enum_extensions.flags.Flag] members.
@@ -367,15 +587,32 @@ class FlagType(EnumType):
             ValueError: The name is already used by another member.
 
         Returns:
-            A newly created [`Flag`][enum_extensions.flags.Flag] type.
+            A newly created (or cached) [`Flag`][enum_extensions.flags.Flag] type.
         """
+        if cached:
+            if module is None:
+                module = get_caller_module(DIRECT_CALLER if direct_call else NESTED_CALLER)
+
+            keywords = dict(
+                qualified_name=qualified_name,
+                type=type,
+                start=start,
+                boundary=boundary,
+                aliases=aliases,
+                compact=compact,
+            )
+
+            return create_cached_enum(self, flag_name, names, module, members, keywords)
+
         meta = standard_type(self)
 
         bases = (self,) if type is None else (type, self)
 
         enum_type = find_enum_type(bases)
 
-        namespace = meta.__prepare__(flag_name, bases, start=start, boundary=boundary)
+        namespace = meta.__prepare__(
+            flag_name, bases, start=start, boundary=boundary, compact=compact
+        )
 
         if names is not None:
             # special processing needed for strings
@@ -395,11 +632,13 @@ class FlagType(EnumType):
 
                 if is_string(item):
                     original_names, names = names, []
-                    values = []
+                    values: List[Any] = []
+
+                    generate_next_value = enum_type.enum_generate_next_value
 
                     for count, name in enumerate(original_names):
-                        value = enum_type.enum_generate_next_value(
-                            name, start, count, values.copy()
+                        value = call_generate_next_value(
+                            generate_next_value, name, start, count, values
                         )
 
                         values.append(value)
@@ -412,14 +651,8 @@ class FlagType(EnumType):
 
         namespace.update(members)
 
-        # TODO: replace the frame hack if a blessed way to know the calling
-        # module is ever developed
         if module is None:
-            try:
-                module = get_frame(DIRECT_CALLER if direct_call else NESTED_CALLER).f_globals[NAME]
-
-            except (AttributeError, ValueError, KeyError):  # pragma: no cover
-                pass
+            module = get_caller_module(DIRECT_CALLER if direct_call else NESTED_CALLER)
 
         if module is None:  # pragma: no cover
             make_namespace_unpicklable(namespace)
@@ -434,7 +667,9 @@ class FlagType(EnumType):
         if qualified_name is not None:
             namespace[QUALIFIED_NAME] = qualified_name
 
-        return meta.__new__(meta, flag_name, bases, namespace, boundary=boundary)
+        return meta.__new__(
+            meta, flag_name, bases, namespace, boundary=boundary, aliases=aliases, compact=compact
+        )
 
     def __repr__(self) -> str:
         """Returns the string used by [`repr`][repr] calls.
@@ -475,34 +710,44 @@ class FlagType(EnumType):
         unknown = value & ~flag_mask
         value &= flag_mask
 
+        if self._aliases:
+            cover_names = self._cover_names
+
+            names = cover_names.get(value)
+
+            if names is None:
+                names = cover_names[value] = self._find_cover_names(value)
+
+            return names.copy(), unknown
+
         names = [flag.__enum_name__ for flag in self._iter_member(value)]
 
         return names, unknown
 
-    def enum_missing(self: Type[F], value: int) -> F:
-        """Handles *out-of-range* `value` according to given boundary.
+    def _find_cover_names(self, value: int) -> List[str]:
+        members = {flag.__enum_value__: flag for flag in self._member_mapping.values()}
 
-        Arguments:
-            value: The value to handle.
+        cover = minimal_cover(value, members)
 
-        Raises:
-            ValueError: An invalid value was given.
+        if cover is None:  # the search was given up on, fall back to single-bit members
+            return [flag.__enum_name__ for flag in self._iter_member(value)]
 
-        Returns:
-            The matching flag member. See [`FlagBoundary`][enum_extensions.flags.FlagBoundary]
-            for more information.
-        """
-        if not is_int(value):
-            raise ValueError(INVALID_VALUE.format(repr(value), tick(get_name(self))))
+        # order the cover the same way single-bit members are iterated,
+        # positioning each member where its first bit would appear
+        order = {flag.__enum_value__: index for index, flag in enumerate(self._iter_member(value))}
 
+        def position(mask: int) -> int:
+            return min(order[bit] for bit in iter_bits(mask))
+
+        return [members[mask].__enum_name__ for mask in sorted(cover, key=position)]
+
+    def _resolve_value(self, value: int) -> int:
         flag_mask = self._flag_mask
         all_bits = self._full_mask
         bit_length = self._bit_length
 
         boundary = self._boundary
 
-        negative_value: Optional[int] = None
-
         if (
             # must be in range
             not ~all_bits <= value <= all_bits
@@ -523,14 +768,12 @@ class FlagType(EnumType):
 
             elif boundary is KEEP:
                 if value < 0:
-                    negative_value = value
                     value = bit_at(max(bit_length, value.bit_length())) + value
 
             else:  # pragma: no cover
                 raise ValueError(UNKNOWN_BOUNDARY.format(repr(boundary)))
 
         if value < 0:
-            negative_value = value
             value += bit_at(bit_length)
 
         unknown = value & ~flag_mask
@@ -538,13 +781,251 @@ class FlagType(EnumType):
         if unknown and boundary is not KEEP:  # pragma: no cover  # TODO: cover?
             raise ValueError(UNKNOWN_VALUES.format(get_name(self), value, unknown, bin(unknown)))
 
-        member = self.add_member(None, value)
+        return value
 
-        if negative_value is not None:
-            self._value_mapping[negative_value] = member
+    def enum_missing(self: Type[F], value: int) -> F:
+        """Handles *out-of-range* `value` according to given boundary.
+
+        Arguments:
+            value: The value to handle.
+
+        Raises:
+            ValueError: An invalid value was given.
+
+        Returns:
+            The matching flag member. See [`FlagBoundary`][enum_extensions.flags.FlagBoundary]
+            for more information.
+        """
+        if not is_int(value):
+            raise ValueError(INVALID_VALUE.format(repr(value), tick(get_name(self))))
+
+        resolved = self._resolve_value(value)
+
+        member = self._value_mapping.get(resolved)
+
+        if member is None:
+            member = self.add_member(None, resolved)
+
+        if value < 0:
+            self._value_mapping[value] = member
 
         return member
 
+    def _value_of(self, data: Union[int, F]) -> int:
+        if is_flag_member(data):
+            if not is_instance(data, self):
+                raise TypeError(
+                    EXPECTED_MEMBER.format(tick(get_name(self)), tick(get_name(type(data))))
+                )
+
+            return data.__enum_value__
+
+        return self._resolve_value(data)
+
+    @overload
+    def subsets(self: Type[F], mask: Union[int, F]) -> Iterator[F]:
+        ...
+
+    @overload
+    def subsets(self: Type[F], mask: Union[int, F], raw: Literal[False]) -> Iterator[F]:
+        ...
+
+    @overload
+    def subsets(self: Type[F], mask: Union[int, F], raw: Literal[True]) -> Iterator[int]:
+        ...
+
+    def subsets(self: Type[F], mask: Union[int, F], raw: bool = False) -> Iterator[Union[int, F]]:
+        """Iterates over all subsets of the `mask`, from the smallest value to the largest.
+
+        Example:
+            ```python
+            >>> list(Permission.subsets(Permission.R | Permission.X))
+            [<Permission.N: 0>, <Permission.X: 1>, <Permission.R: 4>, <Permission.X|R: 5>]
+            >>> list(Permission.subsets(5, raw=True))
+            [0, 1, 4, 5]
+            ```
+
+        Arguments:
+            mask: The mask to iterate subsets of. Raw values are handled according to the
+                [`FlagBoundary`][enum_extensions.flags.FlagBoundary] of the flag.
+            raw: Whether to yield raw values instead of members.
+
+        Raises:
+            ValueError: An invalid `mask` was given.
+            TypeError: `mask` is the member of another type.
+
+        Returns:
+            An iterator over subsets, which resolves members lazily.
+        """
+        value = self._value_of(mask)
+
+        subsets = iter_submasks(value, 0)
+
+        if raw:
+            return subsets
+
+        return map(self, subsets)
+
+    @overload
+    def supersets(self: Type[F], mask: Union[int, F]) -> Iterator[F]:
+        ...
+
+    @overload
+    def supersets(self: Type[F], mask: Union[int, F], raw: Literal[False]) -> Iterator[F]:
+        ...
+
+    @overload
+    def supersets(self: Type[F], mask: Union[int, F], raw: Literal[True]) -> Iterator[int]:
+        ...
+
+    def supersets(self: Type[F], mask: Union[int, F], raw: bool = False) -> Iterator[Union[int, F]]:
+        """Iterates over all supersets of the `mask` within the flag mask,
+        from the smallest value to the largest.
+
+        Example:
+            ```python
+            >>> list(Permission.supersets(Permission.W, raw=True))
+            [2, 3, 6, 7]
+            ```
+
+        Arguments:
+            mask: The mask to iterate supersets of. Raw values are handled according to the
+                [`FlagBoundary`][enum_extensions.flags.FlagBoundary] of the flag.
+            raw: Whether to yield raw values instead of members.
+
+        Raises:
+            ValueError: An invalid `mask` was given.
+            TypeError: `mask` is the member of another type.
+
+        Returns:
+            An iterator over supersets, which resolves members lazily.
+        """
+        value = self._value_of(mask)
+
+        supersets = iter_submasks(self._flag_mask & ~value, value)
+
+        if raw:
+            return supersets
+
+        return map(self, supersets)
+
+    def diff(self: Type[F], old: Union[int, F], new: Union[int, F]) -> FlagDiff[F]:
+        """Finds single-bit members added and removed between the `old` and the `new` values.
+
+        Example:
+            ```python
+            >>> Permission.diff(Permission.R | Permission.W, Permission.W | Permission.X)
+            ((<Permission.X: 1>,), (<Permission.R: 4>,))
+            ```
+
+        Arguments:
+            old: The old member or value.
+            new: The new member or value.
+
+        Raises:
+            ValueError: An invalid value was given.
+            TypeError: Either `old` or `new` is the member of another type.
+
+        Returns:
+            The `(added, removed)` pair of single-bit member tuples.
+        """
+        old_value = self._value_of(old)
+        new_value = self._value_of(new)
+
+        changed = old_value ^ new_value
+
+        iter_member = self._iter_member
+
+        return (tuple(iter_member(changed & new_value)), tuple(iter_member(changed & old_value)))
+
+    def diff_many(
+        self: Type[F], pairs: Iterable[Tuple[Union[int, F], Union[int, F]]]
+    ) -> Iterator[FlagDiff[F]]:
+        """Same as [`diff`][enum_extensions.flags.FlagType.diff], except it handles
+        an iterable of `(old, new)` pairs, lazily.
+
+        Arguments:
+            pairs: The `(old, new)` pairs of members or values.
+
+        Raises:
+            ValueError: An invalid value was given.
+            TypeError: Some member is the member of another type.
+
+        Returns:
+            An iterator over `(added, removed)` pairs of single-bit member tuples.
+        """
+        value_of = self._value_of
+        iter_member = self._iter_member
+
+        for old, new in pairs:
+            old_value = value_of(old)
+            new_value = value_of(new)
+
+            changed = old_value ^ new_value
+
+            yield (tuple(iter_member(changed & new_value)), tuple(iter_member(changed & old_value)))
+
+    def validate(self: Type[F], values: Union[Iterable[int], VectorLike]) -> FlagValidation[F]:
+        """Validates `values` in bulk, applying the same checks as
+        [`STRICT`][enum_extensions.flags.FlagBoundary.STRICT] flags do,
+        regardless of the actual boundary of the flag.
+
+        NumPy-like integer arrays are validated using vectorized operations,
+        unless the flag spans 63 or more bits, which do not fit into signed 64-bit integers;
+        such arrays are validated element by element instead.
+        Arrays of narrower types are converted to signed 64-bit integers first,
+        so that masks of the flag fit into them.
+
+        Example:
+            ```python
+            >>> validation = Permission.validate([1, 0x10, 7, 0x21])
+            >>> validation.indexes
+            [1, 3]
+            >>> validation.bits
+            [16, 32]
+            ```
+
+        Arguments:
+            values: The values to validate.
+
+        Returns:
+            The [`FlagValidation`][enum_extensions.flags.FlagValidation] result.
+        """
+        flag_mask = self._flag_mask
+        all_bits = self._full_mask
+
+        low = ~all_bits
+        high = all_bits
+
+        skipped = all_bits ^ flag_mask
+        unknown = ~flag_mask
+
+        if has_attribute(values, ARRAY) and all_bits.bit_length() < VECTOR_BITS:
+            if values.dtype.itemsize < VECTOR_BYTES:
+                values = values.astype(VECTOR_TYPE)
+
+            invalid = (values < low) | (values > high) | ((values & skipped) != 0)
+
+            (indexes,) = invalid.nonzero()
+
+            invalid_values = values[indexes].tolist()
+
+            invalid_bits = [value & unknown for value in invalid_values]
+
+            return FlagValidation(self, indexes.tolist(), invalid_values, invalid_bits)
+
+        invalid_indexes = []
+        invalid_values = []
+        invalid_bits = []
+
+        for index, value in enumerate(values):
+            if not low <= value <= high or value & skipped:
+                invalid_indexes.append(index)
+                invalid_values.append(value)
+                invalid_bits.append(value & unknown)
+
+        return FlagValidation(self, invalid_indexes, invalid_values, invalid_bits)
+
     def add_member(self: Type[F], name: Optional[str], value: int) -> F:
         """Adds a new member to the [`Flag`][enum_extensions.flags.Flag].
 
@@ -571,7 +1052,8 @@ class FlagType(EnumType):
 
         member = super().add_member(name, value)
 
-        self._modify_mask_and_iter()
+        if name is not None:  # pseudo-members do not change masks, aliases or iteration
+            self._finalize_members()
 
         return member
 
@@ -676,6 +1158,8 @@ FLAG_MEMBER_STRING = "{}.{}"
 class Flag(Enum, metaclass=FlagType):
     """Support for bit flags."""
 
+    __slots__ = ()
+
     __enum_value__: int
 
     def __iter__(self: FlagT) -> Iterator[FlagT]:
@@ -739,10 +1223,24 @@ class Flag(Enum, metaclass=FlagType):
         Returns:
             The string used in the [`repr`][repr] function.
         """
-        return FLAG_MEMBER_REPRESENTATION.format(
+        # only named members are cached, since composite names depend on the members defined
+        try:
+            return type(self)._member_representations[self.__enum_name__]
+
+        except KeyError:
+            pass
+
+        representation = FLAG_MEMBER_REPRESENTATION.format(
             get_name(type(self)), self.__enum_composite_name__, self.__enum_value__
         )
 
+        name = self.__enum_name__
+
+        if name is not None:
+            type(self)._member_representations[name] = representation
+
+        return representation
+
     def __str__(self) -> str:
         """Returns the string used by [`str`][str] calls.
 
@@ -758,7 +1256,20 @@ class Flag(Enum, metaclass=FlagType):
         Returns:
             The string used in the [`str`][str] function.
         """
-        return FLAG_MEMBER_STRING.format(get_name(type(self)), self.__enum_composite_name__)
+        try:
+            return type(self)._member_strings[self.__enum_name__]
+
+        except KeyError:
+            pass
+
+        string = FLAG_MEMBER_STRING.format(get_name(type(self)), self.__enum_composite_name__)
+
+        name = self.__enum_name__
+
+        if name is not None:
+            type(self)._member_strings[name] = string
+
+        return string
 
     def __len__(self) -> int:
         """Returns the number of bits in the member value.
@@ -0,0 +1,198 @@
+from builtins import isinstance as is_instance
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from enum_extensions.bits import bit_at, bit_count, iter_bits
+from enum_extensions.enums import ENUM_CONTAINER_ITEM, Enum, EnumContainer, represent_container
+from enum_extensions.types import null
+from enum_extensions.typing import is_mapping
+
+__all__ = ("EnumMap",)
+
+E = TypeVar("E", bound=Enum)
+V = TypeVar("V")
+
+M = TypeVar("M", bound="EnumMap[Any, Any]")
+
+
+class EnumMap(EnumContainer[E], MutableMapping[E, V]):
+    """Represents mappings with [`Enum`][enum_extensions.enums.Enum] members as keys.
+
+    Keys and values are stored in lists indexed by member positions in definition order,
+    along with the mask of members present, therefore accessing values does not involve hashing.
+
+    Example:
+        ```python
+        handlers = EnumMap(State, {State.IDLE: on_idle, State.BUSY: on_busy})
+
+        handlers[state](task)
+        ```
+    """
+
+    def __init__(
+        self, enum_type: Type[E], items: Union[Mapping[E, V], Iterable[Tuple[E, V]]] = ()
+    ) -> None:
+        self._enum_type = enum_type
+
+        length = len(enum_type._member_names)
+
+        self._keys: List[Any] = [null] * length
+        self._values: List[Any] = [null] * length
+
+        self._mask = 0
+
+        self.update(items)
+
+    @property
+    def mask(self) -> int:
+        """The mask of ordinals of the members present."""
+        return self._mask
+
+    def __getitem__(self, key: E) -> V:
+        try:
+            ordinal = key._sort_order
+
+            if self._keys[ordinal] is key:  # aliases are the same objects as canonical members
+                return self._values[ordinal]  # type: ignore
+
+        except (AttributeError, IndexError):  # not a member, or not stored yet
+            pass
+
+        raise KeyError(key)
+
+    def get(self, key: E, default: Any = None) -> Any:
+        try:
+            ordinal = key._sort_order
+
+            if self._keys[ordinal] is key:
+                return self._values[ordinal]
+
+        except (AttributeError, IndexError):
+            pass
+
+        return default
+
+    def __setitem__(self, key: E, value: V) -> None:
+        ordinal = self.ordinal_of(key)
+
+        keys = self._keys
+        values = self._values
+
+        if ordinal >= len(keys):
+            extension = [null] * (len(self._enum_type._member_names) - len(keys))
+
+            keys.extend(extension)
+            values.extend(extension)
+
+        keys[ordinal] = key
+        values[ordinal] = value
+
+        self._mask |= bit_at(ordinal)
+
+    def __delitem__(self, key: E) -> None:
+        if key not in self:
+            raise KeyError(key)
+
+        ordinal = key._sort_order
+
+        self._keys[ordinal] = null
+        self._values[ordinal] = null
+
+        self._mask &= ~bit_at(ordinal)
+
+    def __contains__(self, key: Any) -> bool:
+        try:
+            return self._keys[key._sort_order] is key
+
+        except (AttributeError, IndexError):
+            return False
+
+    def iter_ordinals(self) -> Iterator[int]:
+        for bit in iter_bits(self._mask):
+            yield bit.bit_length() - 1
+
+    def __iter__(self) -> Iterator[E]:
+        keys = self._keys
+
+        for ordinal in self.iter_ordinals():
+            yield keys[ordinal]
+
+    def __len__(self) -> int:
+        return bit_count(self._mask)
+
+    def __bool__(self) -> bool:
+        return self._mask != 0
+
+    def __repr__(self) -> str:
+        return represent_container(
+            self,
+            (
+                ENUM_CONTAINER_ITEM.format(repr(member), repr(value))
+                for member, value in self.items()
+            ),
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        if is_instance(other, EnumMap):
+            if self._enum_type is not other._enum_type or self._mask != other._mask:
+                return False
+
+            values = self._values
+            other_values = other._values
+
+            return all(values[ordinal] == other_values[ordinal] for ordinal in self.iter_ordinals())
+
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore
+
+    def update(  # type: ignore
+        self, items: Union[Mapping[E, V], Iterable[Tuple[E, V]]] = ()
+    ) -> None:
+        """Updates the map with the `items`.
+
+        Arguments:
+            items: The `member -> value` mapping or the `(member, value)` pairs.
+
+        Raises:
+            TypeError: Some member is of another type.
+            ValueError: Some member is not named or is not canonical.
+        """
+        if is_mapping(items):
+            items = items.items()
+
+        for member, value in items:
+            self[member] = value
+
+    def clear(self) -> None:
+        """Removes all items from the map."""
+        length = len(self._enum_type._member_names)
+
+        self._keys = [null] * length
+        self._values = [null] * length
+
+        self._mask = 0
+
+    def copy(self: M) -> M:
+        """Returns the copy of the map.
+
+        Returns:
+            The copied map.
+        """
+        copied = type(self)(self._enum_type)
+
+        copied._keys = self._keys.copy()
+        copied._values = self._values.copy()
+        copied._mask = self._mask
+
+        return copied
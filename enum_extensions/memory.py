@@ -0,0 +1,186 @@
+"""Memory footprint introspection of enumerations."""
+
+from builtins import isinstance as is_instance
+from builtins import type as standard_type
+from sys import getsizeof as get_size
+from types import BuiltinFunctionType, FunctionType, ModuleType
+from typing import Any, Iterator, Set
+from weakref import ReferenceType
+
+from enum_extensions.string import concat_comma_space
+from enum_extensions.typing import AnyType, StringDict, get_name
+
+__all__ = ("MemoryReport", "deep_size", "iter_subclasses")
+
+SLOTS = "__slots__"
+
+# types, functions and modules are shared, so they are never included
+SHARED = (type, FunctionType, BuiltinFunctionType, ModuleType, ReferenceType)
+
+CONTAINERS = (list, tuple, set, frozenset)
+
+MEMORY_REPORT = "{}({}, total={}, members={}, aliases={}, pseudo_members={}, sizes={{{}}})"
+SIZE = "{!r}: {}"
+
+
+def iter_slots(item: Any) -> Iterator[Any]:
+    for base in standard_type(item).__mro__:
+        slots = vars(base).get(SLOTS, ())
+
+        if is_instance(slots, str):
+            slots = (slots,)
+
+        for name in slots:
+            try:
+                yield object.__getattribute__(item, name)
+
+            except AttributeError:  # the slot is not set
+                pass
+
+
+def deep_size(item: Any, seen: Set[int]) -> int:
+    """Computes the size of the `item` in bytes, along with everything it references.
+
+    Objects the identities of which are in `seen` are skipped, which allows to
+    compute sizes of several objects without counting shared ones more than once.
+    Types, functions and modules are never included.
+
+    Arguments:
+        item: The item to compute the size of.
+        seen: The identities of objects already included, updated in-place.
+
+    Returns:
+        The size of the `item`.
+    """
+    size = 0
+
+    stack = [item]
+
+    while stack:
+        item = stack.pop()
+
+        identity = id(item)
+
+        if identity in seen or is_instance(item, SHARED):
+            continue
+
+        seen.add(identity)
+
+        size += get_size(item)
+
+        if is_instance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+
+        elif is_instance(item, CONTAINERS):
+            stack.extend(item)
+
+        else:
+            try:
+                stack.append(vars(item))
+
+            except TypeError:  # no `__dict__`
+                pass
+
+            stack.extend(iter_slots(item))
+
+    return size
+
+
+def iter_subclasses(type: AnyType) -> Iterator[AnyType]:
+    """Iterates over the `type` and all of its subclasses, recursively.
+
+    Arguments:
+        type: The type to start from.
+
+    Returns:
+        The iterator over the `type` and its subclasses, each one exactly once.
+    """
+    seen: Set[AnyType] = set()
+
+    stack = [type]
+
+    while stack:
+        type = stack.pop()
+
+        if type in seen:
+            continue
+
+        seen.add(type)
+
+        yield type
+
+        stack.extend(reversed(type.__subclasses__()))
+
+
+class MemoryReport:
+    """Represents the memory footprint of some enumeration.
+
+    Sizes are given in bytes per structure, including everything each structure references;
+    objects shared by several structures are only included in the first one
+    (for instance, member values are included in the members themselves).
+
+    Example:
+        ```python
+        report = Color.memory_report()
+
+        print(report.total, report.sizes)
+        ```
+    """
+
+    def __init__(
+        self,
+        enum_type: AnyType,
+        sizes: StringDict[int],
+        members: int,
+        aliases: int,
+        pseudo_members: int,
+    ) -> None:
+        self._enum_type = enum_type
+        self._sizes = sizes
+        self._members = members
+        self._aliases = aliases
+        self._pseudo_members = pseudo_members
+
+    @property
+    def enum_type(self) -> AnyType:
+        """The enumeration reported on."""
+        return self._enum_type
+
+    @property
+    def sizes(self) -> StringDict[int]:
+        """The `structure -> size` mapping."""
+        return self._sizes.copy()
+
+    @property
+    def total(self) -> int:
+        """The total size of all structures."""
+        return sum(self._sizes.values())
+
+    @property
+    def members(self) -> int:
+        """The amount of canonical named members."""
+        return self._members
+
+    @property
+    def aliases(self) -> int:
+        """The amount of names referring to other members."""
+        return self._aliases
+
+    @property
+    def pseudo_members(self) -> int:
+        """The amount of unnamed members (unknown and composite ones)."""
+        return self._pseudo_members
+
+    def __repr__(self) -> str:
+        sizes = concat_comma_space(SIZE.format(name, size) for name, size in self._sizes.items())
+
+        return MEMORY_REPORT.format(
+            get_name(type(self)),
+            get_name(self._enum_type),
+            self.total,
+            self._members,
+            self._aliases,
+            self._pseudo_members,
+            sizes,
+        )
@@ -0,0 +1,471 @@
+from builtins import isinstance as is_instance
+from typing import AbstractSet, Any, Iterable, Iterator, MutableSet, Type, TypeVar
+
+from enum_extensions.bits import bit_at, bit_count, bit_mask, iter_bits
+from enum_extensions.enums import Enum, EnumContainer, represent_container
+from enum_extensions.flags import Flag
+from enum_extensions.string import tick
+from enum_extensions.typing import DynamicTuple, get_name
+
+__all__ = ("EnumSet",)
+
+E = TypeVar("E", bound=Enum)
+F = TypeVar("F", bound=Flag)
+
+S = TypeVar("S", bound="EnumSet[Any]")
+
+INVALID_MASK = "invalid mask {} for {}"
+POP_FROM_EMPTY = "pop from empty set"
+
+
+class EnumSet(EnumContainer[E], MutableSet[E]):
+    """Represents sets of [`Enum`][enum_extensions.enums.Enum] members.
+
+    Members are stored as bits of a single integer, indexed by their position in definition order,
+    which makes membership checks and set operations between sets of the same type
+    simple integer operations.
+
+    Example:
+        ```python
+        primary = EnumSet(Color, [Color.RED, Color.BLUE])
+
+        assert Color.RED in primary
+        assert Color.GREEN not in primary
+
+        other = primary ^ EnumSet(Color, [Color.BLUE, Color.GREEN])  # {Color.RED, Color.GREEN}
+        ```
+    """
+
+    def __init__(self, enum_type: Type[E], members: Iterable[E] = ()) -> None:
+        self._enum_type = enum_type
+
+        # class attribute access is comparatively slow, so canonical members are kept at hand,
+        # fetched on the first membership check
+        self._canonical_members: DynamicTuple[E] = ()
+
+        self._mask = 0
+
+        self.update(members)
+
+    @classmethod
+    def from_mask(cls, enum_type: Type[E], mask: int) -> "EnumSet[E]":
+        """Creates the set of `enum_type` members from the `mask` of their ordinals.
+
+        Arguments:
+            enum_type: The enumeration to create the set of.
+            mask: The mask to create the set from.
+
+        Raises:
+            ValueError: The mask contains bits that do not correspond to any members.
+
+        Returns:
+            The set created.
+        """
+        if mask & ~bit_mask(len(enum_type._member_names)):
+            raise ValueError(INVALID_MASK.format(hex(mask), tick(get_name(enum_type))))
+
+        enum_set = cls(enum_type)
+
+        enum_set._mask = mask
+
+        return enum_set
+
+    @classmethod
+    def from_flag(cls, enum_type: Type[E], flag: Flag) -> "EnumSet[E]":
+        """Creates the set of `enum_type` members named the same as the single-bit
+        members contained in the `flag`.
+
+        Example:
+            ```python
+            permissions = EnumSet.from_flag(Access, Permission.R | Permission.W)
+            ```
+
+        Arguments:
+            enum_type: The enumeration to create the set of.
+            flag: The flag to create the set from.
+
+        Raises:
+            KeyError: Some name is not found in the `enum_type`.
+
+        Returns:
+            The set created.
+        """
+        return cls(enum_type, (enum_type[member.name] for member in flag))
+
+    @classmethod
+    def all(cls, enum_type: Type[E]) -> "EnumSet[E]":
+        """Creates the set of all `enum_type` members.
+
+        Arguments:
+            enum_type: The enumeration to create the set of.
+
+        Returns:
+            The set created.
+        """
+        return cls.from_mask(enum_type, bit_mask(len(enum_type._member_names)))
+
+    @property
+    def mask(self) -> int:
+        """The mask of ordinals of the members stored."""
+        return self._mask
+
+    def to_flag(self, flag_type: Type[F]) -> F:
+        """Converts the set into the `flag_type` member, combining members named the same.
+
+        Example:
+            ```python
+            permission = EnumSet(Access, [Access.R, Access.W]).to_flag(Permission)
+            ```
+
+        Arguments:
+            flag_type: The flag to convert the set into.
+
+        Raises:
+            KeyError: Some name is not found in the `flag_type`.
+
+        Returns:
+            The combined flag member.
+        """
+        value = 0
+
+        for member in self:
+            value |= flag_type[member.name].value
+
+        return flag_type(value)
+
+    def mask_of(self, other: Iterable[Any], skip_foreign: bool = False) -> int:
+        # foreign items (the ones that can not be stored) can be skipped by operations
+        # that can only remove members, since such items are never in the set anyway
+        if is_instance(other, EnumSet):
+            self.check_combine(other)
+
+            return other._mask
+
+        ordinal_of = self.ordinal_of
+
+        mask = 0
+
+        for member in other:
+            try:
+                mask |= bit_at(ordinal_of(member))
+
+            except (TypeError, ValueError):
+                if not skip_foreign:
+                    raise
+
+        return mask
+
+    def with_mask(self: S, mask: int) -> S:
+        enum_set = type(self)(self._enum_type)
+
+        enum_set._mask = mask
+
+        return enum_set
+
+    def _from_iterable(self: S, iterable: Iterable[E]) -> S:  # type: ignore
+        return type(self)(self._enum_type, iterable)
+
+    def __contains__(self, item: Any) -> bool:
+        try:
+            ordinal = item._sort_order
+
+        except AttributeError:
+            return False
+
+        if not self._mask >> ordinal & 1:
+            return False
+
+        try:
+            return self._canonical_members[ordinal] is item  # aliases are the same objects
+
+        except IndexError:  # not fetched yet, or members were added since
+            canonical_members = self._enum_type._get_canonical_members()
+
+            self._canonical_members = canonical_members
+
+            return canonical_members[ordinal] is item
+
+    def __iter__(self) -> Iterator[E]:
+        member_of = self.member_of
+
+        for bit in iter_bits(self._mask):
+            yield member_of(bit.bit_length() - 1)
+
+    def __len__(self) -> int:
+        return bit_count(self._mask)
+
+    def __bool__(self) -> bool:
+        return self._mask != 0
+
+    def __repr__(self) -> str:
+        return represent_container(self, map(repr, self))
+
+    def __eq__(self, other: Any) -> bool:
+        if is_instance(other, EnumSet):
+            return self._enum_type is other._enum_type and self._mask == other._mask
+
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore
+
+    def add(self, member: E) -> None:
+        """Adds the `member` to the set.
+
+        Arguments:
+            member: The member to add.
+
+        Raises:
+            TypeError: The member is of another type.
+            ValueError: The member is not named or is not canonical.
+        """
+        self._mask |= bit_at(self.ordinal_of(member))
+
+    def discard(self, member: E) -> None:
+        """Removes the `member` from the set, if it is present.
+
+        Arguments:
+            member: The member to remove.
+        """
+        if member in self:
+            self._mask &= ~bit_at(member._sort_order)
+
+    def remove(self, member: E) -> None:
+        """Removes the `member` from the set.
+
+        Arguments:
+            member: The member to remove.
+
+        Raises:
+            KeyError: The member is not present.
+        """
+        if member not in self:
+            raise KeyError(member)
+
+        self._mask &= ~bit_at(member._sort_order)
+
+    def pop(self) -> E:
+        """Removes the first member, in definition order, from the set and returns it.
+
+        Raises:
+            KeyError: The set is empty.
+
+        Returns:
+            The member removed.
+        """
+        mask = self._mask
+
+        if not mask:
+            raise KeyError(POP_FROM_EMPTY)
+
+        bit = mask & -mask
+
+        self._mask = mask ^ bit
+
+        return self.member_of(bit.bit_length() - 1)
+
+    def clear(self) -> None:
+        """Removes all members from the set."""
+        self._mask = 0
+
+    def copy(self: S) -> S:
+        """Returns the copy of the set.
+
+        Returns:
+            The copied set.
+        """
+        return self.with_mask(self._mask)
+
+    def update(self, *iterables: Iterable[E]) -> None:
+        """Adds members from all `iterables` to the set.
+
+        Arguments:
+            *iterables: The iterables of members to add.
+        """
+        for iterable in iterables:
+            self._mask |= self.mask_of(iterable)
+
+    def union(self: S, *iterables: Iterable[E]) -> S:
+        """Returns the union of the set and all `iterables`.
+
+        Arguments:
+            *iterables: The iterables of members.
+
+        Raises:
+            TypeError: Some member is of another type.
+            ValueError: Some member is not named or is not canonical.
+
+        Returns:
+            The new set.
+        """
+        mask = self._mask
+
+        for iterable in iterables:
+            mask |= self.mask_of(iterable)
+
+        return self.with_mask(mask)
+
+    def intersection(self: S, *iterables: Iterable[E]) -> S:
+        """Returns the intersection of the set and all `iterables`.
+
+        Arguments:
+            *iterables: The iterables of members.
+
+        Returns:
+            The new set.
+        """
+        mask = self._mask
+
+        for iterable in iterables:
+            mask &= self.mask_of(iterable, skip_foreign=True)
+
+        return self.with_mask(mask)
+
+    def difference(self: S, *iterables: Iterable[E]) -> S:
+        """Returns the set of members that are not in any of the `iterables`.
+
+        Arguments:
+            *iterables: The iterables of members.
+
+        Returns:
+            The new set.
+        """
+        mask = self._mask
+
+        for iterable in iterables:
+            mask &= ~self.mask_of(iterable, skip_foreign=True)
+
+        return self.with_mask(mask)
+
+    def symmetric_difference(self: S, iterable: Iterable[E]) -> S:
+        """Returns the set of members that are either in the set or in the `iterable`, but not both.
+
+        Arguments:
+            iterable: The iterable of members.
+
+        Raises:
+            TypeError: Some member is of another type.
+            ValueError: Some member is not named or is not canonical.
+
+        Returns:
+            The new set.
+        """
+        return self.with_mask(self._mask ^ self.mask_of(iterable))
+
+    def complement(self: S) -> S:
+        """Returns the set of all members that are not in the set.
+
+        Returns:
+            The new set.
+        """
+        return self.with_mask(~self._mask & bit_mask(len(self._enum_type._member_names)))
+
+    def issubset(self, iterable: Iterable[E]) -> bool:
+        """Checks whether all members of the set are in the `iterable`.
+
+        Arguments:
+            iterable: The iterable of members.
+
+        Returns:
+            Whether the set is the subset of the `iterable`.
+        """
+        return not self._mask & ~self.mask_of(iterable, skip_foreign=True)
+
+    def issuperset(self, iterable: Iterable[E]) -> bool:
+        """Checks whether all members of the `iterable` are in the set.
+
+        Arguments:
+            iterable: The iterable of members.
+
+        Returns:
+            Whether the set is the superset of the `iterable`.
+        """
+        if is_instance(iterable, EnumSet) and iterable._enum_type is self._enum_type:
+            return not iterable._mask & ~self._mask
+
+        # foreign items are never in the set, just like with `set`
+        return all(map(self.__contains__, iterable))
+
+    def isdisjoint(self, iterable: Iterable[Any]) -> bool:
+        """Checks whether the set and the `iterable` have no members in common.
+
+        Arguments:
+            iterable: The iterable of members.
+
+        Returns:
+            Whether the set and the `iterable` are disjoint.
+        """
+        if is_instance(iterable, EnumSet) and iterable._enum_type is self._enum_type:
+            return not self._mask & iterable._mask
+
+        return super().isdisjoint(iterable)
+
+    def __le__(self, other: AbstractSet[Any]) -> bool:
+        if is_instance(other, EnumSet) and other._enum_type is self._enum_type:
+            return not self._mask & ~other._mask
+
+        return super().__le__(other)
+
+    def __lt__(self, other: AbstractSet[Any]) -> bool:
+        if is_instance(other, EnumSet) and other._enum_type is self._enum_type:
+            return self._mask != other._mask and not self._mask & ~other._mask
+
+        return super().__lt__(other)
+
+    def __ge__(self, other: AbstractSet[Any]) -> bool:
+        if is_instance(other, EnumSet) and other._enum_type is self._enum_type:
+            return not other._mask & ~self._mask
+
+        return super().__ge__(other)
+
+    def __gt__(self, other: AbstractSet[Any]) -> bool:
+        if is_instance(other, EnumSet) and other._enum_type is self._enum_type:
+            return self._mask != other._mask and not other._mask & ~self._mask
+
+        return super().__gt__(other)
+
+    def __or__(self: S, other: Any) -> S:  # type: ignore
+        if is_instance(other, AbstractSet):
+            return self.union(other)
+
+        return NotImplemented
+
+    def __and__(self: S, other: Any) -> S:  # type: ignore
+        if is_instance(other, AbstractSet):
+            return self.intersection(other)
+
+        return NotImplemented
+
+    def __sub__(self: S, other: Any) -> S:  # type: ignore
+        if is_instance(other, AbstractSet):
+            return self.difference(other)
+
+        return NotImplemented
+
+    def __xor__(self: S, other: Any) -> S:  # type: ignore
+        if is_instance(other, AbstractSet):
+            return self.symmetric_difference(other)
+
+        return NotImplemented
+
+    def __ior__(self: S, other: AbstractSet[E]) -> S:  # type: ignore
+        self._mask |= self.mask_of(other)
+
+        return self
+
+    def __iand__(self: S, other: AbstractSet[E]) -> S:  # type: ignore
+        self._mask &= self.mask_of(other, skip_foreign=True)
+
+        return self
+
+    def __isub__(self: S, other: AbstractSet[E]) -> S:  # type: ignore
+        self._mask &= ~self.mask_of(other, skip_foreign=True)
+
+        return self
+
+    def __ixor__(self: S, other: AbstractSet[E]) -> S:  # type: ignore
+        self._mask ^= self.mask_of(other)
+
+        return self
+
+    def __invert__(self: S) -> S:
+        return self.complement()
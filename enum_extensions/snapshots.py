@@ -0,0 +1,343 @@
+"""Snapshots of enumerations, which allow to skip rebuilding them from their sources.
+
+Snapshots are stored using [`pickle`][pickle], therefore they should only be loaded
+from trusted locations.
+"""
+
+from builtins import isinstance as is_instance
+from hashlib import sha256
+from os import replace
+from pathlib import Path
+from pickle import HIGHEST_PROTOCOL, UnpicklingError, dump, load
+from typing import IO, Any, Generic, Iterator, List, Optional, Tuple, Type, TypeVar, Union
+
+from enum_extensions import __version__
+from enum_extensions.constants import COMPACT_PRIVATE, DOCUMENTATION, MODULE, QUALIFIED_NAME
+from enum_extensions.enums import Enum, create_enum_member, defer_enum_member, find_body_names
+from enum_extensions.string import concat_comma_space, tick
+from enum_extensions.typing import AnyPath, AnyType, DynamicTuple, Nullary, StringDict, get_name
+
+__all__ = ("EnumSnapshot", "cached_enum", "fingerprint")
+
+E = TypeVar("E", bound=Enum)
+
+S = TypeVar("S", bound="EnumSnapshot[Any]")
+
+SNAPSHOT_VERSION = 2
+
+TEMPORARY = ".tmp"
+
+EXPECTED_SNAPSHOT = "expected snapshot in {}, got {}"
+CAN_NOT_SNAPSHOT = "can not take the snapshot of {}; names defined in its body: {}"
+
+CHUNK_SIZE = 1 << 16
+
+READ_BINARY = "rb"
+WRITE_BINARY = "wb"
+
+
+class EnumSnapshot(Generic[E]):
+    """Represents the resolved member table of some [`Enum`][enum_extensions.enums.Enum].
+
+    Restoring the snapshot creates members straight from the table, skipping
+    namespace processing; flags also skip recomputing their masks.
+
+    Only members and their values are stored, along with the state of the enumeration itself;
+    methods have to be defined on the bases, which are stored by reference.
+    Enumerations that define anything else in their bodies can not be snapshotted.
+
+    Example:
+        ```python
+        snapshot = EnumSnapshot.from_enum(Color, fingerprint("colors.tsv"))
+
+        snapshot.save("colors.snapshot")
+
+        Color = EnumSnapshot.load("colors.snapshot").restore()
+        ```
+    """
+
+    def __init__(
+        self,
+        fingerprint: str,
+        meta: AnyType,
+        name: str,
+        module: str,
+        qualified_name: str,
+        documentation: Optional[str],
+        bases: DynamicTuple[AnyType],
+        members: List[Tuple[str, Any]],
+        state: StringDict[Any],
+    ) -> None:
+        self._fingerprint = fingerprint
+        self._version = __version__
+        self._snapshot_version = SNAPSHOT_VERSION
+
+        self._meta = meta
+        self._name = name
+        self._module = module
+        self._qualified_name = qualified_name
+        self._documentation = documentation
+        self._bases = bases
+
+        self._members = members
+
+        self._state = state
+
+    @classmethod
+    def from_enum(cls: Type[S], enum_type: Type[E], fingerprint: str) -> S:
+        """Takes the snapshot of the `enum_type`.
+
+        Members created via [`enum_missing`][enum_extensions.enums.EnumType.enum_missing]
+        are not included.
+
+        Arguments:
+            enum_type: The enumeration to take the snapshot of.
+            fingerprint: The fingerprint of the sources of the enumeration.
+
+        Raises:
+            TypeError: The enumeration defines names other than members in its body.
+
+        Returns:
+            The snapshot taken.
+        """
+        body_names = find_body_names(enum_type)
+
+        if body_names:
+            names = concat_comma_space(map(tick, sorted(body_names)))
+
+            raise TypeError(CAN_NOT_SNAPSHOT.format(tick(get_name(enum_type)), names))
+
+        members = [(name, member.__enum_value__) for name, member in enum_type.members.items()]
+
+        return cls(
+            fingerprint,
+            type(enum_type),
+            enum_type.__name__,
+            enum_type.__module__,
+            enum_type.__qualname__,
+            enum_type.__doc__,
+            enum_type._bases,
+            members,
+            enum_type._snapshot_state(),
+        )
+
+    @property
+    def fingerprint(self) -> str:
+        """The fingerprint of the sources of the enumeration."""
+        return self._fingerprint
+
+    @property
+    def version(self) -> str:
+        """The version of the library the snapshot was taken with."""
+        return self._version
+
+    @property
+    def name(self) -> str:
+        """The name of the enumeration."""
+        return self._name
+
+    @property
+    def members(self) -> List[Tuple[str, Any]]:
+        """The `(name, value)` pairs of the members, including aliases, in definition order."""
+        return self._members
+
+    def is_valid(self, fingerprint: str) -> bool:
+        """Checks whether the snapshot matches the `fingerprint` and the library version.
+
+        Arguments:
+            fingerprint: The fingerprint of the sources of the enumeration.
+
+        Returns:
+            Whether the snapshot can be restored.
+        """
+        return (
+            self._fingerprint == fingerprint
+            and self._version == __version__
+            and self._snapshot_version == SNAPSHOT_VERSION
+        )
+
+    def restore(self, lazy: bool = False) -> Type[E]:
+        """Restores the enumeration from the snapshot.
+
+        Arguments:
+            lazy: Whether to create members on first access only.
+                Flags are always restored eagerly, since their masks depend on all members.
+
+        Returns:
+            The restored enumeration.
+        """
+        meta: Any = self._meta  # some subclass of `EnumType`
+        name = self._name
+        bases = self._bases
+
+        namespace = meta.__prepare__(name, bases)
+
+        namespace[MODULE] = self._module
+        namespace[QUALIFIED_NAME] = self._qualified_name
+        namespace[DOCUMENTATION] = self._documentation
+
+        state = self._state
+
+        compact = state.get(COMPACT_PRIVATE)
+
+        *_, enum_base = bases
+
+        if enum_base._flag:
+            lazy = False  # flags do not support lazy members
+
+        enum_type: Type[E]
+
+        # slots have to be known before the enumeration is created
+        if lazy:
+            enum_type = meta(name, bases, namespace, lazy=lazy, compact=compact)
+
+        else:
+            enum_type = meta(name, bases, namespace, compact=compact)
+
+        data_type = enum_type._data_type
+        new_function = enum_type._new_function
+        new_use_args = enum_type._new_use_args
+        dynamic_attributes = enum_type._dynamic_attributes
+        flag = enum_type._flag
+
+        for member_name, value in self._members:
+            if lazy:
+                defer_enum_member(
+                    member_name,
+                    value,
+                    data_type,
+                    enum_type,
+                    new_function,
+                    new_use_args,
+                    dynamic_attributes,
+                )
+
+            else:
+                create_enum_member(
+                    member_name,
+                    value,
+                    data_type,
+                    enum_type,
+                    new_function,
+                    new_use_args,
+                    dynamic_attributes,
+                    flag,
+                )
+
+        enum_type._restore_state(state)
+
+        return enum_type
+
+    def save(self, path: AnyPath) -> None:
+        """Saves the snapshot to the `path`, atomically.
+
+        Arguments:
+            path: The path to save the snapshot to.
+        """
+        path = Path(path)
+
+        temporary = path.with_name(path.name + TEMPORARY)
+
+        with temporary.open(WRITE_BINARY) as file:
+            dump(self, file, protocol=HIGHEST_PROTOCOL)
+
+        replace(temporary, path)
+
+    @classmethod
+    def load(cls: Type[S], path: AnyPath) -> S:
+        """Loads the snapshot from the `path`.
+
+        Arguments:
+            path: The path to load the snapshot from.
+
+        Raises:
+            TypeError: The file does not contain the snapshot.
+
+        Returns:
+            The snapshot loaded.
+        """
+        with Path(path).open(READ_BINARY) as file:
+            snapshot = load(file)
+
+        if not is_instance(snapshot, cls):
+            raise TypeError(
+                EXPECTED_SNAPSHOT.format(tick(str(path)), tick(get_name(type(snapshot))))
+            )
+
+        return snapshot
+
+
+def fingerprint(*sources: Union[AnyPath, bytes]) -> str:
+    """Computes the fingerprint of the `sources`, which are either paths to files or raw data.
+
+    Example:
+        ```python
+        key = fingerprint("currencies.tsv", VERSION.encode())
+        ```
+
+    Arguments:
+        *sources: The sources of the enumeration.
+
+    Returns:
+        The hex digest of the sources.
+    """
+    hasher = sha256()
+
+    for source in sources:
+        if is_instance(source, bytes):
+            hasher.update(source)
+
+        else:
+            with Path(source).open(READ_BINARY) as file:
+                for chunk in iter_chunks(file):
+                    hasher.update(chunk)
+
+    return hasher.hexdigest()
+
+
+def iter_chunks(file: IO[bytes]) -> Iterator[bytes]:
+    return iter(lambda: file.read(CHUNK_SIZE), bytes())
+
+
+CAN_NOT_LOAD = (OSError, EOFError, UnpicklingError, AttributeError, ImportError, TypeError)
+
+
+def cached_enum(
+    path: AnyPath, fingerprint: str, factory: Nullary[Type[E]], lazy: bool = False
+) -> Type[E]:
+    """Restores the enumeration from the snapshot at `path`, if it matches the `fingerprint`,
+    otherwise creates the enumeration via `factory` and saves its snapshot.
+
+    Example:
+        ```python
+        Currency = cached_enum(
+            "currency.snapshot",
+            fingerprint(CURRENCIES),
+            lambda: StringEnum.load("Currency", CURRENCIES, delimiter=TAB),
+        )
+        ```
+
+    Arguments:
+        path: The path to the snapshot.
+        fingerprint: The fingerprint of the sources of the enumeration.
+        factory: The function to create the enumeration with.
+        lazy: Whether to create members on first access only, when restoring.
+
+    Returns:
+        The enumeration.
+    """
+    try:
+        snapshot: EnumSnapshot[E] = EnumSnapshot.load(path)
+
+    except CAN_NOT_LOAD:
+        pass
+
+    else:
+        if snapshot.is_valid(fingerprint):
+            return snapshot.restore(lazy=lazy)
+
+    enum_type = factory()
+
+    EnumSnapshot.from_enum(enum_type, fingerprint).save(path)
+
+    return enum_type
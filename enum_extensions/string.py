@@ -1,9 +1,17 @@
 from enum_extensions.constants import COMMA_SPACE, EMPTY, PIPE, SPACE, TICK, UNDER
 
-__all__ = ("case_fold", "case_fold_name", "concat_comma_space", "create_title", "tick")
+__all__ = (
+    "case_fold",
+    "case_fold_name",
+    "concat_comma_space",
+    "create_constant_name",
+    "create_title",
+    "tick",
+)
 
 concat_comma_space = COMMA_SPACE.join
 concat_pipe = PIPE.join
+concat_empty = EMPTY.join
 tick = TICK.format
 
 is_upper = str.isupper
@@ -17,6 +25,19 @@ def create_title(name: str) -> str:
     return name
 
 
+def create_constant_name(name: str) -> str:
+    characters = []
+
+    for previous, character, following in zip(SPACE + name, name, name[1:] + SPACE):
+        if is_upper(character) and previous != UNDER:
+            if is_lower(previous) or is_upper(previous) and is_lower(following):  # `aB`, `ABc`
+                characters.append(UNDER)
+
+        characters.append(character.upper())
+
+    return concat_empty(characters)
+
+
 case_fold = str.casefold
 
 
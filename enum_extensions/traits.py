@@ -11,6 +11,8 @@ T = TypeVar("T", bound="Trait")
 class Trait:
     """Base type to derive traits from."""
 
+    __slots__ = ()
+
     name: str
     value: Any
     title_name: str
@@ -19,6 +21,8 @@ class Trait:
 class Format(Trait):
     """Enforces enumeration string formatting."""
 
+    __slots__ = ()
+
     def __format__(self, specification: str) -> str:
         return str(self).__format__(specification)
 
@@ -26,6 +30,8 @@ class Format(Trait):
 class Order(Trait):
     """Implements ordering for enumerations."""
 
+    __slots__ = ()
+
     def __lt__(self: T, other: T) -> bool:
         if is_same_type(other, self):
             return self.value < other.value
@@ -54,6 +60,8 @@ class Order(Trait):
 class Title(Trait):
     """Allows handling abbreviations in titles."""
 
+    __slots__ = ()
+
     ABBREVIATIONS: ClassVar[Set[str]] = set()
 
     @dynamic_attribute
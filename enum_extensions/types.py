@@ -1,4 +1,3 @@
-from threading import Lock
 from typing import Any, Type, TypeVar, Union
 
 from typing_extensions import TypeGuard
@@ -23,16 +22,14 @@ T = TypeVar("T")
 
 class SingletonType(type):
     _INSTANCES = {}  # type: ignore
-    _LOCK = Lock()
 
     def __call__(cls: Type[S], *args: Any, **kwargs: Any) -> S:
         instances = cls._INSTANCES
-        lock = cls._LOCK
 
         if cls not in instances:
-            with lock:
-                if cls not in instances:
-                    instances[cls] = super().__call__(*args, **kwargs)
+            # racing threads might create several instances, but only one of them is kept,
+            # which avoids importing threading for locks
+            return instances.setdefault(cls, super().__call__(*args, **kwargs))
 
         return instances[cls]
 
@@ -1,5 +1,6 @@
 from builtins import hasattr as has_attribute
 from builtins import isinstance as is_instance
+from os import PathLike
 from typing import Any, Callable, Dict, Iterable, Mapping, Tuple, Type, TypeVar, Union
 
 from typing_extensions import Protocol, TypeGuard
@@ -7,6 +8,7 @@ from typing_extensions import Protocol, TypeGuard
 from enum_extensions.constants import NAME
 
 __all__ = (
+    "AnyPath",
     "AnyType",
     "StringMapping",
     "StringPairs",
@@ -41,6 +43,8 @@ R = TypeVar("R")
 
 AnyType = Type[Any]
 
+AnyPath = Union[str, "PathLike[str]"]
+
 StringMapping = Mapping[str, T]
 
 Pairs = Iterable[Tuple[T, U]]
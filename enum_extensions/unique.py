@@ -1,14 +1,12 @@
 from typing import Iterator, Tuple, Type, TypeVar
 
 from enum_extensions.enums import Enum
-from enum_extensions.flags import Flag
 from enum_extensions.string import concat_comma_space, tick
 from enum_extensions.typing import get_name
 
 __all__ = ("unique",)
 
 ET = TypeVar("ET", bound="Type[Enum]")
-FT = TypeVar("FT", bound="Type[Flag]")
 
 
 MAPS = "{} -> {}"
@@ -1,7 +1,7 @@
 from builtins import hasattr as has_attribute
 from builtins import setattr as set_attribute
 from itertools import chain
-from typing import Any, Iterable, Iterator, Tuple, Type, TypeVar
+from typing import Any, Iterable, Iterator, List, Sequence, Tuple, Type, TypeVar, Union, overload
 
 from typing_extensions import Never, TypeVarTuple, Unpack
 
@@ -16,17 +16,20 @@ from enum_extensions.constants import (
     UNDER,
     UNKNOWN,
 )
-from enum_extensions.string import tick
-from enum_extensions.typing import Namespace, get_name
+from enum_extensions.string import concat_comma_space, tick
+from enum_extensions.typing import AnyType, DynamicTuple, Namespace, get_name
 
 __all__ = (
     "get_frame",
     "is_descriptor",
     "is_double_under_name",
+    "linearize",
+    "lookup_attribute",
     "make_namespace_unpicklable",
     "make_type_unpicklable",
     "tuple_args",
     "prepend",
+    "SequenceView",
 )
 
 try:
@@ -118,3 +121,92 @@ def tuple_args(*args: Unpack[Args]) -> Tuple[Unpack[Args]]:
 
 def prepend(item: T, iterable: Iterable[T]) -> Iterator[T]:
     return chain(tuple_args(item), iterable)
+
+
+VIEW_REPRESENTATION = "{}({})"
+
+
+class SequenceView(Sequence[T]):
+    """Provides the read-only view of the `sequence`, without copying it."""
+
+    def __init__(self, sequence: Sequence[T]) -> None:
+        self._sequence = sequence
+
+    def __repr__(self) -> str:
+        return VIEW_REPRESENTATION.format(get_name(type(self)), repr(self._sequence))
+
+    @overload
+    def __getitem__(self, index: int) -> T:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[T]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, Sequence[T]]:
+        return self._sequence[index]
+
+    def __len__(self) -> int:
+        return len(self._sequence)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._sequence)
+
+    def __reversed__(self) -> Iterator[T]:
+        return reversed(self._sequence)
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._sequence
+
+
+INCONSISTENT_MRO = "can not create a consistent method resolution order (MRO) for bases {}"
+
+
+def merge_linearizations(linearizations: Iterable[Sequence[AnyType]]) -> List[AnyType]:
+    sequences = [list(linearization) for linearization in linearizations if linearization]
+
+    result: List[AnyType] = []
+
+    while sequences:
+        for sequence in sequences:
+            head = sequence[0]
+
+            if not any(head in other[1:] for other in sequences):
+                break
+
+        else:
+            heads = concat_comma_space(tick(get_name(sequence[0])) for sequence in sequences)
+
+            raise TypeError(INCONSISTENT_MRO.format(heads))
+
+        result.append(head)
+
+        for sequence in sequences:
+            if sequence[0] is head:
+                del sequence[0]
+
+        sequences = [sequence for sequence in sequences if sequence]
+
+    return result
+
+
+def linearize(bases: DynamicTuple[AnyType]) -> List[AnyType]:
+    """Computes the C3 linearization of the type with `bases`, excluding the type itself."""
+    if not bases:
+        return [object]
+
+    linearizations: List[Sequence[AnyType]] = [base.__mro__ for base in bases]
+
+    linearizations.append(bases)
+
+    return merge_linearizations(linearizations)
+
+
+def lookup_attribute(mro: Iterable[AnyType], name: str, default: Any = None) -> Any:
+    for type in mro:
+        namespace = vars(type)
+
+        if name in namespace:
+            return namespace[name]
+
+    return default
@@ -0,0 +1,12 @@
+from typing import Iterator
+
+import pytest
+
+from enum_extensions.enums import clear_enum_cache
+
+
+@pytest.fixture(autouse=True)
+def enum_cache() -> Iterator[None]:
+    yield
+
+    clear_enum_cache()  # cached enumerations should not leak between tests
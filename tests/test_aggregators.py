@@ -0,0 +1,143 @@
+import pickle
+
+import pytest
+
+from enum_extensions.aggregators import FlagAggregator
+from enum_extensions.flags import KEEP, STRICT, Flag
+
+
+class Permission(Flag, boundary=STRICT):
+    N = 0
+    X = 1
+    W = 2
+    R = 4
+
+
+class Color(Flag):
+    RED = 1
+    GREEN = 2
+    BLUE = 4
+
+
+RW = Permission.R | Permission.W
+RX = Permission.R | Permission.X
+
+VALUES = (RW, RX, Permission.R, RW.value, Permission.X.value)
+
+
+class TestFlagAggregator:
+    def test_empty(self) -> None:
+        aggregator = FlagAggregator(Permission)
+
+        assert not aggregator.total
+        assert not aggregator.or_mask
+        assert not aggregator.and_mask
+
+        assert aggregator.union() is Permission.N
+        assert aggregator.intersection() is Permission.N
+
+    def test_add(self) -> None:
+        aggregator = FlagAggregator(Permission)
+
+        aggregator.add(RW)
+        aggregator.add(RX.value, 2)
+
+        assert aggregator.total == 3
+
+        assert aggregator.value_counts() == {RW.value: 1, RX.value: 2}
+
+        assert aggregator.union() is Permission.R | Permission.W | Permission.X
+        assert aggregator.intersection() is Permission.R
+
+    def test_add_wrong_type(self) -> None:
+        aggregator = FlagAggregator(Permission)
+
+        with pytest.raises(TypeError):
+            aggregator.add(Color.RED)
+
+        with pytest.raises(TypeError):
+            aggregator.add_many([Permission.R, Color.RED])
+
+        assert aggregator.total == 1
+
+    def test_add_invalid_value(self) -> None:
+        aggregator = FlagAggregator(Permission)
+
+        with pytest.raises(ValueError):
+            aggregator.add(-9)
+
+        with pytest.raises(ValueError):
+            aggregator.add(8)
+
+        with pytest.raises(ValueError):
+            aggregator.add_many([Permission.R, 16])
+
+        assert aggregator.total == 1
+
+    def test_add_skipped_bits(self) -> None:
+        class Skipped(Flag, boundary=STRICT):
+            A = 1
+            C = 4
+
+        aggregator = FlagAggregator(Skipped)
+
+        with pytest.raises(ValueError):
+            aggregator.add(2)
+
+        aggregator.add(5)
+
+        assert aggregator.union() is Skipped.A | Skipped.C
+
+    def test_add_keep(self) -> None:
+        class Kept(Flag, boundary=KEEP):
+            A = 1
+            B = 2
+
+        aggregator = FlagAggregator(Kept, [8, Kept.A])
+
+        assert aggregator.union() is Kept(9)
+        assert aggregator.most_common() == [(Kept(8), 1), (Kept.A, 1)]
+
+    def test_bit_counts(self) -> None:
+        aggregator = FlagAggregator(Permission, VALUES)
+
+        assert aggregator.bit_counts() == {Permission.X: 2, Permission.W: 2, Permission.R: 4}
+
+    def test_most_common(self) -> None:
+        aggregator = FlagAggregator(Permission, VALUES)
+
+        assert aggregator.most_common(1) == [(RW, 2)]
+
+        assert len(aggregator.most_common()) == 4
+
+    def test_merge(self) -> None:
+        left = FlagAggregator(Permission, VALUES[:2])
+        right = FlagAggregator(Permission, VALUES[2:])
+
+        merged = left + right
+
+        expected = FlagAggregator(Permission, VALUES)
+
+        assert merged.value_counts() == expected.value_counts()
+
+        assert merged.total == expected.total
+
+        assert merged.or_mask == expected.or_mask
+        assert merged.and_mask == expected.and_mask
+
+        assert left.total == 2  # not modified
+
+        left += right
+
+        assert left.value_counts() == expected.value_counts()
+
+    def test_merge_different_types(self) -> None:
+        with pytest.raises(ValueError):
+            FlagAggregator(Permission).merge(FlagAggregator(Color))  # type: ignore
+
+    def test_pickle(self) -> None:
+        aggregator = FlagAggregator(Permission, VALUES)
+
+        unpickled = pickle.loads(pickle.dumps(aggregator))
+
+        assert unpickled.value_counts() == aggregator.value_counts()
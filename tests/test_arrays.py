@@ -0,0 +1,114 @@
+import pickle
+
+import pytest
+
+from enum_extensions.arrays import EnumArray
+from enum_extensions.enums import Enum
+from enum_extensions.flags import Flag
+
+
+class Color(Enum):
+    RED = 1
+    GREEN = 2
+    BLUE = 3
+    CRIMSON = 1  # alias
+
+
+class Other(Enum):
+    RED = 1
+
+
+class Permission(Flag):
+    R = 4
+    W = 2
+    X = 1
+
+
+class TestEnumArray:
+    def test_access(self) -> None:
+        colors = EnumArray(Color, [Color.RED, Color.BLUE, 2])
+
+        assert colors.typecode == "B"
+
+        assert colors[0] is Color.RED
+        assert colors[-1] is Color.GREEN
+
+        assert colors[1:] == EnumArray(Color, [Color.BLUE, Color.GREEN])
+
+        assert list(colors) == [Color.RED, Color.BLUE, Color.GREEN]
+
+        assert Color.CRIMSON in colors
+        assert Other.RED not in colors
+
+    def test_mutation(self) -> None:
+        colors = EnumArray(Color)
+
+        colors.append(Color.RED)
+        colors.extend([3, Color.GREEN])
+        colors.insert(0, Color.BLUE)
+
+        colors[1] = Color.GREEN
+        colors[2:] = [Color.RED]
+
+        assert list(colors) == [Color.BLUE, Color.GREEN, Color.RED]
+
+        del colors[0]
+
+        colors += [Color.GREEN]
+
+        assert colors.ordinals.tolist() == [1, 0, 1]
+
+        with pytest.raises(ValueError):
+            colors.append(13)
+
+        with pytest.raises(TypeError):
+            colors.append(Other.RED)
+
+        with pytest.raises(ValueError):
+            EnumArray(Permission, [Permission.R | Permission.W])
+
+    def test_count_and_index(self) -> None:
+        colors = EnumArray(Color, [1, 2, 1, 3, 1])
+
+        assert colors.count(Color.RED) == 3
+        assert colors.count(Other.RED) == 0
+
+        assert colors.counts() == {Color.RED: 3, Color.GREEN: 1, Color.BLUE: 1}
+
+        assert colors.index(Color.RED, 1) == 2
+
+        with pytest.raises(ValueError):
+            colors.index(Color.GREEN, 2)
+
+    def test_growth(self) -> None:
+        Codes = Enum.build("Codes", [(str(value), value) for value in range(256)])
+
+        codes = EnumArray(Codes, [0, 255])
+
+        assert codes.typecode == "B"
+
+        code = Codes.add_member("CODE", 256)
+
+        codes.append(code)
+
+        assert codes.typecode == "H"
+
+        assert codes[-1] is code
+
+    def test_ordinals(self) -> None:
+        colors = EnumArray.from_ordinals(Color, [2, 0])
+
+        assert list(colors) == [Color.BLUE, Color.RED]
+
+        assert bytes(memoryview(colors.ordinals)) == bytes([2, 0])
+
+        with pytest.raises(ValueError):
+            EnumArray.from_ordinals(Color, [3])
+
+    def test_repr(self) -> None:
+        assert repr(EnumArray(Color, [1])) == "EnumArray(Color, [<Color.RED: 1>])"
+
+    def test_pickle(self) -> None:
+        colors = EnumArray(Color, [1, 2, 3])
+
+        assert pickle.loads(pickle.dumps(colors)) == colors
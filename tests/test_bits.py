@@ -1,4 +1,12 @@
-from enum_extensions.bits import bin, bit_at, bit_count, bit_mask, is_single_bit, iter_bits
+from enum_extensions.bits import (
+    bin,
+    bit_at,
+    bit_count,
+    bit_mask,
+    is_single_bit,
+    iter_bits,
+    iter_submasks,
+)
 
 INDEX = 4
 
@@ -68,3 +76,9 @@ class TestBinary:
                 string = bin(binary)
 
                 assert self.parse(string) == binary
+
+
+def test_iter_submasks() -> None:
+    assert tuple(iter_submasks(BIT_MASK)) == tuple(range(BIT_AT))
+
+    assert tuple(iter_submasks(ZERO, BIT_AT)) == (BIT_AT,)
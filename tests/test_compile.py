@@ -0,0 +1,128 @@
+import json
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+from enum_extensions.compile import compile_module, find_enum, load_spec, main
+from enum_extensions.enums import EPHEMERAL, Enum, IntEnum
+from enum_extensions.flags import KEEP, Flag
+from enum_extensions.traits import Order
+
+SPEC = [
+    {"name": "Color", "type": "IntEnum", "members": ["RED", "GREEN", ["BLUE", 4], ["AZURE", 4]]},
+    {"name": "Permission", "type": "Flag", "members": {"X": 1, "W": 2, "R": 4}},
+]
+
+
+class Point(Enum, compact=True):
+    """A point."""
+
+    ORIGIN = (0, 0)
+
+
+class Loose(Flag, boundary=KEEP):
+    A = 1
+
+
+class Status(IntEnum, unknown=EPHEMERAL):
+    OK = 200
+
+
+class Size(Order, Enum):
+    SMALL = 1
+    LARGE = 2
+
+
+class Broken(Enum):
+    OBJECT = object()
+
+
+class Greeting(Enum):
+    HELLO = 1
+
+    def greet(self) -> str:
+        return self.name.title()
+
+
+def execute(source: str) -> Dict[str, Any]:
+    namespace: Dict[str, Any] = {}
+
+    exec(compile(source, "<compiled>", "exec"), namespace)
+
+    return namespace
+
+
+def test_compile_spec(tmp_path: Path) -> None:
+    path = tmp_path / "spec.json"
+
+    path.write_text(json.dumps(SPEC))
+
+    namespace = execute(compile_module(load_spec(path), tables=True))
+
+    Color = namespace["Color"]
+
+    assert issubclass(Color, IntEnum)
+    assert [member.value for member in Color] == [1, 2, 4]
+    assert Color.AZURE is Color.BLUE
+
+    assert namespace["COLOR_VALUES"] == {"RED": 1, "GREEN": 2, "BLUE": 4, "AZURE": 4}
+
+    Permission = namespace["Permission"]
+
+    assert ~Permission.X == Permission.R | Permission.W
+    assert namespace["PERMISSION_MASK"] == 7
+
+
+def test_compile_live() -> None:
+    namespace = execute(compile_module([Point, Loose, Status]))
+
+    assert namespace["Point"].ORIGIN.value == (0, 0)
+    assert namespace["Point"].__doc__ == Point.__doc__
+    assert namespace["Point"]._compact
+
+    assert namespace["Loose"](2).value == 2
+
+    assert namespace["Status"]._unknown is EPHEMERAL
+
+
+def test_compile_leaves_no_types() -> None:
+    compile_module([Point])
+
+    points = [subclass for subclass in Enum.__subclasses__() if subclass.__name__ == "Point"]
+
+    assert points == [Point]
+
+
+def test_compile_bases() -> None:
+    source = compile_module([Size])
+
+    assert "class Size(Order, Enum):" in source
+
+    Compiled = execute(source)["Size"]
+
+    assert Compiled.__mro__[1:] == Size.__mro__[1:]
+
+    assert Compiled.SMALL < Compiled.LARGE
+
+
+def test_compile_invalid() -> None:
+    with pytest.raises(ValueError):
+        compile_module([Broken])
+
+    with pytest.raises(ValueError):
+        compile_module([Greeting])
+
+    with pytest.raises(ValueError):
+        find_enum(__name__)
+
+    with pytest.raises(TypeError):
+        find_enum(__name__ + ":execute")
+
+
+def test_main(tmp_path: Path) -> None:
+    output = tmp_path / "compiled.py"
+
+    main([__name__ + ":Point", "--output", str(output)])
+
+    assert "class Point(Enum, compact=True):" in output.read_text()
@@ -0,0 +1,116 @@
+import pickle
+
+import pytest
+
+from enum_extensions.counters import EnumCounter
+from enum_extensions.enums import Enum
+
+
+class Event(Enum):
+    CLICK = 1
+    SCROLL = 2
+    HOVER = 3
+    TAP = 1  # alias
+
+
+class Other(Enum):
+    CLICK = 1
+
+
+class TestEnumCounter:
+    def test_add(self) -> None:
+        counter = EnumCounter(Event)
+
+        counter.add(Event.CLICK)
+        counter.add(Event.TAP)
+        counter.add(Event.HOVER, 3)
+
+        assert counter[Event.CLICK] == 2
+        assert counter[Event.SCROLL] == 0
+        assert counter[Other.CLICK] == 0  # type: ignore
+
+        assert Event.HOVER in counter
+        assert Event.SCROLL not in counter
+
+        assert len(counter) == 2
+        assert counter.total() == 5
+
+    def test_add_many(self) -> None:
+        counter = EnumCounter(Event, [Event.SCROLL, Event.CLICK, Event.SCROLL])
+
+        counter.update_from_codes([2, 3, 3, 3])
+
+        assert counter.to_dict() == {Event.CLICK: 1, Event.SCROLL: 3, Event.HOVER: 3}
+
+        assert list(counter) == [Event.CLICK, Event.SCROLL, Event.HOVER]
+
+    def test_errors(self) -> None:
+        counter = EnumCounter(Event)
+
+        with pytest.raises(TypeError):
+            counter.add(Other.CLICK)  # type: ignore
+
+        with pytest.raises(ValueError):
+            counter.update_from_codes([13])
+
+        with pytest.raises(ValueError):
+            counter.merge(EnumCounter(Other))  # type: ignore
+
+    def test_most_common(self) -> None:
+        counter = EnumCounter(Event, [Event.HOVER, Event.SCROLL, Event.HOVER, Event.CLICK])
+
+        assert counter.most_common() == [(Event.HOVER, 2), (Event.CLICK, 1), (Event.SCROLL, 1)]
+        assert counter.most_common(1) == [(Event.HOVER, 2)]
+
+    def test_merge(self) -> None:
+        shards = [EnumCounter(Event, [Event.CLICK]), EnumCounter(Event, [Event.CLICK, Event.HOVER])]
+
+        counter = EnumCounter(Event)
+
+        counter.merge(*shards)
+
+        assert counter == {Event.CLICK: 2, Event.HOVER: 1}
+        assert counter == shards[0] + shards[1]
+
+        counter += shards[0]
+
+        assert counter[Event.CLICK] == 3
+
+        with pytest.raises(TypeError):
+            counter += [Event.CLICK]
+
+    def test_snapshot(self) -> None:
+        counter = EnumCounter(Event, [Event.SCROLL])
+
+        assert counter.snapshot(reset=True) == {Event.SCROLL: 1}
+
+        assert not counter
+
+        counter.add(Event.CLICK)
+
+        assert counter.snapshot() == {Event.CLICK: 1}
+        assert counter[Event.CLICK] == 1
+
+    def test_members_added(self) -> None:
+        class Growing(Enum):
+            A = 1
+
+        counter = EnumCounter(Growing, [Growing.A])
+
+        Growing.add_member("B", 2)
+
+        counter.add(Growing.B)  # type: ignore
+        counter.add_many([Growing.B, Growing.A])  # type: ignore
+
+        assert counter.to_dict() == {Growing.A: 2, Growing.B: 2}  # type: ignore
+
+    def test_repr(self) -> None:
+        assert repr(EnumCounter(Event)) == "EnumCounter(Event)"
+        counter = EnumCounter(Event, [Event.CLICK])
+
+        assert repr(counter) == "EnumCounter(Event, {<Event.CLICK: 1>: 1})"
+
+    def test_pickle(self) -> None:
+        counter = EnumCounter(Event, [Event.CLICK, Event.HOVER])
+
+        assert pickle.loads(pickle.dumps(counter)) == counter
@@ -1,13 +1,30 @@
+import gc
 import pickle
+import weakref
 from builtins import hasattr as has_attribute
+from builtins import isinstance as is_instance
+from io import StringIO
 from math import sqrt
-from typing import Any, Type, TypeVar
+from pathlib import Path
+from types import DynamicClassAttribute as dynamic_attribute
+from typing import Any, List, Optional, Sequence, Type, TypeVar
 
 import pytest
 from typing_extensions import Never
 
+from enum_extensions import enums
 from enum_extensions.auto import auto
-from enum_extensions.enums import Enum, IntEnum, StringEnum, find_data_type
+from enum_extensions.constants import TAB
+from enum_extensions.enums import (
+    EPHEMERAL,
+    Enum,
+    IntEnum,
+    StringEnum,
+    clear_enum_cache,
+    copy_values,
+    find_data_type,
+)
+from enum_extensions.flags import Flag
 
 
 class Empty(Enum):
@@ -113,6 +130,32 @@ class TestCreate:
             BLUE=auto(),
         )
 
+    def test_create_cached(self) -> None:
+        created = Enum(COLOR, {RED: auto(), GREEN: auto()}, cached=True)
+
+        assert Enum(COLOR, {RED: auto(), GREEN: auto()}, cached=True) is created
+        assert Enum(COLOR, (RED, GREEN), cached=True) is not created
+
+        assert Enum(COLOR, {RED: 1}, cached=True) is not Enum(COLOR, {RED: True}, cached=True)
+
+        assert IntEnum(COLOR, {RED: 1}, cached=True) is not Enum(COLOR, {RED: 1}, cached=True)
+
+        assert Enum(COLOR, {RED: 1}, cached=True) is not Enum(COLOR, {RED: 1})
+
+    def test_create_cached_unhashable(self) -> None:
+        assert Enum(COLOR, {RED: [1]}, cached=True) is not Enum(COLOR, {RED: [1]}, cached=True)
+
+    def test_create_cached_eviction(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(enums, "ENUM_CACHE_SIZE", 1)
+
+        clear_enum_cache()
+
+        created = Enum(COLOR, RED=1, cached=True)
+
+        Enum(COLOR, GREEN=2, cached=True)
+
+        assert Enum(COLOR, RED=1, cached=True) is not created
+
     def test_invalid_definition(self) -> None:
         with pytest.raises(TypeError):
             class Broken(Enum, int):
@@ -182,6 +225,12 @@ class TestCreate:
 IGNORE = "IGNORE"
 
 
+NAME = "name"
+LABEL = "label"
+
+SMALL_LABEL = "small"
+
+
 class TestSpecial:
     def test_enum_ignore(self) -> None:
         class Ignore(Enum, ignore=[IGNORE]):
@@ -195,6 +244,24 @@ class TestSpecial:
 
         assert not has_attribute(Ignore, IGNORE)
 
+    def test_dynamic_attributes(self) -> None:
+        class Base(Enum):
+            @dynamic_attribute
+            def label(self) -> str:
+                return self.name.lower()
+
+        class Size(Base):
+            name = 1
+            label = 2
+
+        class Other(Base):
+            SMALL = 1
+
+        assert Size.name.name == NAME
+        assert Size.label.label == LABEL
+
+        assert Other.SMALL.label == SMALL_LABEL
+
     def test_enum_missing(self) -> None:
         C = TypeVar("C", bound="Color")
 
@@ -250,6 +317,30 @@ class TestSpecial:
         assert unknown.__enum_name__ is None
         assert not unknown.__enum_value__
 
+    def test_unknown_ephemeral(self) -> None:
+        class Status(Enum, unknown=EPHEMERAL):
+            OK = 200
+
+        status = Status(404)
+
+        assert is_instance(status, Status)
+        assert status.name == "UNKNOWN"
+        assert status.value == 404
+        assert repr(status) == "<Status.UNKNOWN: 404>"
+
+        assert Status(404) is status  # cached while used
+        assert Status._member_values == [200]  # but not registered
+
+        reference = weakref.ref(status)
+
+        del status
+
+        gc.collect()
+
+        assert reference() is None
+
+        assert Status([]).value == []  # unhashable values are not cached
+
 
 MRO = "mro"
 
@@ -423,6 +514,20 @@ class TestEnum:
     def test_member_repr(self) -> None:
         assert repr(Grade.F) == "<Grade.F: 1>"
 
+    def test_member_strings_cached(self) -> None:
+        class Status(Enum, unknown=True):
+            OK = 200
+
+        assert str(Status.OK) is str(Status.OK)
+        assert repr(Status.OK) is repr(Status.OK)
+
+        assert str(Status(404)) == "Status.UNKNOWN"
+
+        Status.__name__ = "Renamed"
+
+        assert str(Status.OK) == "Renamed.OK"
+        assert repr(Status.OK) == "<Renamed.OK: 200>"
+
     def test_pickle(self) -> None:
         assert pickle.loads(pickle.dumps(Constant.TAU)) is Constant.TAU
 
@@ -432,6 +537,14 @@ class TestEnum:
 
 BLACK = "BLACK"
 
+ONE = "ONE"
+TWO = "TWO"
+
+GONE = "GONE"
+NOT_FOUND = "NOT_FOUND"
+
+BROKEN_VALUE_STRING = "broken"
+
 
 class TestMutation:
     def test_add_member(self) -> None:
@@ -457,3 +570,411 @@ class TestMutation:
 
         with pytest.raises(ValueError):
             Color.update(BLACK=auto())
+
+    def test_add_members(self) -> None:
+        class Color(Enum):
+            RED = 1
+
+        Color.add_members([(GREEN, 2), (BLUE, auto())])
+
+        assert Color.BLUE.value == 3
+
+        assert list(Color) == [Color.RED, Color.GREEN, Color.BLUE]
+
+    def test_add_members_rollback(self) -> None:
+        class Positive(IntEnum):
+            ONE = 1
+
+        with pytest.raises(ValueError):
+            Positive.add_members({TWO: 2, ONE: 1})
+
+        with pytest.raises(ValueError):
+            Positive.add_members({TWO: 2, BROKEN: BROKEN_VALUE_STRING})  # fails conversion
+
+        assert not has_attribute(Positive, TWO)
+        assert TWO not in Positive.members
+
+        assert list(Positive.members) == [ONE]
+
+        Positive.add_members({TWO: 2})
+
+        assert Positive(2) is Positive.TWO
+
+    def test_add_members_lazy(self) -> None:
+        Lazy = Enum.create("Lazy", {ONE: 1}, lazy=True)
+
+        with pytest.raises(ValueError):
+            Lazy.add_members({TWO: 2, ONE: 1})
+
+        Lazy.add_members({TWO: 2})
+
+        assert list(Lazy.members) == [ONE, TWO]
+
+    def test_ordinals(self) -> None:
+        class Status(Enum, unknown=True):
+            OK = 200
+            FINE = 200  # alias
+            CREATED = 201
+
+        assert [member.ordinal for member in Status] == [0, 1]
+        assert Status.FINE.ordinal == 0
+
+        unknown = Status(404)
+
+        with pytest.raises(ValueError):
+            unknown.ordinal
+
+        assert Status.by_ordinal(1) is Status.CREATED
+
+        with pytest.raises(IndexError):
+            Status.by_ordinal(-1)
+
+        Status.add_member(GONE, 410)
+
+        assert Status.by_ordinal(2).ordinal == 2  # ordinals are dense and stable
+        assert Status.CREATED.ordinal == 1
+
+        with pytest.raises(IndexError):
+            Status.by_ordinal(3)
+
+        with pytest.raises(ValueError):
+            Status.add_members({NOT_FOUND: 404, GONE: 410})
+
+        with pytest.raises(IndexError):
+            Status.by_ordinal(3)  # rolled back
+
+    def test_generation(self) -> None:
+        class Color(Enum):
+            RED = 1
+            GREEN = 2
+            CRIMSON = 1  # alias
+
+        generation = Color.generation
+
+        assert Color.canonical_members == (Color.RED, Color.GREEN)
+        assert Color.canonical_names == (RED, GREEN)
+
+        assert Color.canonical_members is Color.canonical_members  # cached
+        assert Color.members is Color.members
+
+        Color.add_member(BLUE, 3)
+
+        assert Color.generation > generation
+        assert Color.canonical_members == (Color.RED, Color.GREEN, Color.BLUE)  # type: ignore
+        assert Color.canonical_names == (RED, GREEN, BLUE)
+        assert tuple(reversed(Color)) == Color.canonical_members[::-1]
+
+        generation = Color.generation
+
+        with pytest.raises(ValueError):
+            Color.add_members({BLACK: 0, RED: 1})
+
+        assert Color.generation == generation  # nothing was added
+        assert list(Color) == [Color.RED, Color.GREEN, Color.BLUE]  # type: ignore
+
+    def test_generation_canonical(self) -> None:
+        class Status(Enum, unknown=True):
+            OK = 0
+
+        class Permission(Flag):
+            R = 4
+            W = 2
+            X = 1
+
+        status_generation = Status.generation
+        permission_generation = Permission.generation
+
+        canonical_members = Status.canonical_members
+
+        Status(13)
+        Permission(7)
+
+        assert Status.generation == status_generation  # unknown members
+        assert Permission.generation == permission_generation  # pseudo members
+
+        Status.add_member("FINE", 0)
+
+        assert Status.generation > status_generation  # aliases change names and lookups
+        assert Status.canonical_members is canonical_members  # but not canonical members
+
+
+class TestGenerateNextValue:
+    def test_view(self) -> None:
+        seen: List[Sequence[int]] = []
+
+        class Viewed(IntEnum):
+            @staticmethod
+            def enum_generate_next_value(
+                name: str, start: Optional[int], count: int, values: Sequence[int]
+            ) -> int:
+                seen.append(values)
+
+                return count
+
+            ZERO = auto()
+            ONE = auto()
+
+        first, second = seen
+
+        assert not is_instance(first, list)
+
+        with pytest.raises(AttributeError):
+            first.append(0)  # type: ignore
+
+        assert list(first) == list(second) == [0, 1]  # views see later values
+
+    def test_copy_values(self) -> None:
+        seen: List[Sequence[int]] = []
+
+        class Copied(IntEnum):
+            @staticmethod
+            @copy_values
+            def enum_generate_next_value(
+                name: str, start: Optional[int], count: int, values: Sequence[int]
+            ) -> int:
+                seen.append(values)
+
+                return count
+
+            ZERO = auto()
+            ONE = auto()
+
+        first, second = seen
+
+        assert first == []
+        assert second == [0]
+
+    def test_create(self) -> None:
+        Numbers = IntEnum.create("Numbers", ("ONE", "TWO", "THREE"))
+
+        assert [member.value for member in Numbers] == [1, 2, 3]
+
+
+class TestBuild:
+    def test_build(self) -> None:
+        Color = Enum.build(COLOR, [(RED, 1), GREEN, (BLUE, 3)])
+
+        assert tuple(member.name for member in Color) == NAMES
+        assert Color.GREEN.value == 2
+
+        assert Color.__module__ == __name__
+        assert Color(3) is Color.BLUE
+
+    def test_build_aliases(self) -> None:
+        Color = Enum.build(COLOR, [(RED, 1), (GREEN, 2), (BLUE, 1)])
+
+        assert Color.BLUE is Color.RED
+        assert len(Color) == 2
+
+    def test_build_invalid(self) -> None:
+        with pytest.raises(ValueError):
+            Enum.build(COLOR, [(RED, 1), (RED, 2)])
+
+        with pytest.raises(ValueError):
+            Enum.build(COLOR, ["__dunder__"])
+
+        with pytest.raises(TypeError):
+            Enum.build(COLOR, [RED], cached=True)
+
+        with pytest.raises(TypeError):
+            Enum.load(COLOR, StringIO("RED\n"), cached=True)
+
+    def test_build_progress(self) -> None:
+        reports: List[int] = []
+
+        def progress(count: int, elapsed: float) -> None:
+            assert elapsed >= 0
+
+            reports.append(count)
+
+        IntEnum.build(
+            "Numbers", ("N{}".format(value) for value in range(25)), progress=progress, every=10
+        )
+
+        assert reports == [10, 20, 25]
+
+        reports.clear()
+
+        IntEnum.build(
+            "Numbers", ("N{}".format(value) for value in range(20)), progress=progress, every=10
+        )
+
+        assert reports == [10, 20]
+
+        reports.clear()
+
+        IntEnum.build("Empty", (), progress=progress, every=10)
+
+        assert reports == [0]
+
+    def test_load(self) -> None:
+        file = StringIO("name\tvalue\nRED\t1\nGREEN\t2\n\nBLUE\t3\n")
+
+        Color = IntEnum.load(COLOR, file, delimiter=TAB, header=True, convert=int)
+
+        assert [member.value for member in Color] == [1, 2, 3]
+
+    def test_load_path(self, tmp_path: Path) -> None:
+        path = tmp_path / "color.csv"
+
+        path.write_text("RED\nGREEN,2\nBLUE,3,4\n")
+
+        Color = Enum.load(COLOR, path)
+
+        assert Color.RED.value == 1
+        assert Color.GREEN.value == "2"
+        assert Color.BLUE.value == ("3", "4")
+
+
+class LazyColor(Enum, lazy=True):
+    RED = 1
+    GREEN = 2
+    BLUE = 3
+
+
+class TestLazy:
+    def test_lazy(self) -> None:
+        created: List[int] = []
+
+        class Lazy(Enum, lazy=True):
+            def __init__(self, value: int) -> None:
+                created.append(value)
+
+            ONE = 1
+            TWO = 2
+            SECOND = 2
+            THREE = 3
+
+        assert len(Lazy) == 3
+        assert 2 in Lazy
+        assert 4 not in Lazy
+
+        assert not created
+
+        assert Lazy.SECOND is Lazy["TWO"]
+        assert Lazy(3) is Lazy.THREE
+
+        assert created == [2, 3]
+
+        assert list(Lazy) == [Lazy.ONE, Lazy.TWO, Lazy.THREE]
+
+        assert list(Lazy.members) == ["ONE", "TWO", "SECOND", "THREE"]
+
+        assert created == [2, 3, 1]
+
+        assert Lazy.by_ordinal(1) is Lazy.TWO
+
+        with pytest.raises(IndexError):
+            Lazy.by_ordinal(-1)
+
+    def test_lazy_views(self) -> None:
+        created: List[int] = []
+
+        class Lazy(Enum, lazy=True):
+            def __init__(self, value: int) -> None:
+                created.append(value)
+
+            ONE = 1
+            TWO = 2
+
+        assert Lazy.canonical_names == (ONE, TWO)
+
+        assert not created
+
+        assert Lazy.canonical_members == (Lazy.ONE, Lazy.TWO)
+
+        assert created == [1, 2]
+
+    def test_lazy_errors(self) -> None:
+        Lazy = IntEnum(COLOR, NAMES, lazy=True)
+
+        with pytest.raises(AttributeError):
+            Lazy.BLACK
+
+        with pytest.raises(AttributeError):
+            Lazy.RED = 13
+
+        with pytest.raises(ValueError):
+            Lazy.add_member(RED, 13)
+
+        with pytest.raises(ValueError):
+            Lazy(13)
+
+    def test_lazy_build(self) -> None:
+        Lazy = IntEnum.build(COLOR, NAMES, lazy=True)
+
+        assert Lazy.add_member(BLACK, 0) is Lazy(0)
+
+        assert list(Lazy) == [Lazy.RED, Lazy.GREEN, Lazy.BLUE, Lazy.BLACK]
+
+    def test_lazy_pickle(self) -> None:
+        assert pickle.loads(pickle.dumps(LazyColor.GREEN)) is LazyColor.GREEN
+
+    def test_lazy_flags(self) -> None:
+        with pytest.raises(TypeError):
+            class Lazy(Flag, lazy=True):
+                A = 1
+
+
+DICT = "__dict__"
+
+
+class CompactColor(Enum, compact=True):
+    RED = 1
+    GREEN = 2
+    BLUE = 3
+
+
+class TestCompact:
+    def test_compact(self) -> None:
+        assert not has_attribute(CompactColor.RED, DICT)
+
+        assert CompactColor(2) is CompactColor.GREEN
+        assert CompactColor.BLUE.name == BLUE
+
+    def test_compact_inherited(self) -> None:
+        class Base(Enum, compact=True):
+            def describe(self) -> str:
+                return self.name.lower()
+
+        class Compact(Base):
+            ONE = 1
+
+        assert not has_attribute(Compact.ONE, DICT)
+
+        assert Compact.ONE.describe() == ONE.lower()
+
+    def test_compact_slots(self) -> None:
+        class Compact(Enum, compact=True):
+            __slots__ = ("extra",)
+
+            ONE = 1
+
+        assert not has_attribute(Compact.ONE, DICT)
+
+        Compact.ONE.extra = 13
+
+        assert Compact.ONE.extra == 13
+        assert Compact.ONE.name == ONE
+
+    def test_compact_functional(self) -> None:
+        Compact = Enum(COLOR, NAMES, compact=True)
+
+        assert not has_attribute(Compact.RED, DICT)
+
+        with pytest.raises(AttributeError):
+            Compact.RED.extra = 13  # type: ignore
+
+    def test_compact_pickle(self) -> None:
+        assert pickle.loads(pickle.dumps(CompactColor.RED)) is CompactColor.RED
+
+    def test_compact_errors(self) -> None:
+        with pytest.raises(TypeError):
+            IntEnum(COLOR, NAMES, compact=True)
+
+        class Mixin:
+            pass
+
+        with pytest.raises(TypeError):
+            class Compact(Mixin, Enum, compact=True):
+                ONE = 1
@@ -1,6 +1,9 @@
+from builtins import hasattr as has_attribute
+
 import pytest
 
 from enum_extensions.auto import auto
+from enum_extensions.bits import minimal_cover
 from enum_extensions.flags import CONFORM, KEEP, STRICT, Flag, IntFlag, is_flag, is_flag_member
 
 
@@ -48,7 +51,10 @@ class TestCreate:
         assert is_flag(Color)  # not sure where else to put this
 
     def test_create_using_string(self) -> None:
-        Flag(COLOR, concat_space(NAMES))
+        Color = Flag(COLOR, concat_space(NAMES))
+
+        assert Color.__module__ == __name__
+        assert Flag.create(COLOR, NAMES).__module__ == __name__
 
     def test_create_using_commas(self) -> None:
         Flag(COLOR, concat_comma(NAMES))
@@ -62,6 +68,21 @@ class TestCreate:
     def test_create_using_members(self) -> None:
         Flag(COLOR, RED=auto(), GREEN=auto(), BLUE=auto())
 
+    def test_create_compact(self) -> None:
+        Compact = Flag(COLOR, NAMES, compact=True)
+
+        composite = Compact.RED | Compact.BLUE
+
+        assert not has_attribute(composite, "__dict__")
+
+        assert ~composite is Compact.GREEN
+
+    def test_create_cached(self) -> None:
+        created = Flag(COLOR, NAMES, cached=True)
+
+        assert Flag(COLOR, concat_comma(NAMES), cached=True) is created
+        assert Flag(COLOR, NAMES, boundary=KEEP, cached=True) is not created
+
     def test_create_arguments(self) -> None:
         Flag.create(
             COLOR,
@@ -132,6 +153,25 @@ class TestFlag:
         for member, representation in self.REPRESENTATION_MAPPING.items():
             assert repr(member) == representation
 
+    def test_member_strings_cached(self) -> None:
+        class Access(Flag):
+            R = 4
+            W = 2
+
+        assert str(Access.R) is str(Access.R)
+        assert repr(Access.R) is repr(Access.R)
+
+        assert str(Access.R | Access.W) == "Access.R|W"
+
+        Access.add_member("RW", 6)
+
+        assert str(Access.R | Access.W) == "Access.RW"  # composite names are not cached
+
+        Access.__name__ = "Renamed"
+
+        assert str(Access.R) == "Renamed.R"
+        assert repr(Access.R) == "<Renamed.R: 4>"
+
     def test_bool(self) -> None:
         assert Permission.R | Permission.W | Permission.X
         assert not Permission.N
@@ -431,3 +471,259 @@ class TestUpdate:
         assert repr(RWX) == "<NewPermission.RWX: 7>"
 
         assert NewPermission(0).name == N
+
+    def test_add_member_updates_mask(self) -> None:
+        class Grown(Flag):
+            A = 1
+
+        Grown.add_member("B", 2)
+
+        assert ~Grown.A is Grown.B
+
+    def test_add_members(self) -> None:
+        class Grown(IntFlag):
+            A = 1
+
+        empty = Grown(0)
+
+        Grown.add_members([("B", 2), ("C", 4)])
+
+        assert ~Grown.A is Grown.B | Grown.C
+
+        with pytest.raises(ValueError):
+            Grown.add_members([("N", 0), ("D", "broken")])  # fails conversion
+
+        assert empty.__enum_name__ is None
+        assert not has_attribute(Grown, "N")
+
+        assert ~Grown.B is Grown.A | Grown.C
+
+    def test_add_members_finalize_rollback(self) -> None:
+        class Grown(Flag):
+            A = 1
+
+        with pytest.raises(TypeError):
+            Grown.add_members([("B", 2), ("BAD", 24)])  # fails finalization (bits not covered)
+
+        assert list(Grown.members) == ["A"]
+
+        assert not has_attribute(Grown, "B")
+        assert not has_attribute(Grown, "BAD")
+
+        assert Grown._flag_mask == 1
+        assert Grown._full_mask == 1
+
+
+class TestBuild:
+    def test_build(self) -> None:
+        Permission = Flag.build("Permission", ["X", "W", "R", ("RWX", 7)])
+
+        assert Permission.RWX is Permission.R | Permission.W | Permission.X
+        assert ~Permission.X is Permission.R | Permission.W
+
+        assert list(Permission) == [Permission.X, Permission.W, Permission.R]
+
+
+class TestSubsets:
+    def test_subsets(self) -> None:
+        RX = Permission.R | Permission.X
+
+        assert list(Permission.subsets(RX)) == [Permission.N, Permission.X, Permission.R, RX]
+
+        assert list(Permission.subsets(RX.value, raw=True)) == [0, 1, 4, 5]
+
+    def test_subsets_of_nothing(self) -> None:
+        assert list(Permission.subsets(0, raw=True)) == [0]
+
+    def test_all_subsets(self) -> None:
+        assert list(Permission.subsets(~0, raw=True)) == list(range(8))
+
+    def test_supersets(self) -> None:
+        assert list(Permission.supersets(Permission.W, raw=True)) == [2, 3, 6, 7]
+
+        assert list(Permission.supersets(~Permission.N)) == [~Permission.N]
+
+    def test_boundary(self) -> None:
+        with pytest.raises(ValueError):
+            Permission.subsets(0x10)
+
+        assert list(Color.subsets(0x10 | 1, raw=True)) == [0, 1]
+
+        assert list(IntPermission.supersets(0x10, raw=True)) == [0x10 | value for value in range(8)]
+
+    def test_wrong_type(self) -> None:
+        with pytest.raises(TypeError):
+            Permission.subsets(Color.RED)
+
+
+class TestDiff:
+    def test_diff(self) -> None:
+        RW = Permission.R | Permission.W
+        WX = Permission.W | Permission.X
+
+        assert Permission.diff(RW, WX) == ((Permission.X,), (Permission.R,))
+        assert Permission.diff(RW.value, WX.value) == ((Permission.X,), (Permission.R,))
+
+        assert Permission.diff(RW, RW) == ((), ())
+
+        assert Permission.diff(0, ~Permission.N) == ((Permission.X, Permission.W, Permission.R), ())
+
+    def test_diff_unknown_bits(self) -> None:
+        assert IntPermission.diff(0x10, IntPermission.R | 0x10) == ((IntPermission.R,), ())
+
+    def test_diff_many(self) -> None:
+        pairs = [(Permission.N, Permission.R), (Permission.R, Permission.N)]
+
+        assert list(Permission.diff_many(pairs)) == [
+            ((Permission.R,), ()),
+            ((), (Permission.R,)),
+        ]
+
+    def test_diff_invalid(self) -> None:
+        with pytest.raises(ValueError):
+            Permission.diff(0, 0x10)
+
+        with pytest.raises(TypeError):
+            Permission.diff(Color.RED, Permission.R)
+
+
+class TestAliases:
+    def test_aliases(self) -> None:
+        class AliasPermission(Flag, aliases=True):
+            R = 4
+            W = 2
+            X = 1
+            RW = R | W
+
+        RWX = AliasPermission.R | AliasPermission.W | AliasPermission.X
+
+        assert repr(RWX) == "<AliasPermission.RW|X: 7>"
+        assert str(RWX) == "AliasPermission.RW|X"
+
+        assert RWX.title_name == "Rw, X"
+
+        assert AliasPermission.R | AliasPermission.W is AliasPermission.RW
+
+    def test_aliases_disabled(self) -> None:
+        class NoAliasPermission(Flag):
+            R = 4
+            W = 2
+            X = 1
+            RW = R | W
+
+        RWX = NoAliasPermission.R | NoAliasPermission.W | NoAliasPermission.X
+
+        assert repr(RWX) == "<NoAliasPermission.R|W|X: 7>"
+
+    def test_aliases_inherited(self) -> None:
+        class AliasFlag(Flag, aliases=True):
+            pass
+
+        Value = AliasFlag.create("Value", A=1, B=2, C=4, BC=6)
+
+        assert str(Value.A | Value.B | Value.C) == "Value.A|BC"
+
+    def test_aliases_update(self) -> None:
+        Value = Flag.create("Value", A=1, B=2, C=4, aliases=True)
+
+        ABC = Value.A | Value.B | Value.C
+
+        assert str(ABC) == "Value.A|B|C"
+
+        Value.update(AB=3)
+
+        assert str(ABC) == "Value.AB|C"
+
+
+def test_minimal_cover() -> None:
+    assert sorted(minimal_cover(7, (1, 2, 4, 3, 6))) in ([1, 6], [3, 4])
+
+    assert minimal_cover(7, (1, 2)) is None
+
+    assert minimal_cover(0, (1, 2)) == []
+
+    assert minimal_cover(7, (1, 2, 4, 3, 6), limit=1) is None
+
+
+def test_minimal_cover_wide_aliases() -> None:
+    bits = 60
+
+    members = {"B{}".format(index): 1 << index for index in range(bits)}
+
+    members.update(("P{}".format(index), 3 << index) for index in range(bits - 1))
+    members.update(("T{}".format(index), 7 << index) for index in range(bits - 2))
+
+    Wide = Flag.create("Wide", aliases=True, **members)
+
+    value = (1 << bits) - 1
+
+    names = str(Wide(value)).split(".", 1)[1].split("|")
+
+    assert len(names) < bits  # aliases are used even though the search is given up on
+
+    combined = 0
+
+    for name in names:
+        combined |= Wide[name].value
+
+    assert combined == value
+
+
+class TestValidate:
+    VALUES = [1, 0x10, 7, 0x21, -1, -0x10]
+
+    INVALID_INDEXES = [1, 3, 5]
+    INVALID_VALUES = [0x10, 0x21, -0x10]
+    INVALID_BITS = [0x10, 0x20, -0x10 & ~7]
+
+    def test_validate(self) -> None:
+        validation = Permission.validate(self.VALUES)
+
+        assert not validation.is_valid()
+
+        assert validation.indexes == self.INVALID_INDEXES
+        assert validation.values == self.INVALID_VALUES
+        assert validation.bits == self.INVALID_BITS
+
+    def test_validate_valid(self) -> None:
+        validation = Permission.validate(range(8))
+
+        assert validation.is_valid()
+
+        validation.raise_if_invalid()
+
+    def test_messages(self) -> None:
+        validation = Permission.validate(self.VALUES)
+
+        for value, message in zip(validation.values, validation.messages()):
+            with pytest.raises(ValueError) as info:
+                Permission(value)
+
+            assert str(info.value.__cause__) == message
+
+        with pytest.raises(ValueError) as info:
+            validation.raise_if_invalid()
+
+        assert str(info.value) == validation.messages()[0]
+
+    def test_validate_array(self) -> None:
+        numpy = pytest.importorskip("numpy")
+
+        validation = Permission.validate(numpy.array(self.VALUES))
+
+        assert validation.indexes == self.INVALID_INDEXES
+        assert validation.values == self.INVALID_VALUES
+        assert validation.bits == self.INVALID_BITS
+
+    def test_validate_narrow_array(self) -> None:
+        numpy = pytest.importorskip("numpy")
+
+        class Big(Flag, boundary=STRICT):
+            A = 1
+            B = 1 << 9
+
+        validation = Big.validate(numpy.array([1, 2, 3], dtype=numpy.uint8))
+
+        assert validation.indexes == [1, 2]
+        assert validation.values == [2, 3]
+        assert validation.bits == [2, 2]
@@ -0,0 +1,39 @@
+from subprocess import run
+from sys import executable
+
+import pytest
+
+import enum_extensions
+
+FLAGS_NOT_LOADED = """
+import sys
+
+from enum_extensions import Enum
+
+assert "enum_extensions.flags" not in sys.modules
+assert "enum_extensions.traits" not in sys.modules
+assert "threading" not in sys.modules
+
+from enum_extensions import Flag
+
+assert "enum_extensions.flags" in sys.modules
+"""
+
+
+def test_lazy_import() -> None:
+    run([executable, "-c", FLAGS_NOT_LOADED], check=True)
+
+
+def test_attributes() -> None:
+    for name in enum_extensions.__all__:
+        assert getattr(enum_extensions, name) is not None
+
+    assert set(enum_extensions.__all__) <= set(dir(enum_extensions))
+
+    assert callable(enum_extensions.unique)
+    assert callable(enum_extensions.auto)
+
+
+def test_missing_attribute() -> None:
+    with pytest.raises(AttributeError):
+        enum_extensions.missing  # type: ignore
@@ -0,0 +1,97 @@
+import pickle
+
+import pytest
+
+from enum_extensions.enums import Enum
+from enum_extensions.maps import EnumMap
+
+
+class State(Enum):
+    IDLE = 0
+    BUSY = 1
+    DONE = 2
+    FINISHED = 2  # alias
+
+
+class Other(Enum):
+    IDLE = 0
+
+
+IDLE = "idle"
+BUSY = "busy"
+DONE = "done"
+
+
+class TestEnumMap:
+    def test_access(self) -> None:
+        states = EnumMap(State, {State.DONE: DONE, State.IDLE: IDLE})
+
+        assert states[State.IDLE] == IDLE
+        assert states[State.FINISHED] == DONE
+
+        assert states.get(State.BUSY) is None
+        assert states.get(Other.IDLE, BUSY) == BUSY
+
+        with pytest.raises(KeyError):
+            states[State.BUSY]
+
+        with pytest.raises(KeyError):
+            states[Other.IDLE]  # type: ignore
+
+        assert State.IDLE in states
+        assert Other.IDLE not in states
+
+    def test_iteration_order(self) -> None:
+        states = EnumMap(State, [(State.DONE, DONE), (State.IDLE, IDLE), (State.BUSY, BUSY)])
+
+        assert list(states) == [State.IDLE, State.BUSY, State.DONE]
+        assert list(states.values()) == [IDLE, BUSY, DONE]
+
+        assert len(states) == 3
+
+    def test_mutation(self) -> None:
+        states = EnumMap(State, {State.IDLE: IDLE})
+
+        states[State.BUSY] = BUSY
+
+        del states[State.IDLE]
+
+        with pytest.raises(KeyError):
+            del states[State.IDLE]
+
+        assert states == {State.BUSY: BUSY}
+
+        assert states.pop(State.BUSY) == BUSY
+
+        assert not states
+
+        with pytest.raises(TypeError):
+            states[Other.IDLE] = IDLE  # type: ignore
+
+    def test_added_members(self) -> None:
+        class Growing(Enum):
+            A = 1
+
+        growing = EnumMap(Growing, {Growing.A: 1})
+
+        b = Growing.add_member("B", 2)
+
+        growing[b] = 2
+
+        assert dict(growing) == {Growing.A: 1, b: 2}
+
+    def test_equality(self) -> None:
+        states = EnumMap(State, {State.IDLE: IDLE})
+
+        assert states == states.copy()
+        assert states != EnumMap(State, {State.IDLE: BUSY})
+        assert states != EnumMap(State)
+
+    def test_repr(self) -> None:
+        assert repr(EnumMap(State)) == "EnumMap(State)"
+        assert repr(EnumMap(State, {State.IDLE: 0})) == "EnumMap(State, {<State.IDLE: 0>: 0})"
+
+    def test_pickle(self) -> None:
+        states = EnumMap(State, {State.IDLE: IDLE, State.DONE: DONE})
+
+        assert pickle.loads(pickle.dumps(states)) == states
@@ -0,0 +1,97 @@
+from typing import Set
+
+from enum_extensions.enums import EPHEMERAL, Enum, memory_reports
+from enum_extensions.flags import Flag
+from enum_extensions.memory import deep_size, iter_subclasses
+
+PSEUDO_MEMBERS = "pseudo_members"
+VALUE_MAPPING = "value_mapping"
+UNKNOWN_MEMBERS = "unknown_members"
+COVER_NAMES = "cover_names"
+
+
+class Color(Enum):
+    RED = 1
+    GREEN = 2
+    BLUE = 3
+    CRIMSON = 1  # alias
+
+
+class Permission(Flag):
+    R = 4
+    W = 2
+    X = 1
+
+
+class Status(Enum, unknown=EPHEMERAL):
+    OK = 0
+
+
+class Base(Enum):
+    pass
+
+
+class Derived(Base):
+    pass
+
+
+class TestMemory:
+    def test_deep_size(self) -> None:
+        seen: Set[int] = set()
+
+        item = ["shared"]
+
+        size = deep_size([item, item], seen)
+
+        assert size > deep_size([], set())
+        assert deep_size(item, seen) == 0  # already included
+
+    def test_iter_subclasses(self) -> None:
+        assert list(iter_subclasses(Base)) == [Base, Derived]
+
+    def test_memory_report(self) -> None:
+        report = Color.memory_report()
+
+        assert report.enum_type is Color
+        assert report.members == 3
+        assert report.aliases == 1
+        assert report.pseudo_members == 0
+
+        assert report.total == sum(report.sizes.values())
+
+    def test_pseudo_members(self) -> None:
+        before = Permission.memory_report()
+
+        Permission(7)
+        Permission(-1)  # same member, additional value mapping entry
+
+        after = Permission.memory_report()
+
+        assert COVER_NAMES in after.sizes
+
+        assert after.pseudo_members == before.pseudo_members + 1
+        assert after.sizes[PSEUDO_MEMBERS] > before.sizes[PSEUDO_MEMBERS]
+        assert after.sizes[VALUE_MAPPING] > before.sizes[VALUE_MAPPING]
+
+    def test_unknown_members(self) -> None:
+        before = Status.memory_report()
+
+        unknown = Status(13)
+
+        after = Status.memory_report()
+
+        assert unknown not in list(Status)  # only cached weakly
+
+        assert after.sizes[UNKNOWN_MEMBERS] > before.sizes[UNKNOWN_MEMBERS]
+
+    def test_memory_reports(self) -> None:
+        reports = memory_reports()
+
+        enum_types = [report.enum_type for report in reports]
+
+        assert Color in enum_types
+        assert Permission in enum_types
+
+        totals = [report.total for report in reports]
+
+        assert totals == sorted(totals, reverse=True)
@@ -0,0 +1,159 @@
+import pickle
+
+import pytest
+
+from enum_extensions.enums import Enum
+from enum_extensions.flags import Flag
+from enum_extensions.sets import EnumSet
+
+
+class Color(Enum):
+    RED = 1
+    GREEN = 2
+    BLUE = 3
+    CRIMSON = 1  # alias
+
+
+class Other(Enum):
+    RED = 1
+
+
+class Permission(Flag):
+    R = 4
+    W = 2
+    X = 1
+
+
+class Access(Enum):
+    X = 1
+    W = 2
+    R = 3
+
+
+class TestEnumSet:
+    def test_membership(self) -> None:
+        colors = EnumSet(Color, [Color.RED, Color.BLUE])
+
+        assert Color.RED in colors
+        assert Color.CRIMSON in colors
+        assert Color.GREEN not in colors
+        assert Other.RED not in colors
+        assert 1 not in colors
+
+        assert len(colors) == 2
+
+    def test_membership_added(self) -> None:
+        class Growing(Enum):
+            A = 1
+
+        members = EnumSet(Growing, [Growing.A])
+
+        assert Growing.A in members
+
+        members.add(Growing.add_member("B", 2))
+
+        assert Growing.B in members  # type: ignore
+
+    def test_iteration_order(self) -> None:
+        colors = EnumSet(Color, [Color.BLUE, Color.GREEN, Color.RED])
+
+        assert list(colors) == [Color.RED, Color.GREEN, Color.BLUE]
+
+    def test_mutation(self) -> None:
+        colors = EnumSet(Color)
+
+        assert not colors
+
+        colors.add(Color.GREEN)
+        colors.add(Color.BLUE)
+
+        colors.discard(Color.RED)
+        colors.remove(Color.GREEN)
+
+        with pytest.raises(KeyError):
+            colors.remove(Color.GREEN)
+
+        assert colors.pop() is Color.BLUE
+
+        with pytest.raises(KeyError):
+            colors.pop()
+
+    def test_errors(self) -> None:
+        with pytest.raises(TypeError):
+            EnumSet(Color, [Other.RED])  # type: ignore
+
+        with pytest.raises(ValueError):
+            EnumSet(Permission, [Permission.R | Permission.W])
+
+        with pytest.raises(ValueError):
+            EnumSet(Color) | EnumSet(Other)  # type: ignore
+
+        with pytest.raises(ValueError):
+            EnumSet.from_mask(Color, 0b1000)
+
+    def test_algebra(self) -> None:
+        warm = EnumSet(Color, [Color.RED, Color.GREEN])
+        cold = EnumSet(Color, [Color.GREEN, Color.BLUE])
+
+        assert warm | cold == EnumSet.all(Color)
+        assert warm & cold == {Color.GREEN}
+        assert warm - cold == {Color.RED}
+        assert warm ^ cold == {Color.RED, Color.BLUE}
+        assert ~warm == {Color.BLUE}
+
+        assert warm | {Color.BLUE} == EnumSet.all(Color)
+        assert {Color.RED, Color.BLUE} - warm == {Color.BLUE}
+
+        assert warm.issubset(EnumSet.all(Color))
+        assert warm < EnumSet.all(Color)
+        assert warm >= {Color.RED}
+        assert not warm.isdisjoint(cold)
+
+        warm -= cold
+
+        assert warm.mask == 0b1
+
+    def test_algebra_foreign(self) -> None:
+        colors = EnumSet(Color, [Color.RED, Color.GREEN])
+
+        foreign = {Color.RED, Other.RED, "red"}
+
+        assert colors & foreign == {Color.RED}
+        assert colors - foreign == {Color.GREEN}
+
+        assert colors.intersection(foreign) == {Color.RED}  # type: ignore
+        assert colors.difference(foreign) == {Color.GREEN}  # type: ignore
+
+        assert EnumSet(Color, [Color.RED]).issubset(foreign)  # type: ignore
+        assert not colors.issubset(foreign)  # type: ignore
+
+        assert not colors.issuperset([1])  # type: ignore
+        assert not colors.issuperset(foreign)  # type: ignore
+        assert colors.issuperset([Color.CRIMSON])
+
+        colors &= foreign
+
+        assert colors == {Color.RED}
+
+        colors -= foreign
+
+        assert not colors
+
+        with pytest.raises(TypeError):
+            colors | foreign
+
+    def test_flags(self) -> None:
+        access = EnumSet.from_flag(Access, Permission.R | Permission.X)
+
+        assert access == {Access.R, Access.X}
+
+        assert access.to_flag(Permission) is Permission.R | Permission.X
+
+    def test_repr(self) -> None:
+        assert repr(EnumSet(Color)) == "EnumSet(Color)"
+        assert repr(EnumSet(Color, [Color.RED])) == "EnumSet(Color, {<Color.RED: 1>})"
+
+    def test_pickle(self) -> None:
+        colors = EnumSet(Color, [Color.RED, Color.BLUE])
+
+        assert pickle.loads(pickle.dumps(colors)) == colors
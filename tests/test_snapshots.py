@@ -0,0 +1,156 @@
+from pathlib import Path
+from pickle import UnpicklingError
+from typing import Type
+
+import pytest
+
+from enum_extensions.enums import Enum, IntEnum
+from enum_extensions.flags import Flag
+from enum_extensions.snapshots import EnumSnapshot, cached_enum, fingerprint
+from enum_extensions.traits import Order
+
+FINGERPRINT = "fingerprint"
+OTHER_FINGERPRINT = "other"
+
+
+class Base(IntEnum):
+    def double(self) -> int:
+        return self.value * 2
+
+
+class Permission(Flag):
+    R = 4
+    W = 2
+    X = 1
+    RW = R | W
+
+
+class Size(Order, Enum):
+    """Sizes of things."""
+
+    SMALL = 1
+    LARGE = 2
+
+
+class Greeting(Enum):
+    HELLO = 1
+
+    def greet(self) -> str:
+        return self.name.title()
+
+
+def create_numbers() -> Type[Base]:
+    return Base.build("Numbers", [("ONE", 1), ("TWO", 2), ("FIRST", 1)])
+
+
+def fail() -> Type[Base]:
+    raise AssertionError
+
+
+def test_cached_enum(tmp_path: Path) -> None:
+    path = tmp_path / "numbers.snapshot"
+
+    created = cached_enum(path, FINGERPRINT, create_numbers)
+
+    restored = cached_enum(path, FINGERPRINT, fail)
+
+    assert restored is not created
+
+    assert [(member.name, member.value) for member in restored] == [("ONE", 1), ("TWO", 2)]
+
+    assert restored.FIRST is restored.ONE
+    assert restored.TWO.double() == 4
+
+    assert restored.__module__ == created.__module__
+    assert restored.__qualname__ == created.__qualname__
+
+    with pytest.raises(AssertionError):
+        cached_enum(path, OTHER_FINGERPRINT, fail)
+
+
+def test_cached_enum_lazy(tmp_path: Path) -> None:
+    path = tmp_path / "numbers.snapshot"
+
+    cached_enum(path, FINGERPRINT, create_numbers)
+
+    restored = cached_enum(path, FINGERPRINT, fail, lazy=True)
+
+    assert len(restored) == 2
+    assert restored(2) is restored.TWO
+
+
+def test_flag_snapshot(tmp_path: Path) -> None:
+    path = tmp_path / "permission.snapshot"
+
+    EnumSnapshot.from_enum(Permission, FINGERPRINT).save(path)
+
+    snapshot = EnumSnapshot.load(path)
+
+    assert snapshot.is_valid(FINGERPRINT)
+    assert not snapshot.is_valid(OTHER_FINGERPRINT)
+
+    restored = snapshot.restore()
+
+    assert list(restored) == [restored.R, restored.W, restored.X]
+
+    assert ~restored.X is restored.RW
+    assert restored(7) is restored.R | restored.W | restored.X
+
+
+def test_flag_snapshot_lazy() -> None:
+    restored = EnumSnapshot.from_enum(Permission, FINGERPRINT).restore(lazy=True)
+
+    assert not restored._lazy
+
+    assert restored.RW is restored.R | restored.W
+
+
+def test_trait_snapshot(tmp_path: Path) -> None:
+    path = tmp_path / "size.snapshot"
+
+    EnumSnapshot.from_enum(Size, FINGERPRINT).save(path)
+
+    restored = EnumSnapshot.load(path).restore()
+
+    assert restored.__mro__[1:] == Size.__mro__[1:]
+    assert restored.__doc__ == Size.__doc__
+
+    assert restored.SMALL < restored.LARGE
+
+
+def test_body_snapshot() -> None:
+    with pytest.raises(TypeError):
+        EnumSnapshot.from_enum(Greeting, FINGERPRINT)
+
+
+def test_compact_snapshot(tmp_path: Path) -> None:
+    path = tmp_path / "compact.snapshot"
+
+    EnumSnapshot.from_enum(Flag.create("Compact", "A B", compact=True), FINGERPRINT).save(path)
+
+    restored = EnumSnapshot.load(path).restore()
+
+    assert restored._compact
+    assert not hasattr(restored.A | restored.B, "__dict__")
+
+
+def test_load_invalid(tmp_path: Path) -> None:
+    path = tmp_path / "invalid.snapshot"
+
+    path.write_bytes(b"invalid")
+
+    with pytest.raises(UnpicklingError):
+        EnumSnapshot.load(path)
+
+    assert cached_enum(path, FINGERPRINT, create_numbers).TWO.value == 2
+
+
+def test_fingerprint(tmp_path: Path) -> None:
+    path = tmp_path / "source.txt"
+
+    data = b"ONE\nTWO\n"
+
+    path.write_bytes(data)
+
+    assert fingerprint(path) == fingerprint(data)
+    assert fingerprint(path, data) != fingerprint(path)
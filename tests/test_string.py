@@ -1,4 +1,4 @@
-from enum_extensions.string import case_fold_name, create_title
+from enum_extensions.string import case_fold_name, create_constant_name, create_title
 
 NAME = "NAME"
 NAME_CASE_FOLD = "name"
@@ -29,3 +29,11 @@ def test_create_title() -> None:
     assert create_title(SOME_NAME) == SOME_NAME_TITLE
     assert create_title(OTHER_NAME) == OTHER_NAME_TITLE
     assert create_title(TITLE_NAME) == TITLE_NAME_TITLE
+
+
+def test_create_constant_name() -> None:
+    assert create_constant_name("Color") == "COLOR"
+    assert create_constant_name("ColorFlag") == "COLOR_FLAG"
+    assert create_constant_name("HTTPStatus") == "HTTP_STATUS"
+    assert create_constant_name(SOME_NAME) == SOME_NAME
+    assert create_constant_name(OTHER_NAME) == "OTHER_NAME"
@@ -5,6 +5,8 @@ import pytest
 from enum_extensions.utils import (
     is_descriptor,
     is_double_under_name,
+    linearize,
+    lookup_attribute,
     make_namespace_unpicklable,
     make_type_unpicklable,
 )
@@ -73,3 +75,42 @@ def test_make_namespace_unpicklable() -> None:
 
     with pytest.raises(TypeError):
         pickle.dumps(instance)
+
+
+class A:
+    pass
+
+
+class B(A):
+    pass
+
+
+class C(A):
+    pass
+
+
+class D(B, C):
+    pass
+
+
+HIERARCHIES = ((), (A,), (B, C), (D, A), (int, D))
+
+
+def test_linearize() -> None:
+    for bases in HIERARCHIES:
+        mro = list(type("Linearized", bases, {}).__mro__)
+
+        assert linearize(bases) == mro[1:]
+
+
+def test_linearize_inconsistent() -> None:
+    with pytest.raises(TypeError):
+        linearize((A, B))
+
+
+def test_lookup_attribute() -> None:
+    mro = D.__mro__
+
+    assert lookup_attribute(mro, "__init__") is object.__init__
+
+    assert lookup_attribute(mro, "missing") is None